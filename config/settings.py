@@ -44,6 +44,18 @@ OPENAI_REALTIME_VOICE = os.getenv('OPENAI_REALTIME_VOICE', os.getenv('OPENAI_TTS
 # Keep TTS voice for other modules if they reference it
 OPENAI_TTS_VOICE = os.getenv('OPENAI_TTS_VOICE', OPENAI_REALTIME_VOICE)
 
+# Upstream client for realtime session minting (interviews.upstream).
+# OPENAI_API_BASE can point at a local stub server for load tests.
+OPENAI_API_BASE = os.getenv('OPENAI_API_BASE', 'https://api.openai.com/v1').rstrip('/')
+OPENAI_CONNECT_TIMEOUT = float(os.getenv('OPENAI_CONNECT_TIMEOUT', '3.05'))
+OPENAI_READ_TIMEOUT = float(os.getenv('OPENAI_READ_TIMEOUT', '15'))
+OPENAI_MAX_RETRIES = int(os.getenv('OPENAI_MAX_RETRIES', '2'))
+# Connections per sync client (one per process, shared by its worker threads)
+OPENAI_POOL_SIZE = int(os.getenv('OPENAI_POOL_SIZE', '20'))
+# Connections per async client (one per event loop): the most mints one ASGI worker can
+# have in flight; further mints wait for a free connection
+OPENAI_ASYNC_POOL_SIZE = int(os.getenv('OPENAI_ASYNC_POOL_SIZE', '500'))
+
 
 # SECURITY WARNING: don't run with debug turned on in production!
 def _get_bool(name: str, default: bool) -> bool:
@@ -65,6 +77,19 @@ def _get_list(name: str, default: list[str]) -> list[str]:
 
 ALLOWED_HOSTS = _get_list('ALLOWED_HOSTS', ['localhost', '127.0.0.1'])
 
+# Serve the live interview page's session/submit calls from the async views.
+# Enable when running under an ASGI server (config.asgi); keep off for WSGI workers.
+USE_ASYNC_VIEWS = _get_bool('USE_ASYNC_VIEWS', False)
+
+# Optional per-process pool of pre-minted realtime sessions (interviews.session_pool).
+# DEPTH sessions are kept warm per hot interview; entries with less than MIN_TTL seconds
+# left are discarded, and interviews idle for IDLE_TIMEOUT seconds stop being refilled.
+REALTIME_POOL_ENABLED = _get_bool('REALTIME_POOL_ENABLED', False)
+REALTIME_POOL_DEPTH = int(os.getenv('REALTIME_POOL_DEPTH', '2'))
+REALTIME_POOL_MIN_TTL = float(os.getenv('REALTIME_POOL_MIN_TTL', '20'))
+REALTIME_POOL_IDLE_TIMEOUT = float(os.getenv('REALTIME_POOL_IDLE_TIMEOUT', '300'))
+REALTIME_POOL_REFRESH_INTERVAL = float(os.getenv('REALTIME_POOL_REFRESH_INTERVAL', '5'))
+
 # Application definition
 
 INSTALLED_APPS = [
@@ -74,6 +99,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     # Third party apps
     'rest_framework',
     'corsheaders',
@@ -123,13 +149,59 @@ DATABASES = {
         'HOST': os.getenv('POSTGRES_HOST', '127.0.0.1'),
         'PORT': os.getenv('POSTGRES_PORT', '5432'),
         'CONN_MAX_AGE': int(os.getenv('POSTGRES_CONN_MAX_AGE', '60')),
-        'ATOMIC_REQUESTS': True,
+        # Transactions are scoped explicitly around write sections (transaction.atomic) so
+        # read-only pages and views waiting on external HTTP calls never hold one open.
+        'ATOMIC_REQUESTS': False,
         'OPTIONS': {
             # 'sslmode': os.getenv('POSTGRES_SSLMODE', 'prefer'),
         },
     }
 }
 
+# Cache
+# Local memory by default. Multi-worker deployments should point this at a shared backend
+# (e.g. DJANGO_CACHE_BACKEND=django.core.cache.backends.redis.RedisCache) so interview
+# version bumps are seen by every process; `check --deploy` warns otherwise (interviews.W001).
+CACHES = {
+    'default': {
+        'BACKEND': os.getenv(
+            'DJANGO_CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'
+        ),
+        'LOCATION': os.getenv('DJANGO_CACHE_LOCATION', ''),
+    }
+}
+# A process-local cache only sees its own version bumps, so entries keyed by version are
+# kept briefly there: other workers pick up an edit within a minute instead of a day
+_SHARED_CACHE = CACHES['default']['BACKEND'] != 'django.core.cache.backends.locmem.LocMemCache'
+
+# Compiled interview snapshots: per-process LRU size and TTL in both tiers (seconds)
+INTERVIEW_SNAPSHOT_LRU_SIZE = int(os.getenv('INTERVIEW_SNAPSHOT_LRU_SIZE', '256'))
+INTERVIEW_SNAPSHOT_TIMEOUT = int(
+    os.getenv('INTERVIEW_SNAPSHOT_TIMEOUT', '86400' if _SHARED_CACHE else '60')
+)
+# Interview list: cards per page, and lifetime of each cached card fragment (keyed by version)
+INTERVIEW_LIST_PAGE_SIZE = int(os.getenv('INTERVIEW_LIST_PAGE_SIZE', '24'))
+INTERVIEW_CARD_CACHE_TIMEOUT = int(
+    os.getenv('INTERVIEW_CARD_CACHE_TIMEOUT', '3600' if _SHARED_CACHE else '60')
+)
+# Browser cache lifetime (seconds) of public receipt pages, which never change
+RECEIPT_CACHE_MAX_AGE = int(os.getenv('RECEIPT_CACHE_MAX_AGE', '604800'))
+# Seconds a shared (edge) cache may serve an anonymous interview page before revalidating;
+# an edit shows up there within this window. Browsers always revalidate.
+INTERVIEW_PAGE_SHARED_MAX_AGE = int(os.getenv('INTERVIEW_PAGE_SHARED_MAX_AGE', '60'))
+# Responses page: rows per keyset page, and lifetime of the cached per-interview counter
+RESPONSES_PAGE_SIZE = int(os.getenv('RESPONSES_PAGE_SIZE', '25'))
+RESPONSE_COUNT_TIMEOUT = int(os.getenv('RESPONSE_COUNT_TIMEOUT', '600'))
+# Where submitted answers are written: "dual" (answers_transcript snapshot and Answer rows),
+# "json" (snapshot only) or "relational" (Answer rows only). Reads work in every mode.
+ANSWER_STORAGE = os.getenv('ANSWER_STORAGE', 'dual')
+# Responses fetched per server-side cursor round trip when streaming exports
+EXPORT_CHUNK_SIZE = int(os.getenv('EXPORT_CHUNK_SIZE', '2000'))
+# Hits per page of the responses full-text search
+SEARCH_PAGE_SIZE = int(os.getenv('SEARCH_PAGE_SIZE', '20'))
+# Minimum pg_trgm word similarity (0..1) for fuzzy candidate lookup; lower tolerates more typos
+CANDIDATE_SEARCH_THRESHOLD = float(os.getenv('CANDIDATE_SEARCH_THRESHOLD', '0.3'))
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -1,6 +1,29 @@
 from django.contrib import admin
 
-from .models import Answer, Candidate, Interview, InterviewResponse, Question, Section
+from .models import (
+    Answer,
+    AnswerTextVector,
+    Candidate,
+    Interview,
+    InterviewResponse,
+    InterviewVersion,
+    Question,
+    Section,
+)
+from .pagination import EstimatedCountPaginator
+from .search import build_search_query
+
+
+class LargeTableAdmin(admin.ModelAdmin):
+    """
+    Changelist defaults for tables that grow with every submission: no exact COUNT(*)
+    (estimated pagination, no "N total" link). Subclasses also set list_select_related and
+    raw_id_fields so rows and forms never load related objects one by one.
+    """
+
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    list_per_page = 50
 
 
 class SectionInline(admin.TabularInline):
@@ -14,12 +37,17 @@ class AnswerInline(admin.TabularInline):
     extra = 0
     readonly_fields = ('question', 'answer_text')
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('question__section__interview')
+
 
 @admin.register(Interview)
 class InterviewAdmin(admin.ModelAdmin):
     list_display = ('title', 'created_by', 'created_at', 'is_active')
     list_filter = ('is_active', 'created_at')
+    list_select_related = ('created_by',)
     search_fields = ('title', 'description')
+    raw_id_fields = ('created_by',)
     inlines = [SectionInline]
 
 
@@ -27,33 +55,70 @@ class InterviewAdmin(admin.ModelAdmin):
 class QuestionAdmin(admin.ModelAdmin):
     list_display = ('question_text', 'section', 'question_type', 'is_required', 'order')
     list_filter = ('question_type', 'is_required')
+    list_select_related = ('section__interview',)
     search_fields = ('question_text', 'section__interview__title')
+    raw_id_fields = ('section',)
+    # Maintained by Question.save() from `options`; stored answers reference these ids
+    readonly_fields = ('option_ids', 'retired_options')
+
+
+@admin.register(InterviewVersion)
+class InterviewVersionAdmin(admin.ModelAdmin):
+    list_display = ('interview', 'content_hash', 'created_at')
+    list_select_related = ('interview',)
+    raw_id_fields = ('interview',)
+    readonly_fields = ('interview', 'content_hash', 'structure', 'created_at')
+
+    def has_change_permission(self, request, obj=None):
+        # Published versions are immutable
+        return False
 
 
 @admin.register(InterviewResponse)
-class InterviewResponseAdmin(admin.ModelAdmin):
+class InterviewResponseAdmin(LargeTableAdmin):
     list_display = ('candidate', 'interview', 'submitted_at')
     list_filter = ('interview', 'submitted_at')
+    list_select_related = ('candidate', 'interview')
+    # Prefix match, backed by the expression indexes on Candidate
     search_fields = (
-        'candidate__full_name',
-        'candidate__email',
+        '^candidate__full_name',
+        '^candidate__email',
     )
+    raw_id_fields = ('interview', 'candidate', 'version')
     inlines = [AnswerInline]
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).defer('answers_transcript')
+
 
 @admin.register(Answer)
-class AnswerAdmin(admin.ModelAdmin):
+class AnswerAdmin(LargeTableAdmin):
     list_display = ('response', 'question', 'answer_text')
     list_filter = ('response__interview',)
-    search_fields = (
-        'answer_text',
-        'response__candidate__full_name',
-        'response__candidate__email',
+    list_select_related = (
+        'response__candidate',
+        'response__interview',
+        'question__section__interview',
     )
+    search_fields = ('answer_text',)
+    search_help_text = "Full-text search over answer text (quoted phrases, or, -exclude)."
+    raw_id_fields = ('response', 'question')
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).defer('response__answers_transcript')
+
+    def get_search_results(self, request, queryset, search_term):
+        # Use the GIN-indexed tsvector expression instead of icontains over the largest table
+        query = build_search_query(search_term)
+        if query is None:
+            return queryset, False
+        return queryset.alias(search_vector=AnswerTextVector()).filter(search_vector=query), False
 
 
 @admin.register(Candidate)
-class CandidateAdmin(admin.ModelAdmin):
+class CandidateAdmin(LargeTableAdmin):
     list_display = ('full_name', 'email', 'phone', 'location', 'created_at')
-    search_fields = ('full_name', 'email', 'phone', 'location')
+    # Prefix match, backed by expression indexes; an unindexed field here would turn the
+    # OR into a sequential scan
+    search_fields = ('^full_name', '^email')
     list_filter = ('created_at',)
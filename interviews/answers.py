@@ -0,0 +1,239 @@
+"""
+Where submitted answers are stored, and the one way to read them back.
+
+ANSWER_STORAGE picks the write path per deployment:
+
+- "dual" (default): the answers_transcript snapshot and relational Answer rows.
+- "json": the snapshot only. It is GIN-indexed for containment and full-text queries;
+  the reporting helpers below query it directly.
+- "relational": Answer rows only; the snapshot keeps just the transcript and source.
+
+load_answers() attaches the answers of a batch of responses as AnswerItem lists. It reads
+the source the current mode writes and falls back to the other one per response, so
+responses written under an earlier mode render the same way. Question texts and option
+labels come from the published version each response answered, so later edits (and
+deleted questions) do not change what a response shows; responses without a version, and
+option ids a version does not list, fall back to the cached current definitions.
+"""
+
+import json
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection
+from django.db.models import Q, QuerySet
+
+from .models import Answer, InterviewResponse
+from .snapshots import QuestionDef, get_interview_snapshot
+from .versions import PublishedVersion, answer_items, get_published_version
+
+ANSWER_STORAGE_MODES = ("dual", "json", "relational")
+
+
+@dataclass(frozen=True)
+class AnswerItem:
+    question_id: Optional[int]
+    question_text: str
+    text: str = ""
+    option_values: List[str] = field(default_factory=list)
+
+
+def storage_mode() -> str:
+    mode = getattr(settings, "ANSWER_STORAGE", "dual")
+    if mode not in ANSWER_STORAGE_MODES:
+        raise ImproperlyConfigured(
+            f"ANSWER_STORAGE must be one of {', '.join(ANSWER_STORAGE_MODES)}, not {mode!r}"
+        )
+    return mode
+
+
+def writes_snapshot_answers() -> bool:
+    return storage_mode() != "relational"
+
+
+def writes_answer_rows() -> bool:
+    return storage_mode() != "json"
+
+
+QuestionDefs = Dict[int, QuestionDef]
+
+
+@dataclass(frozen=True)
+class _Context:
+    """What one response's answers are read against."""
+
+    version: Optional[PublishedVersion]
+    # Current definitions: the fallback for responses without a version and for option ids
+    # the version does not list (versions frozen before option ids, retired labels)
+    questions: QuestionDefs
+
+    def question_text(self, question_id: Optional[int], current: str = "") -> str:
+        if self.version is not None and question_id in self.version.questions_by_id:
+            return self.version.question_text(question_id)
+        return current
+
+    def decode(self, question_id: Optional[int], option_ids) -> List[str]:
+        question = self.questions.get(question_id)
+        labels = dict(question.option_labels) if question else {}
+        if self.version is not None:
+            labels.update(self.version.option_labels(question_id))
+        return [labels[i] for i in option_ids or [] if i in labels]
+
+
+def _row_items(contexts: Dict[int, _Context]) -> Dict[int, List[AnswerItem]]:
+    """
+    AnswerItems from Answer rows, grouped by response (one query). `contexts` maps each
+    response id to read to its published version and its interview's question definitions.
+    """
+    items: Dict[int, List[AnswerItem]] = {}
+    rows = (
+        Answer.objects.filter(response_id__in=list(contexts))
+        .select_related("question")
+        .only(
+            "id",
+            "response_id",
+            "answer_text",
+            "selected_option_ids",
+            "question__id",
+            "question__question_text",
+        )
+        .order_by("id")
+    )
+    for a in rows:
+        context = contexts[a.response_id]
+        items.setdefault(a.response_id, []).append(
+            AnswerItem(
+                question_id=a.question_id,
+                question_text=context.question_text(a.question_id, a.question.question_text),
+                text=a.answer_text,
+                option_values=context.decode(a.question_id, a.selected_option_ids),
+            )
+        )
+    return items
+
+
+def _load_snapshots(responses: List[InterviewResponse]) -> None:
+    """Fetch answers_transcript for responses that were loaded with it deferred."""
+    deferred = [r for r in responses if "answers_transcript" in r.get_deferred_fields()]
+    if deferred:
+        snapshots = dict(
+            InterviewResponse.objects.filter(pk__in=[r.pk for r in deferred]).values_list(
+                "pk", "answers_transcript"
+            )
+        )
+        for r in deferred:
+            r.answers_transcript = snapshots.get(r.pk) or {}
+
+
+def _snapshot_items(response: InterviewResponse, context: _Context) -> List[AnswerItem]:
+    items = answer_items((response.answers_transcript or {}).get("answers"), context.version)
+    result = []
+    for item in items:
+        try:
+            qid = int(item.get("question"))
+        except (TypeError, ValueError):
+            qid = None
+        if "option_ids" in item:
+            option_values = context.decode(qid, item["option_ids"])
+        else:  # written before option ids
+            option_values = [str(v) for v in item.get("option_values") or []]
+        current = context.questions.get(qid)
+        result.append(
+            AnswerItem(
+                question_id=qid,
+                # Neither a version nor a stored copy: fall back to the current wording
+                question_text=item.get("question_text")
+                or (current.question_text if current else ""),
+                text=item.get("text") or "",
+                option_values=option_values,
+            )
+        )
+    return result
+
+
+def load_answers(responses: Iterable[InterviewResponse]) -> List[InterviewResponse]:
+    """
+    Set `answer_items` on each response and return them as a list. Costs one query for
+    the current mode's source, plus one for responses that have to fall back to the other.
+    """
+    responses = list(responses)
+    if not responses:
+        return responses
+    by_interview: Dict[int, QuestionDefs] = {}
+    for interview_id in {r.interview_id for r in responses}:
+        snapshot = get_interview_snapshot(interview_id)
+        by_interview[interview_id] = snapshot.questions_by_id if snapshot else {}
+    contexts = {
+        r.pk: _Context(get_published_version(r.version_id), by_interview[r.interview_id])
+        for r in responses
+    }
+    if storage_mode() == "json":
+        _load_snapshots(responses)
+        legacy = [r.pk for r in responses if "answers" not in (r.answers_transcript or {})]
+        rows = _row_items({pk: contexts[pk] for pk in legacy}) if legacy else {}
+    else:
+        rows = _row_items(contexts)
+        _load_snapshots([r for r in responses if r.pk not in rows])
+    for r in responses:
+        r.answer_items = rows[r.pk] if r.pk in rows else _snapshot_items(r, contexts[r.pk])
+    return responses
+
+
+def response_answers(response: InterviewResponse) -> List[AnswerItem]:
+    """The answers of one response (see load_answers)."""
+    return load_answers([response])[0].answer_items
+
+
+# --- Reporting over the JSON snapshot -------------------------------------------------
+# These use the jsonb_path_ops GIN index on answers_transcript, so they stay cheap in
+# "json" mode. They only see responses whose snapshot carries answers ("json" or "dual").
+
+
+def snapshot_answer_filter(question_id: int, option_id: Optional[int] = None) -> Q:
+    """Responses whose snapshot answers `question_id` (with `option_id` selected, if given)."""
+    item = {"question": int(question_id)}
+    if option_id is not None:
+        item["option_ids"] = [int(option_id)]
+    return Q(answers_transcript__contains={"answers": [item]})
+
+
+def responses_answering(
+    interview_id: int, question_id: int, option_id: Optional[int] = None
+) -> QuerySet:
+    return InterviewResponse.objects.filter(
+        snapshot_answer_filter(question_id, option_id), interview_id=interview_id
+    )
+
+
+def snapshot_option_counts(interview_id: int, question_id: int) -> Dict[int, int]:
+    """Number of responses selecting each option id of a question (one indexed query)."""
+    sql = f"""
+        SELECT opt::smallint, COUNT(DISTINCT r.id)
+        FROM {InterviewResponse._meta.db_table} r
+        CROSS JOIN LATERAL jsonb_array_elements(r.answers_transcript -> 'answers') item
+        CROSS JOIN LATERAL jsonb_array_elements_text(item -> 'option_ids') opt
+        WHERE r.interview_id = %s
+          AND r.answers_transcript @> %s::jsonb
+          AND item -> 'question' = to_jsonb(%s::bigint)
+        GROUP BY 1
+    """
+    contains = json.dumps({"answers": [{"question": int(question_id)}]})
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [interview_id, contains, question_id])
+        return dict(cursor.fetchall())
+
+
+__all__ = [
+    "ANSWER_STORAGE_MODES",
+    "AnswerItem",
+    "load_answers",
+    "response_answers",
+    "responses_answering",
+    "snapshot_answer_filter",
+    "snapshot_option_counts",
+    "storage_mode",
+    "writes_answer_rows",
+    "writes_snapshot_answers",
+]
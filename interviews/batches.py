@@ -0,0 +1,131 @@
+"""
+Plumbing for management commands that walk large tables: primary-key ranges, a checkpoint
+file of finished ranges, and a process pool that works through them.
+
+A job is split into fixed-size, half-open id ranges [start, end) aligned to multiples of
+the range size, so the same ids always fall in the same range however the table's bounds
+move between runs. Splitting needs only MIN/MAX, not a count. Each range is handled by a
+top-level `work(start, end, **kwargs)` function that returns a dict of counters. The
+parent records each finished range in the checkpoint, so an interrupted run resumes where
+it stopped. A range that was cut off midway is redone in full, so range work must be
+idempotent.
+"""
+
+import json
+import multiprocessing
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from django.db import connections
+from django.db.models import Max, Min, QuerySet
+
+IdRange = Tuple[int, int]
+
+
+def id_ranges(queryset: QuerySet, range_size: int) -> List[IdRange]:
+    """
+    Cover the primary keys of `queryset` with [start, end) ranges of `range_size` ids, on
+    boundaries that are multiples of `range_size`.
+    """
+    bounds = queryset.aggregate(low=Min("pk"), high=Max("pk"))
+    low, high = bounds["low"], bounds["high"]
+    if low is None:
+        return []
+    first = low - low % range_size
+    return [(start, start + range_size) for start in range(first, high + 1, range_size)]
+
+
+class Checkpoint:
+    """
+    Finished ranges of one job, kept in a JSON file. `job` describes the run (command and
+    options); a file written for a different job is ignored and replaced.
+    """
+
+    def __init__(self, path: str, job: Dict):
+        self.path = path
+        self.job = job
+        self.done = set()
+        try:
+            with open(path) as fh:
+                state = json.load(fh)
+        except FileNotFoundError:
+            return
+        except ValueError:
+            # A torn or foreign file: start over rather than trust it
+            return
+        if state.get("job") == job:
+            self.done = {tuple(r) for r in state.get("done", [])}
+
+    def __contains__(self, id_range: IdRange) -> bool:
+        return tuple(id_range) in self.done
+
+    def mark(self, id_range: IdRange) -> None:
+        self.done.add(tuple(id_range))
+        self._save()
+
+    def discard(self, id_range: IdRange) -> None:
+        """Forget a range so the next run redoes it."""
+        self.done.discard(tuple(id_range))
+        self._save()
+
+    def _save(self) -> None:
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w") as fh:
+            json.dump({"job": self.job, "done": sorted(self.done)}, fh)
+        os.replace(tmp, self.path)
+
+    def clear(self) -> None:
+        self.done = set()
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+def run_ranges(
+    work: Callable[..., Dict[str, int]],
+    ranges: List[IdRange],
+    *,
+    workers: int = 1,
+    checkpoint: Optional[Checkpoint] = None,
+    **kwargs,
+) -> Iterator[Tuple[IdRange, Counter]]:
+    """
+    Run `work(start, end, **kwargs)` over every range not already in `checkpoint`. With
+    `workers` > 1 the ranges are spread over a process pool. Yields (range, counters) as
+    each range finishes, in completion order, after recording it in the checkpoint.
+    """
+    pending = [r for r in ranges if checkpoint is None or r not in checkpoint]
+
+    def finished(id_range, counts):
+        if checkpoint is not None:
+            checkpoint.mark(id_range)
+        return id_range, Counter(counts)
+
+    if workers <= 1:
+        for start, end in pending:
+            yield finished((start, end), work(start, end, **kwargs))
+        return
+
+    # Forked workers must not share the parent's database sockets; each opens its own.
+    connections.close_all()
+    context = multiprocessing.get_context("fork")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        futures = {pool.submit(work, start, end, **kwargs): (start, end) for start, end in pending}
+        try:
+            for future in as_completed(futures):
+                yield finished(futures[future], future.result())
+        except BaseException:
+            # A failed range or Ctrl-C: drop queued ranges; the checkpoint has the rest
+            pool.shutdown(wait=False, cancel_futures=True)
+            raise
+
+
+__all__ = [
+    "Checkpoint",
+    "IdRange",
+    "id_ranges",
+    "run_ranges",
+]
@@ -0,0 +1,485 @@
+"""
+Batched edit operations for the interview builder.
+
+The editor queues its changes and posts them as one ordered list of operations.
+`apply_operations` locks the interview row, loads its sections and questions once, replays
+the operations against those rows in memory, then writes the net result with bulk_create,
+bulk_update (grouped by the fields each row changed) and one delete per model, all in a
+single transaction. Rows added earlier in a
+batch can be referenced by later operations through the `ref` they were added with.
+Positions use the gap-based keys from `ordering`, so a move or insert writes one row.
+"""
+
+from typing import Any, Dict, List, Optional, Union
+
+from django.db import transaction
+from django.db.models import Prefetch
+from django.utils import timezone
+
+from .cache import bump_interview_version
+from .models import Interview, Question, Section
+from .ordering import append_key, insert_at, respace, sort_key
+
+OPERATIONS = (
+    "update_interview",
+    "add_section",
+    "update_section",
+    "delete_section",
+    "add_question",
+    "update_question",
+    "delete_question",
+    "move_question",
+    "reorder_sections",
+    "reorder_questions",
+    "add_option",
+    "update_option",
+    "delete_option",
+)
+MAX_OPERATIONS = 500
+
+_QUESTION_TYPES = {value for value, _ in Question.QUESTION_TYPES}
+_EMPTY = (None, "", "null")
+
+
+class BuilderError(Exception):
+    """An operation that cannot be applied; the whole batch is rolled back."""
+
+    def __init__(self, message: str, status: int = 400, index: Optional[int] = None):
+        super().__init__(message)
+        self.status = status
+        self.index = index
+
+
+class _Batch:
+    def __init__(self, interview: Interview):
+        self.interview = interview
+        self.sections = {
+            s.pk: s for s in Section.objects.filter(interview=interview).order_by("order", "id")
+        }
+        self.questions = {q.pk: q for q in Question.objects.filter(section__interview=interview)}
+        # Where each question lives, tracked here so unsaved sections can be targets
+        self.placement = {id(q): self.sections.get(q.section_id) for q in self.questions.values()}
+        self.refs: Dict[str, Union[Section, Question]] = {}
+        self.new_sections: List[Section] = []
+        self.new_questions: List[Question] = []
+        self.dirty_sections: Dict[int, set] = {}
+        self.dirty_questions: Dict[int, set] = {}
+        self.deleted_sections: set = set()
+        self.deleted_questions: set = set()
+        self.interview_fields: set = set()
+
+    # Lookups -------------------------------------------------------------------------
+
+    def _lookup(self, model, value, saved: dict, deleted: set):
+        if isinstance(value, str) and isinstance(self.refs.get(value), model):
+            return self.refs[value]
+        try:
+            pk = int(value)
+        except (TypeError, ValueError):
+            pk = None
+        if pk is None or pk not in saved or pk in deleted:
+            raise BuilderError(f"{model.__name__} not found", status=404)
+        return saved[pk]
+
+    def section(self, value) -> Section:
+        return self._lookup(Section, value, self.sections, self.deleted_sections)
+
+    def question(self, value) -> Question:
+        return self._lookup(Question, value, self.questions, self.deleted_questions)
+
+    def live_sections(self) -> List[Section]:
+        live = [s for pk, s in self.sections.items() if pk not in self.deleted_sections]
+        live += self.new_sections
+        return sorted(live, key=sort_key)
+
+    def siblings(self, section: Optional[Section], exclude: Optional[Question] = None) -> List:
+        """Live questions of `section` in display order."""
+        rows = [
+            q
+            for q in list(self.questions.values()) + self.new_questions
+            if self.placement.get(id(q)) is section
+            and q is not exclude
+            and q.pk not in self.deleted_questions
+        ]
+        return sorted(rows, key=sort_key)
+
+    # Change tracking ------------------------------------------------------------------
+
+    def touch_section(self, section: Section, *fields: str) -> None:
+        if section.pk is not None:
+            self.dirty_sections.setdefault(section.pk, set()).update(fields)
+
+    def touch_question(self, question: Question, *fields: str) -> None:
+        if question.pk is not None:
+            self.dirty_questions.setdefault(question.pk, set()).update(fields)
+
+    def place(self, question: Question, section: Optional[Section]) -> None:
+        self.placement[id(question)] = section
+        self.touch_question(question, "section")
+
+    def move_question(
+        self, question: Question, section: Optional[Section], index: Optional[int] = None
+    ) -> None:
+        """Put `question` at `index` in `section` (at the end when index is None)."""
+        siblings = self.siblings(section, exclude=question)
+        if index is None:
+            question.order = append_key(siblings)
+            changed = [question]
+        else:
+            changed = insert_at(siblings, question, index)
+        for row in changed:
+            self.touch_question(row, "order")
+        if self.placement.get(id(question)) is not section:
+            self.place(question, section)
+
+    def move_section(self, section: Section, index: int) -> None:
+        siblings = [s for s in self.live_sections() if s is not section]
+        for row in insert_at(siblings, section, index):
+            self.touch_section(row, "order")
+
+    def remember(self, op: Dict[str, Any], obj) -> None:
+        ref = op.get("ref")
+        if ref is not None:
+            self.refs[str(ref)] = obj
+
+    def new_section(self, title: str, description: str = "") -> Section:
+        section = Section(
+            interview=self.interview,
+            title=title,
+            description=description,
+            order=append_key(self.live_sections()),
+        )
+        self.new_sections.append(section)
+        return section
+
+    def first_or_new_section(self, exclude: Optional[Section] = None) -> Section:
+        for section in self.live_sections():
+            if section is not exclude:
+                return section
+        return self.new_section("Section 1")
+
+    # Writes ---------------------------------------------------------------------------
+
+    def save(self) -> bool:
+        changed = bool(self.interview_fields)
+        if self.new_sections:
+            Section.objects.bulk_create(self.new_sections)
+            changed = True
+        all_questions = list(self.questions.values()) + self.new_questions
+        for q in all_questions:
+            target = self.placement.get(id(q))
+            if (target.pk if target else None) != q.section_id:
+                q.section = target
+        if self.new_questions:
+            Question.objects.bulk_create(self.new_questions)
+            changed = True
+        for model, saved, dirty, deleted in (
+            (Section, self.sections, self.dirty_sections, self.deleted_sections),
+            (Question, self.questions, self.dirty_questions, self.deleted_questions),
+        ):
+            # Each row writes only the fields its operations touched, so values loaded at
+            # the start of the batch never overwrite other columns
+            groups: Dict[tuple, List] = {}
+            for pk, fields in dirty.items():
+                if pk not in deleted:
+                    groups.setdefault(tuple(sorted(fields)), []).append(saved[pk])
+            for fields, rows in groups.items():
+                model.objects.bulk_update(rows, list(fields))
+                changed = True
+        if self.deleted_questions:
+            Question.objects.filter(pk__in=self.deleted_questions).delete()
+            changed = True
+        if self.deleted_sections:
+            Section.objects.filter(pk__in=self.deleted_sections).delete()
+            changed = True
+        if changed:
+            # Bulk writes send no post_save, so stamp the interview and rotate its version once
+            self.interview.updated_at = timezone.now()
+            fields = {f: getattr(self.interview, f) for f in self.interview_fields}
+            Interview.objects.filter(pk=self.interview.pk).update(
+                updated_at=self.interview.updated_at, **fields
+            )
+            interview_id = self.interview.pk
+            transaction.on_commit(lambda: bump_interview_version(interview_id))
+        return changed
+
+
+def _text(op: Dict[str, Any], key: str, default: str = "") -> str:
+    value = op.get(key)
+    return default if value is None else str(value)
+
+
+def _option_index(op: Dict[str, Any], question: Question) -> int:
+    try:
+        idx = int(op.get("option_index"))
+    except (TypeError, ValueError):
+        raise BuilderError("Invalid option index")
+    if not 0 <= idx < len(question.options or []):
+        raise BuilderError("Index out of range")
+    return idx
+
+
+def _index(op: Dict[str, Any]) -> Optional[int]:
+    """Optional target position of an add or move (0 = first)."""
+    value = op.get("index")
+    if value is None:
+        return None
+    if not isinstance(value, int) or isinstance(value, bool):
+        raise BuilderError("Invalid index")
+    return value
+
+
+def _id_list(op: Dict[str, Any], key: str) -> list:
+    value = op.get(key)
+    if not isinstance(value, list):
+        raise BuilderError(f"{key} must be a list")
+    return value
+
+
+def _unique(rows) -> list:
+    seen = set()
+    return [row for row in rows if not (id(row) in seen or seen.add(id(row)))]
+
+
+def _apply(batch: _Batch, op: Dict[str, Any]) -> Dict[str, Any]:
+    action = op.get("action")
+    interview = batch.interview
+
+    if action == "update_interview":
+        if "title" in op:
+            title = _text(op, "title").strip()
+            if not title:
+                raise BuilderError("Interview title is required")
+            interview.title = title
+            batch.interview_fields.add("title")
+        if "description" in op:
+            interview.description = _text(op, "description").strip()
+            batch.interview_fields.add("description")
+        return {}
+
+    if action == "add_section":
+        title = _text(op, "title").strip() or "Untitled Section"
+        index = _index(op)
+        section = batch.new_section(title, _text(op, "description").strip())
+        if index is not None:
+            batch.move_section(section, index)
+        batch.remember(op, section)
+        return {"section_id": section}
+
+    if action == "update_section":
+        section = batch.section(op.get("section_id"))
+        if "title" in op:
+            section.title = _text(op, "title").strip() or section.title
+            batch.touch_section(section, "title")
+        if "description" in op:
+            section.description = _text(op, "description").strip()
+            batch.touch_section(section, "description")
+        if _index(op) is not None:
+            batch.move_section(section, op["index"])
+        elif isinstance(op.get("order"), int):
+            # Raw key, kept for older clients; prefer "index"
+            section.order = op["order"]
+            batch.touch_section(section, "order")
+        return {}
+
+    if action == "delete_section":
+        section = batch.section(op.get("section_id"))
+        # Questions move to the first remaining section (never left unsectioned)
+        fallback = batch.first_or_new_section(exclude=section)
+        for q in batch.siblings(section):
+            batch.move_question(q, fallback)
+        if section.pk is None:
+            batch.new_sections.remove(section)
+        else:
+            batch.deleted_sections.add(section.pk)
+        return {"fallback_section_id": fallback}
+
+    if action == "add_question":
+        sid = op.get("section_id")
+        try:
+            section = batch.section(sid) if sid not in _EMPTY else None
+        except BuilderError:
+            section = None
+        if section is None:
+            live = batch.live_sections()
+            section = live[0] if live else None
+        question_type = _text(op, "question_type", "text")
+        if question_type not in _QUESTION_TYPES:
+            raise BuilderError("Invalid question type")
+        index = _index(op)
+        question = Question(
+            question_text=_text(op, "question_text", "Untitled Question"),
+            question_type=question_type,
+            is_required=bool(op.get("is_required", True)),
+        )
+        batch.new_questions.append(question)
+        batch.move_question(question, section, index)
+        batch.remember(op, question)
+        return {"question_id": question}
+
+    if action == "update_question":
+        question = batch.question(op.get("question_id"))
+        if "question_text" in op:
+            question.question_text = _text(op, "question_text")
+        if "question_type" in op:
+            if op["question_type"] not in _QUESTION_TYPES:
+                raise BuilderError("Invalid question type")
+            question.question_type = op["question_type"]
+        if "is_required" in op:
+            question.is_required = bool(op["is_required"])
+        # Only the fields the operation carries are written back
+        batch.touch_question(
+            question, *(f for f in ("question_text", "question_type", "is_required") if f in op)
+        )
+        return {}
+
+    if action == "delete_question":
+        question = batch.question(op.get("question_id"))
+        if question.pk is None:
+            batch.new_questions.remove(question)
+        else:
+            batch.deleted_questions.add(question.pk)
+        return {}
+
+    if action == "move_question":
+        question = batch.question(op.get("question_id"))
+        sid = op.get("section_id")
+        if sid in _EMPTY:
+            # Keep the current section, or fall back to the first one (no unsectioned state)
+            section = batch.placement.get(id(question)) or batch.first_or_new_section()
+        else:
+            section = batch.section(sid)
+        index = _index(op)
+        if index is not None or batch.placement.get(id(question)) is not section:
+            batch.move_question(question, section, index)
+        if index is None and isinstance(op.get("order"), int):
+            # Raw key, kept for older clients; prefer "index"
+            question.order = op["order"]
+            batch.touch_question(question, "order")
+        return {}
+
+    if action == "reorder_sections":
+        # Listed sections first, in the given order, then the rest in their current order
+        listed = _unique(batch.section(sid) for sid in _id_list(op, "section_ids"))
+        seen = {id(s) for s in listed}
+        rest = [s for s in batch.live_sections() if id(s) not in seen]
+        for row in respace(listed + rest):
+            batch.touch_section(row, "order")
+        return {}
+
+    if action == "reorder_questions":
+        # Listed questions go into the section in the given order, ahead of its other questions
+        section = batch.section(op.get("section_id"))
+        listed = _unique(batch.question(qid) for qid in _id_list(op, "question_ids"))
+        seen = {id(q) for q in listed}
+        rest = [q for q in batch.siblings(section) if id(q) not in seen]
+        for q in listed:
+            if batch.placement.get(id(q)) is not section:
+                batch.place(q, section)
+        for row in respace(listed + rest):
+            batch.touch_question(row, "order")
+        return {}
+
+    if action in ("add_option", "update_option", "delete_option"):
+        # Options keep their id through renames; removed ones retire (see Question.option_ids)
+        question = batch.question(op.get("question_id"))
+        result = {}
+        if action == "add_option":
+            option_id = question.add_option(_text(op, "option_text", "Option"))
+            result = {"option_index": len(question.options) - 1, "option_id": option_id}
+        elif action == "update_option":
+            idx = _option_index(op, question)
+            if "option_text" in op:
+                opts = list(question.options)
+                opts[idx] = _text(op, "option_text")
+                question.options = opts
+        else:
+            question.remove_option(_option_index(op, question))
+        batch.touch_question(question, "options", "option_ids", "retired_options")
+        return result
+
+    raise BuilderError(f"Unknown action: {action!r}")
+
+
+@transaction.atomic
+def apply_operations(interview: Interview, operations: List[Dict[str, Any]]) -> List[Dict]:
+    """
+    Apply builder operations in order and persist the outcome in one transaction.
+
+    Returns one result dict per operation (new `section_id` / `question_id`, `option_index`,
+    `fallback_section_id`, echoing `ref` when given). Raises BuilderError, carrying the index
+    of the failing operation, without writing anything.
+    """
+    if len(operations) > MAX_OPERATIONS:
+        raise BuilderError(f"At most {MAX_OPERATIONS} operations per batch")
+    # Batches of one interview run one at a time: each replays against rows no other batch
+    # is about to overwrite
+    interview = Interview.objects.select_for_update().get(pk=interview.pk)
+    batch = _Batch(interview)
+    results = []
+    for index, op in enumerate(operations):
+        if not isinstance(op, dict):
+            raise BuilderError("Each operation must be an object", index=index)
+        try:
+            result = _apply(batch, op)
+        except BuilderError as exc:
+            exc.index = index
+            raise
+        if op.get("ref") is not None:
+            result["ref"] = op["ref"]
+        results.append(result)
+    batch.save()
+    # Created rows only have primary keys now
+    return [
+        {key: getattr(value, "pk", value) for key, value in result.items()} for result in results
+    ]
+
+
+def _question_node(q: Question) -> Dict[str, Any]:
+    return {
+        "id": q.id,
+        "section_id": q.section_id,
+        "text": q.question_text,
+        "type": q.question_type,
+        "required": q.is_required,
+        "order": q.order,
+        "options": list(q.options or []),
+    }
+
+
+def builder_tree(interview: Interview) -> Dict[str, Any]:
+    """
+    The editor's section -> questions tree in display order, loaded in two queries
+    (sections, then all their questions through a to_attr Prefetch).
+    """
+    sections = interview.sections.order_by("order", "id").prefetch_related(
+        Prefetch(
+            "questions",
+            queryset=Question.objects.order_by("order", "id"),
+            to_attr="ordered_questions",
+        )
+    )
+    return {
+        "id": interview.id,
+        "title": interview.title,
+        "description": interview.description,
+        "sections": [
+            {
+                "id": s.id,
+                "title": s.title,
+                "description": s.description,
+                "order": s.order,
+                "questions": [_question_node(q) for q in s.ordered_questions],
+            }
+            for s in sections
+        ],
+    }
+
+
+__all__ = [
+    "BuilderError",
+    "MAX_OPERATIONS",
+    "OPERATIONS",
+    "apply_operations",
+    "builder_tree",
+]
@@ -0,0 +1,174 @@
+"""
+Two-tier caching helpers: a per-process LRU in front of the Django cache framework.
+
+Entries derived from an interview's structure are keyed by that interview's version token.
+Bumping the token (on any edit) makes every derived entry unreachable, so nothing has to be
+deleted explicitly; stale entries simply age out of both tiers.
+"""
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+
+
+def _version_key(interview_id: int) -> str:
+    return f"interviews:version:{interview_id}"
+
+
+def get_interview_version(interview_id: int) -> str:
+    """
+    Return the current version token of an interview (no database access).
+    A random token is minted when the shared cache has none, so evictions can never
+    resurrect an older token.
+    """
+    key = _version_key(interview_id)
+    token = cache.get(key)
+    if token is None:
+        cache.add(key, uuid.uuid4().hex[:12], timeout=None)
+        token = cache.get(key) or uuid.uuid4().hex[:12]
+    return token
+
+
+def get_interview_versions(interview_ids: Iterable[int]) -> Dict[int, str]:
+    """
+    Batch form of get_interview_version: one cache round-trip for a whole page of
+    interviews, minting tokens only for the ones the cache does not know yet.
+    """
+    ids = list(interview_ids)
+    found = cache.get_many([_version_key(i) for i in ids])
+    versions = {}
+    for interview_id in ids:
+        token = found.get(_version_key(interview_id))
+        versions[interview_id] = token if token is not None else get_interview_version(interview_id)
+    return versions
+
+
+def bump_interview_version(interview_id: int) -> str:
+    """
+    Invalidate everything cached for an interview by rotating its version token.
+    """
+    token = uuid.uuid4().hex[:12]
+    cache.set(_version_key(interview_id), token, timeout=None)
+    return token
+
+
+def _response_count_key(interview_id: int) -> str:
+    return f"interviews:response_count:{interview_id}"
+
+
+def get_response_count(interview_id: int, count: Callable[[], int]) -> int:
+    """
+    Return the cached number of responses for an interview, calling `count()` (an exact
+    COUNT query) only when the counter is missing. The counter is adjusted in place by
+    adjust_response_count and expires after RESPONSE_COUNT_TIMEOUT to bound any drift.
+    """
+    key = _response_count_key(interview_id)
+    value = cache.get(key)
+    if value is None:
+        value = count()
+        cache.add(key, value, timeout=getattr(settings, "RESPONSE_COUNT_TIMEOUT", 600))
+    return value
+
+
+def get_response_counts(
+    interview_ids: Iterable[int], count_many: Callable[[List[int]], Dict[int, int]]
+) -> Dict[int, int]:
+    """
+    Batch form of get_response_count: one cache round-trip for a page of interviews, and
+    one `count_many(missing_ids)` call (interview id -> exact count; absent ids count as 0)
+    for the counters the cache does not hold.
+    """
+    ids = list(interview_ids)
+    found = cache.get_many([_response_count_key(i) for i in ids])
+    counts = {i: found[_response_count_key(i)] for i in ids if _response_count_key(i) in found}
+    missing = [i for i in ids if i not in counts]
+    if missing:
+        counted = count_many(missing)
+        timeout = getattr(settings, "RESPONSE_COUNT_TIMEOUT", 600)
+        for interview_id in missing:
+            counts[interview_id] = counted.get(interview_id, 0)
+            cache.add(_response_count_key(interview_id), counts[interview_id], timeout=timeout)
+    return counts
+
+
+def adjust_response_count(interview_id: int, delta: int) -> None:
+    """Apply a +/- delta to a cached counter; a missing counter is left to be recounted."""
+    try:
+        cache.incr(_response_count_key(interview_id), delta)
+    except ValueError:
+        pass
+
+
+class LRUCache:
+    """Small thread-safe, size-bounded in-process cache with optional per-entry expiry."""
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, Tuple[Optional[float], Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:
+        with self._lock:
+            try:
+                self._data.move_to_end(key)
+            except KeyError:
+                return None
+            expires, value = self._data[key]
+            if expires is not None and expires <= time.monotonic():
+                del self._data[key]
+                return None
+            return value
+
+    def set(self, key: Hashable, value: Any, timeout: Optional[float] = None) -> None:
+        """Store `value`; it expires after `timeout` seconds (None: only LRU eviction)."""
+        expires = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            self._data[key] = (expires, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def two_tier_get(
+    local: LRUCache, key: str, build: Callable[[], Any], timeout: Optional[int] = None
+) -> Any:
+    """
+    Read `key` from the local LRU, then the shared cache, and finally `build()` it.
+    Built values are written to both tiers, each expiring after `timeout`; a `None` result
+    is never cached.
+    """
+    value = local.get(key)
+    if value is not None:
+        return value
+    value = cache.get(key)
+    if value is None:
+        value = build()
+        if value is None:
+            return None
+        cache.set(key, value, timeout=timeout)
+    local.set(key, value, timeout=timeout)
+    return value
+
+
+__all__ = [
+    "LRUCache",
+    "adjust_response_count",
+    "bump_interview_version",
+    "get_interview_version",
+    "get_interview_versions",
+    "get_response_count",
+    "get_response_counts",
+    "two_tier_get",
+]
@@ -0,0 +1,95 @@
+"""
+Candidate lookup for recruiters: typo-tolerant fuzzy search and prefix autocomplete.
+
+Fuzzy mode filters with pg_trgm's word-similarity operator (`term <% column`), which the
+gin_trgm_ops indexes on full_name and email serve directly, then ranks the matches by
+their best word similarity; the operator's cut-off is CANDIDATE_SEARCH_THRESHOLD.
+Prefix mode uses istartswith, served by the UPPER(col::text) text_pattern_ops indexes,
+for as-you-type suggestions.
+"""
+
+from dataclasses import dataclass
+from typing import List, Optional
+
+from django.conf import settings
+from django.contrib.postgres.search import TrigramWordSimilarity
+from django.db import connection, transaction
+from django.db.models import Q
+from django.db.models.functions import Greatest
+
+from .models import Candidate
+
+SEARCH_MODES = ("fuzzy", "prefix")
+MAX_RESULTS = 50
+# Trigram matching needs at least one full trigram to be selective
+MIN_FUZZY_LENGTH = 3
+
+
+@dataclass(frozen=True)
+class CandidateMatch:
+    id: int
+    full_name: str
+    email: str
+    # Best word similarity (0..1) of the term to name or email; None in prefix mode
+    similarity: Optional[float]
+
+
+def _clamp(limit: int) -> int:
+    return max(1, min(int(limit), MAX_RESULTS))
+
+
+def fuzzy_candidates(term: str, limit: int = 10) -> List[CandidateMatch]:
+    """Top `limit` candidates whose name or email contains a word similar to `term`."""
+    term = (term or "").strip()
+    if len(term) < MIN_FUZZY_LENGTH:
+        return []
+    threshold = getattr(settings, "CANDIDATE_SEARCH_THRESHOLD", 0.3)
+    with transaction.atomic():
+        # The operator's cut-off is a session setting; scope it to this transaction
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT set_config('pg_trgm.word_similarity_threshold', %s, true)",
+                [str(threshold)],
+            )
+        rows = list(
+            Candidate.objects.filter(
+                Q(full_name__trigram_word_similar=term) | Q(email__trigram_word_similar=term)
+            )
+            .annotate(
+                similarity=Greatest(
+                    TrigramWordSimilarity(term, "full_name"), TrigramWordSimilarity(term, "email")
+                )
+            )
+            .order_by("-similarity", "id")
+            .values_list("id", "full_name", "email", "similarity")[: _clamp(limit)]
+        )
+    return [CandidateMatch(*row) for row in rows]
+
+
+def prefix_candidates(prefix: str, limit: int = 10) -> List[CandidateMatch]:
+    """Candidates whose name or email starts with `prefix` (case-insensitive), by name."""
+    prefix = (prefix or "").strip()
+    if not prefix:
+        return []
+    rows = (
+        Candidate.objects.filter(Q(full_name__istartswith=prefix) | Q(email__istartswith=prefix))
+        .order_by("full_name", "email")
+        .values_list("id", "full_name", "email")[: _clamp(limit)]
+    )
+    return [CandidateMatch(*row, similarity=None) for row in rows]
+
+
+def search_candidates(term: str, mode: str = "fuzzy", limit: int = 10) -> List[CandidateMatch]:
+    if mode == "prefix":
+        return prefix_candidates(term, limit)
+    return fuzzy_candidates(term, limit)
+
+
+__all__ = [
+    "CandidateMatch",
+    "MAX_RESULTS",
+    "SEARCH_MODES",
+    "fuzzy_candidates",
+    "prefix_candidates",
+    "search_candidates",
+]
@@ -0,0 +1,84 @@
+"""
+Candidate resolution shared by every ingest path (form, JSON and async submits, backfills).
+
+Candidates are unique by email. resolve_candidate() resolves one in a single
+INSERT ... ON CONFLICT (email) DO UPDATE ... RETURNING round trip: the row is created, or
+its full_name filled in when the stored one is blank, and returned either way. Concurrent
+submissions from the same address wait on the row lock instead of failing into an
+IntegrityError retry. resolve_candidates() does the same for any number of emails in one
+statement. Returned candidates carry `created`: True when the row was inserted.
+
+The conflict branch always "updates" (the CASE keeps a non-blank name), because
+ON CONFLICT ... DO UPDATE ... WHERE returns nothing for rows it skips.
+"""
+
+from typing import Dict, Iterable, Optional, Tuple
+
+from django.utils import timezone
+
+from .models import Candidate
+
+_TABLE = Candidate._meta.db_table
+_COLUMNS = "id, full_name, email, phone, location, created_at, updated_at"
+_ON_CONFLICT = f"""
+    ON CONFLICT (email) DO UPDATE SET
+        full_name = CASE WHEN {_TABLE}.full_name = '' THEN EXCLUDED.full_name
+                         ELSE {_TABLE}.full_name END,
+        updated_at = CASE WHEN {_TABLE}.full_name = '' AND EXCLUDED.full_name <> ''
+                          THEN EXCLUDED.updated_at ELSE {_TABLE}.updated_at END
+    RETURNING {_COLUMNS}, (xmax = 0) AS created
+"""
+
+_UPSERT_ONE = f"""
+    INSERT INTO {_TABLE} (full_name, email, phone, location, created_at, updated_at)
+    VALUES (%s, %s, '', '', %s, %s)
+    {_ON_CONFLICT}
+"""
+
+# DISTINCT ON: one row per email (ON CONFLICT cannot touch a row twice), preferring a
+# non-blank name; rows are inserted in email order so concurrent batches lock alike.
+_UPSERT_MANY = f"""
+    INSERT INTO {_TABLE} (full_name, email, phone, location, created_at, updated_at)
+    SELECT DISTINCT ON (t.email) t.full_name, t.email, '', '', %s, %s
+    FROM unnest(%s::text[], %s::text[]) AS t(email, full_name)
+    ORDER BY t.email, t.full_name = ''
+    {_ON_CONFLICT}
+"""
+
+
+def normalize_email(email: Optional[str]) -> str:
+    return (email or "").strip().lower()
+
+
+def resolve_candidate(email: str, full_name: str = "") -> Candidate:
+    """
+    The Candidate for `email` (normalized), created if missing; a blank stored name is
+    filled in from `full_name`. One query.
+    """
+    now = timezone.now()
+    params = [(full_name or "").strip(), normalize_email(email), now, now]
+    return next(iter(Candidate.objects.raw(_UPSERT_ONE, params)))
+
+
+def resolve_candidates(pairs: Iterable[Tuple[str, str]]) -> Dict[str, Candidate]:
+    """
+    Resolve many (email, full_name) pairs in one statement, with the same rules as
+    resolve_candidate(). Returns normalized email -> Candidate; blank emails are skipped.
+    """
+    names: Dict[str, str] = {}
+    for email, full_name in pairs:
+        email = normalize_email(email)
+        if email:
+            names[email] = names.get(email) or (full_name or "").strip()
+    if not names:
+        return {}
+    now = timezone.now()
+    params = [now, now, list(names), list(names.values())]
+    return {c.email: c for c in Candidate.objects.raw(_UPSERT_MANY, params)}
+
+
+__all__ = [
+    "normalize_email",
+    "resolve_candidate",
+    "resolve_candidates",
+]
@@ -0,0 +1,26 @@
+"""
+System checks for settings the interviews app relies on in production.
+"""
+
+from django.conf import settings
+from django.core.checks import Tags, Warning, register
+
+# Backends whose entries live in one process, so other workers never see version bumps
+PROCESS_LOCAL_CACHES = ("django.core.cache.backends.locmem.LocMemCache",)
+
+
+@register(Tags.caches, deploy=True)
+def check_shared_cache(app_configs, **kwargs):
+    backend = settings.CACHES.get("default", {}).get("BACKEND", "")
+    if backend not in PROCESS_LOCAL_CACHES:
+        return []
+    return [
+        Warning(
+            "The default cache is process-local, so interview edits reach other worker "
+            "processes only when their cached snapshots expire "
+            f"(INTERVIEW_SNAPSHOT_TIMEOUT={getattr(settings, 'INTERVIEW_SNAPSHOT_TIMEOUT', 86400)}s).",
+            hint="Set DJANGO_CACHE_BACKEND (and DJANGO_CACHE_LOCATION) to a shared backend such "
+            "as django.core.cache.backends.redis.RedisCache.",
+            id="interviews.W001",
+        )
+    ]
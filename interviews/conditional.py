@@ -0,0 +1,163 @@
+"""
+Conditional GET for candidate-facing pages.
+
+Interview pages change only when the interview is edited, so their ETag is built from the
+interview's version token and their Last-Modified from Interview.updated_at, both read from
+the cached snapshot (no queries on a warm cache). Receipt pages show a submission that never
+changes, so the response id is enough. Django's `condition` decorator evaluates these before
+the view body runs, so a matching If-None-Match / If-Modified-Since returns 304 without
+loading anything else or rendering a template.
+
+The pages also render per-visitor bits (the signed-in user in the header, the CSRF token in
+forms, one-off flash messages), so each ETag mixes in a digest of the viewer, and pages with
+pending messages are always rendered in full. Candidates are anonymous, and an anonymous
+render without a CSRF token or cookie is the same for everyone: those responses are marked
+`public` (with `Vary: Cookie`) so a shared edge proxy can serve them. Everything else stays
+`private`.
+"""
+
+import hashlib
+from functools import wraps
+
+from django.conf import settings
+from django.contrib.messages import get_messages
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.views.decorators.http import condition
+
+from .models import InterviewResponse
+from .snapshots import get_interview_snapshot
+
+
+def _has_pending_messages(request) -> bool:
+    # len() loads the storage without marking the messages as read
+    return bool(len(get_messages(request)))
+
+
+def _viewer(request, with_csrf: bool = False) -> str:
+    user = getattr(request, "user", None)
+    parts = [str(user.pk) if user is not None and user.is_authenticated else "anon"]
+    if with_csrf:
+        parts.append(request.COOKIES.get(settings.CSRF_COOKIE_NAME, ""))
+    return hashlib.blake2s("|".join(parts).encode(), digest_size=6).hexdigest()
+
+
+def _interview_validators(active_only: bool, with_csrf: bool = False):
+    def snapshot_for(request, pk):
+        if _has_pending_messages(request):
+            return None
+        # Without a CSRF cookie the render has to set one, so it cannot be skipped
+        if with_csrf and settings.CSRF_COOKIE_NAME not in request.COOKIES:
+            return None
+        snapshot = get_interview_snapshot(pk)
+        if snapshot is None or (active_only and not snapshot.is_active):
+            return None  # let the view raise its 404
+        return snapshot
+
+    def etag(request, pk, **kwargs):
+        snapshot = snapshot_for(request, pk)
+        if snapshot is None:
+            return None
+        return f"interview-{snapshot.pk}-{snapshot.version}-{_viewer(request, with_csrf)}"
+
+    def last_modified(request, pk, **kwargs):
+        snapshot = snapshot_for(request, pk)
+        return snapshot.updated_at if snapshot is not None else None
+
+    return condition(etag_func=etag, last_modified_func=last_modified)
+
+
+def _response_etag(request, rid, **kwargs):
+    if _has_pending_messages(request):
+        return None
+    return f"response-{rid}-{_viewer(request)}"
+
+
+def _response_last_modified(request, rid, **kwargs):
+    if _has_pending_messages(request):
+        return None
+    # Also confirms the response still exists before a 304 is sent
+    return InterviewResponse.objects.filter(pk=rid).values_list("submitted_at", flat=True).first()
+
+
+# Decorators for the candidate-facing views; revalidating costs a cache lookup and no
+# rendering
+conditional_interview_page = _interview_validators(active_only=False)
+conditional_active_interview_page = _interview_validators(active_only=True)
+conditional_take_page = _interview_validators(active_only=True, with_csrf=True)
+conditional_receipt = condition(
+    etag_func=_response_etag, last_modified_func=_response_last_modified
+)
+
+
+def _shareable(request, response, pending: bool) -> bool:
+    """True when the response is the same for every anonymous visitor."""
+    user = getattr(request, "user", None)
+    return (
+        not pending
+        and (user is None or not user.is_authenticated)
+        # The render embedded a CSRF token; the middleware will (re)set the cookie
+        and not request.META.get("CSRF_COOKIE_NEEDS_UPDATE")
+        and not response.cookies
+    )
+
+
+def revalidate(view):
+    """
+    Interview pages: browsers always revalidate. Anonymous renders may be kept by shared
+    caches for INTERVIEW_PAGE_SHARED_MAX_AGE seconds; the rest are `private, no-cache`.
+    """
+
+    @wraps(view)
+    def wrapped(request, *args, **kwargs):
+        pending = _has_pending_messages(request)
+        response = view(request, *args, **kwargs)
+        if response.status_code in (200, 304):
+            patch_vary_headers(response, ("Cookie",))
+            if _shareable(request, response, pending):
+                patch_cache_control(
+                    response,
+                    public=True,
+                    max_age=0,
+                    s_maxage=getattr(settings, "INTERVIEW_PAGE_SHARED_MAX_AGE", 60),
+                )
+            else:
+                patch_cache_control(response, private=True, no_cache=True)
+        return response
+
+    return wrapped
+
+
+def immutable_receipt(view):
+    """
+    Long-lived caching for receipts, shared for anonymous viewers; the first render after
+    submitting carries a one-off flash message, so that one is only revalidated.
+    """
+
+    @wraps(view)
+    def wrapped(request, *args, **kwargs):
+        pending = _has_pending_messages(request)
+        response = view(request, *args, **kwargs)
+        if response.status_code in (200, 304):
+            patch_vary_headers(response, ("Cookie",))
+            if pending:
+                patch_cache_control(response, private=True, no_cache=True)
+            else:
+                audience = "public" if _shareable(request, response, pending) else "private"
+                patch_cache_control(
+                    response,
+                    **{audience: True},
+                    max_age=getattr(settings, "RECEIPT_CACHE_MAX_AGE", 604800),
+                )
+        return response
+
+    return wrapped
+
+
+__all__ = [
+    "conditional_active_interview_page",
+    "conditional_interview_page",
+    "conditional_receipt",
+    "conditional_take_page",
+    "immutable_receipt",
+    "revalidate",
+]
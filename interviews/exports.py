@@ -0,0 +1,162 @@
+"""
+Streaming exports of an interview's responses (wide CSV or JSONL).
+
+Responses are read with a server-side cursor in chunks (answers loaded per chunk through
+answers.load_answers, whatever the storage mode) and encoded row by row, so memory stays
+flat however many responses an interview has.
+"""
+
+import csv
+import json
+import zlib
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from django.conf import settings
+
+from .answers import load_answers
+from .models import InterviewResponse
+from .snapshots import InterviewSnapshot, QuestionDef
+
+EXPORT_FORMATS = ("csv", "jsonl")
+CONTENT_TYPES = {"csv": "text/csv; charset=utf-8", "jsonl": "application/x-ndjson"}
+# Leading characters that make spreadsheet apps evaluate a cell as a formula
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+class _Echo:
+    """File-like object whose write() returns the value, for csv.writer on a stream."""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def export_questions(snapshot: InterviewSnapshot) -> List[QuestionDef]:
+    """Questions in section order, then question order within each section."""
+    return [q for section in snapshot.sections for q in section.questions]
+
+
+def _format_value(text: str, options: Iterable[str]) -> str:
+    return text or "; ".join(str(o) for o in options or [])
+
+
+def response_values(response: InterviewResponse) -> Dict[int, str]:
+    """Map question id -> exported value for one response (after load_answers)."""
+    return {
+        item.question_id: _format_value(item.text, item.option_values)
+        for item in response.answer_items
+        if item.question_id is not None
+    }
+
+
+def iter_responses(
+    interview_id: int, chunk_size: Optional[int] = None
+) -> Iterator[InterviewResponse]:
+    """
+    Iterate an interview's responses oldest first through a server-side cursor, loading
+    candidates and answers one chunk at a time.
+    """
+    chunk_size = chunk_size or getattr(settings, "EXPORT_CHUNK_SIZE", 2000)
+    responses = (
+        InterviewResponse.objects.filter(interview_id=interview_id)
+        .select_related("candidate")
+        .order_by("submitted_at", "id")
+        .iterator(chunk_size=chunk_size)
+    )
+    while True:
+        chunk = list(islice(responses, chunk_size))
+        if not chunk:
+            return
+        yield from load_answers(chunk)
+
+
+def _candidate_fields(response: InterviewResponse) -> List[str]:
+    candidate = response.candidate
+    return [candidate.full_name, candidate.email] if candidate else ["", ""]
+
+
+def _csv_cell(value: Any) -> Any:
+    """Candidate-supplied text, quoted with a leading ' if it would open as a formula."""
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def iter_csv(snapshot: InterviewSnapshot, responses: Iterable[InterviewResponse]) -> Iterator[str]:
+    """
+    One header line, then one line per response with a column per question. Text cells
+    that start like a formula are prefixed with ' so spreadsheets show them as text.
+    """
+    questions = export_questions(snapshot)
+    writer = csv.writer(_Echo())
+    yield writer.writerow(
+        ["response_id", "submitted_at", "candidate_name", "candidate_email"]
+        + [_csv_cell(q.question_text) for q in questions]
+    )
+    for response in responses:
+        values = response_values(response)
+        yield writer.writerow(
+            [response.pk, response.submitted_at.isoformat()]
+            + [_csv_cell(v) for v in _candidate_fields(response)]
+            + [_csv_cell(values.get(q.id, "")) for q in questions]
+        )
+
+
+def iter_jsonl(
+    snapshot: InterviewSnapshot, responses: Iterable[InterviewResponse]
+) -> Iterator[str]:
+    """One JSON object per line per response, with answers listed in section order."""
+    questions = export_questions(snapshot)
+    for response in responses:
+        values = response_values(response)
+        name, email = _candidate_fields(response)
+        record: Dict[str, Any] = {
+            "response_id": response.pk,
+            "interview_id": snapshot.id,
+            "submitted_at": response.submitted_at.isoformat(),
+            "candidate": {"full_name": name, "email": email},
+            "answers": [
+                {"question": q.id, "question_text": q.question_text, "value": values.get(q.id, "")}
+                for q in questions
+            ],
+        }
+        yield json.dumps(record, ensure_ascii=False) + "\n"
+
+
+def gzip_stream(chunks: Iterable[str], flush_bytes: int = 64 * 1024) -> Iterator[bytes]:
+    """
+    Gzip a stream of text chunks on the fly, emitting compressed blocks roughly every
+    `flush_bytes` of input so the client keeps receiving data.
+    """
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    pending = 0
+    for chunk in chunks:
+        raw = chunk.encode("utf-8")
+        pending += len(raw)
+        out = compressor.compress(raw)
+        if pending >= flush_bytes:
+            out += compressor.flush(zlib.Z_SYNC_FLUSH)
+            pending = 0
+        if out:
+            yield out
+    yield compressor.flush()
+
+
+def export_stream(snapshot: InterviewSnapshot, fmt: str, compress: bool = False) -> Iterator[Any]:
+    """Return the body iterator for an export in `fmt` ("csv" or "jsonl")."""
+    responses = iter_responses(snapshot.id)
+    rows = iter_csv(snapshot, responses) if fmt == "csv" else iter_jsonl(snapshot, responses)
+    return gzip_stream(rows) if compress else rows
+
+
+__all__ = [
+    "CONTENT_TYPES",
+    "EXPORT_FORMATS",
+    "export_questions",
+    "export_stream",
+    "gzip_stream",
+    "iter_csv",
+    "iter_jsonl",
+    "iter_responses",
+    "response_values",
+]
@@ -1,109 +1,161 @@
-from django.core.management.base import BaseCommand
-from django.db import transaction
-from django.db.models import Q
-
-from interviews.models import Candidate, InterviewResponse
+import time
+from collections import Counter
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from interviews.batches import Checkpoint, id_ranges, run_ranges
+from interviews.candidates import normalize_email, resolve_candidates
+from interviews.models import InterviewResponse
+
+_TABLE = InterviewResponse._meta.db_table
+_LEGACY_COLUMNS = {"candidate_email", "candidate_name"}
+# The legacy columns are no longer model fields (migration 0007 dropped them), so they are
+# read with SQL on databases that still carry them
+_PENDING = "candidate_id IS NULL AND btrim(coalesce(candidate_email, '')) <> ''"
+
+
+def legacy_columns_present():
+    with connection.cursor() as cursor:
+        columns = connection.introspection.get_table_description(cursor, _TABLE)
+    return _LEGACY_COLUMNS <= {c.name for c in columns}
+
+
+def count_pending():
+    with connection.cursor() as cursor:
+        cursor.execute(f"SELECT count(*) FROM {_TABLE} WHERE {_PENDING}")
+        return cursor.fetchone()[0]
+
+
+def link_range(start, end, batch_size):
+    """
+    Link the unlinked responses with start <= id < end, batch by batch. Each batch resolves
+    its candidates in one upsert and links its responses in one bulk update, in one short
+    transaction. Only unlinked rows are read, so rerunning a range is safe.
+    """
+    sql = f"""
+        SELECT id, candidate_email, candidate_name FROM {_TABLE}
+        WHERE {_PENDING} AND id > %s AND id < %s
+        ORDER BY id LIMIT %s
+    """
+    counts = Counter()
+    last = start - 1
+    while True:
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [last, end, batch_size])
+            fetched = cursor.fetchall()
+        if not fetched:
+            return counts
+        last = fetched[-1][0]
+        batch = [row for row in fetched if normalize_email(row[1])]
+        counts["skipped"] += len(fetched) - len(batch)
+        if not batch:
+            continue
+        with transaction.atomic():
+            candidates = resolve_candidates((email, name) for _, email, name in batch)
+            InterviewResponse.objects.bulk_update(
+                [
+                    InterviewResponse(pk=pk, candidate=candidates[normalize_email(email)])
+                    for pk, email, _ in batch
+                ],
+                ["candidate"],
+            )
+        counts["linked"] += len(batch)
+        counts["created"] += sum(c.created for c in candidates.values())
 
 
 class Command(BaseCommand):
-    help = "Backfill Candidate records from InterviewResponse legacy fields and link responses to candidates."
+    help = (
+        "Backfill Candidate records from InterviewResponse legacy fields and link responses to "
+        "candidates, in id ranges spread over worker processes. Interrupted runs resume from "
+        "the checkpoint file."
+    )
 
     def add_arguments(self, parser):
         parser.add_argument(
             "--dry-run",
             action="store_true",
-            help="Simulate the backfill without writing to the database.",
+            help="Report how many responses would be linked without writing to the database.",
         )
         parser.add_argument(
             "--batch-size",
             type=int,
             default=500,
-            help="Number of InterviewResponse rows to update per batch.",
+            help="Number of InterviewResponse rows resolved and linked per transaction.",
+        )
+        parser.add_argument(
+            "--range-size",
+            type=int,
+            default=50000,
+            help="Ids per unit of work handed to a worker and recorded in the checkpoint.",
+        )
+        parser.add_argument(
+            "--workers", type=int, default=1, help="Worker processes (1 runs in-process)."
+        )
+        parser.add_argument(
+            "--checkpoint",
+            default="backfill_candidates.checkpoint.json",
+            help="File recording finished id ranges; removed once the backfill completes.",
+        )
+        parser.add_argument(
+            "--restart", action="store_true", help="Ignore an existing checkpoint file."
         )
 
     def handle(self, *args, **options):
-        dry_run: bool = options["dry_run"]
         batch_size: int = options["batch_size"]
-        # Detect if legacy fields are present; if not, no-op gracefully
-        legacy_fields = {f.name for f in InterviewResponse._meta.get_fields() if hasattr(f, "name")}
-        if not {"candidate_email", "candidate_name"}.issubset(legacy_fields):
+        range_size: int = options["range_size"]
+        if batch_size < 1 or range_size < 1 or options["workers"] < 1:
+            raise CommandError("--batch-size, --range-size and --workers must be positive.")
+        # Detect if legacy columns are present; if not, no-op gracefully
+        if not legacy_columns_present():
             self.stdout.write(self.style.SUCCESS("Legacy fields not present; nothing to backfill."))
             return
 
-        qs = (
-            InterviewResponse.objects.filter(candidate__isnull=True)
-            .filter(~Q(candidate_email__isnull=True), ~Q(candidate_email__exact=""))
-            .order_by("id")
-        )
-
-        total = qs.count()
+        total = count_pending()
         if total == 0:
             self.stdout.write(self.style.SUCCESS("No InterviewResponse rows require backfill."))
             return
 
         self.stdout.write(f"Found {total} InterviewResponse rows without candidate link.")
-        if dry_run:
+        if options["dry_run"]:
             self.stdout.write(self.style.WARNING("DRY RUN mode: no changes will be committed."))
+            self.stdout.write(f"  InterviewResponses to link: {total}")
+            return
 
-        linked = 0
-        created_candidates = 0
-        updated_candidate_names = 0
-        skipped = 0
-
-        to_update = []
-
-        def flush_batch():
-            nonlocal to_update, linked
-            if not to_update:
-                return
-            if dry_run:
-                # In dry run, don't commit
-                to_update.clear()
-                return
-            with transaction.atomic():
-                InterviewResponse.objects.bulk_update(to_update, ["candidate"])
-            linked += len(to_update)
-            to_update.clear()
-
-        for resp in qs.iterator(chunk_size=batch_size):
-            email = (getattr(resp, "candidate_email", "") or "").strip().lower()
-            name = (getattr(resp, "candidate_name", "") or "").strip()
-
-            if not email:
-                skipped += 1
-                continue
-
-            # Create or get candidate by unique email
-            cand, created = Candidate.objects.get_or_create(
-                email=email,
-                defaults={"full_name": name},
+        # Over all responses, on fixed boundaries: linked rows must not move the ranges
+        ranges = id_ranges(InterviewResponse.objects.all(), range_size)
+        checkpoint = Checkpoint(
+            options["checkpoint"], {"command": "backfill_candidates", "range_size": range_size}
+        )
+        if options["restart"]:
+            checkpoint.clear()
+        if checkpoint.done:
+            remaining = sum(r not in checkpoint for r in ranges)
+            self.stdout.write(f"Resuming from {options['checkpoint']}: {remaining} ranges left.")
+
+        started = time.monotonic()
+        counts = Counter()
+        for (start, end), done in run_ranges(
+            link_range,
+            ranges,
+            workers=options["workers"],
+            checkpoint=checkpoint,
+            batch_size=batch_size,
+        ):
+            counts += done
+            rate = counts["linked"] / max(time.monotonic() - started, 1e-6)
+            self.stdout.write(
+                f"  ids {start}-{end - 1}: linked {counts['linked']}/{total} ({rate:.0f} rows/s)"
             )
-            if created:
-                created_candidates += 1
-            elif name and not cand.full_name:
-                # Backfill name if missing
-                if not dry_run:
-                    cand.full_name = name
-                    cand.save(update_fields=["full_name"])
-                updated_candidate_names += 1
-
-            # Link response to candidate
-            resp.candidate = cand
-            to_update.append(resp)
-
-            if len(to_update) >= batch_size:
-                flush_batch()
-
-        # Flush remaining updates
-        flush_batch()
+        checkpoint.clear()
 
         # Summary
+        elapsed = time.monotonic() - started
         self.stdout.write("")
-        self.stdout.write(
-            self.style.SUCCESS("Backfill complete" + (" (DRY RUN)" if dry_run else ""))
-        )
-        self.stdout.write(f"  Candidate rows created: {created_candidates}")
-        self.stdout.write(f"  Candidate names updated: {updated_candidate_names}")
-        self.stdout.write(f"  InterviewResponses linked: {linked if not dry_run else len(qs)}")
-        if skipped:
-            self.stdout.write(f"  InterviewResponses skipped (missing/blank email): {skipped}")
+        self.stdout.write(self.style.SUCCESS(f"Backfill complete in {elapsed:.2f}s"))
+        self.stdout.write(f"  Candidate rows created: {counts['created']}")
+        self.stdout.write(f"  InterviewResponses linked: {counts['linked']}")
+        if counts["skipped"]:
+            self.stdout.write(
+                f"  InterviewResponses skipped (missing/blank email): {counts['skipped']}"
+            )
@@ -0,0 +1,112 @@
+import asyncio
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+from django.db import connections
+from django.test import AsyncClient, Client, override_settings
+from django.test.utils import setup_test_environment, teardown_test_environment
+from django.urls import reverse
+
+from interviews.upstream_stub import StubUpstream
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark realtime session minting through the sync and async views against a local "
+        "fake upstream (no OpenAI traffic). Reports throughput and latency for each mode."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=200, help="Mints per mode.")
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=8,
+            help="Thread pool size for the sync view (simulates sync worker threads).",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=200,
+            help="In-flight requests for the async view (single event loop).",
+        )
+        parser.add_argument(
+            "--latency",
+            type=float,
+            default=0.2,
+            help="Simulated upstream latency per mint, in seconds.",
+        )
+        parser.add_argument(
+            "--pool-size",
+            type=int,
+            default=200,
+            help="Upstream connection pool size of the sync client during the benchmark.",
+        )
+        parser.add_argument("--interview", type=int, help="Optional interview id to mint for.")
+
+    def handle(self, *args, **options):
+        total = options["requests"]
+        body = {"interview_id": options["interview"]} if options.get("interview") else {}
+
+        setup_test_environment()
+        try:
+            with (
+                StubUpstream(latency=options["latency"]) as stub,
+                override_settings(
+                    OPENAI_API_KEY="bench",
+                    OPENAI_API_BASE=stub.base_url,
+                    OPENAI_POOL_SIZE=options["pool_size"],
+                ),
+            ):
+                sync_stats = self._run_sync(total, options["workers"], body)
+                async_stats = asyncio.run(self._run_async(total, options["concurrency"], body))
+        finally:
+            teardown_test_environment()
+
+        self.stdout.write(
+            f"Upstream latency {options['latency'] * 1000:.0f} ms, {total} mints per mode"
+        )
+        self._report(f"sync  ({options['workers']} threads)", *sync_stats)
+        self._report(f"async (concurrency {options['concurrency']})", *async_stats)
+
+    def _run_sync(self, total, workers, body):
+        url = reverse("interviews:ai_interview_realtime_session")
+
+        def mint(_):
+            started = time.perf_counter()
+            res = Client().post(url, body, content_type="application/json")
+            connections.close_all()
+            return res.status_code, time.perf_counter() - started
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(mint, range(total)))
+        return results, time.perf_counter() - started
+
+    async def _run_async(self, total, concurrency, body):
+        url = reverse("interviews:ai_interview_realtime_session_async")
+        client = AsyncClient()
+        gate = asyncio.Semaphore(concurrency)
+
+        async def mint():
+            async with gate:
+                started = time.perf_counter()
+                res = await client.post(url, body, content_type="application/json")
+                return res.status_code, time.perf_counter() - started
+
+        started = time.perf_counter()
+        results = await asyncio.gather(*(mint() for _ in range(total)))
+        return results, time.perf_counter() - started
+
+    def _report(self, label, results, elapsed):
+        latencies = sorted(lat for _, lat in results)
+        ok = sum(1 for status, _ in results if status == 200)
+        p95 = latencies[max(0, int(len(latencies) * 0.95) - 1)]
+        self.stdout.write(
+            self.style.SUCCESS(f"  {label}: {len(results) / elapsed:.1f} mints/s")
+            + f"  ok={ok}/{len(results)}"
+            + f"  p50={statistics.median(latencies) * 1000:.0f}ms"
+            + f"  p95={p95 * 1000:.0f}ms"
+        )
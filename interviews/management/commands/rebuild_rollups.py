@@ -0,0 +1,46 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from interviews.models import Interview
+from interviews.rollups import rebuild_interview_rollups
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute per-interview rollups (response totals, per-day counts, option selections) "
+        "from existing responses, reading them in primary-key chunks."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--interview",
+            type=int,
+            action="append",
+            dest="interview_ids",
+            help="Rebuild only this interview id (repeatable). Defaults to all interviews.",
+        )
+        parser.add_argument(
+            "--chunk-size", type=int, default=2000, help="Responses read per query."
+        )
+
+    def handle(self, *args, **options):
+        qs = Interview.objects.all()
+        if options.get("interview_ids"):
+            qs = qs.filter(pk__in=options["interview_ids"])
+        interview_ids = list(qs.order_by("id").values_list("id", flat=True))
+
+        started = time.monotonic()
+        responses = 0
+        for interview_id in interview_ids:
+            counted = rebuild_interview_rollups(interview_id, chunk_size=options["chunk_size"])
+            responses += counted
+            self.stdout.write(f"  #{interview_id}: {counted} responses")
+
+        elapsed = time.monotonic() - started
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Rebuilt rollups for {len(interview_ids)} interview(s), "
+                f"{responses} responses in {elapsed:.2f}s"
+            )
+        )
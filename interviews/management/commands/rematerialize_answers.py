@@ -0,0 +1,334 @@
+import time
+from collections import Counter, defaultdict
+from datetime import datetime, time as dt_time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from interviews.batches import Checkpoint, id_ranges, run_ranges
+from interviews.models import Answer, InterviewResponse, Question
+
+DIRECTIONS = ("rows", "snapshots")
+
+# Order-independent checksum of (response, question, text, option ids) tuples: the sum of
+# a 60-bit slice of each tuple's md5. Rows and snapshot items hash the same text.
+_HASH = "coalesce(sum(('x' || substr(md5(concat_ws(':', {})), 1, 15))::bit(60)::bigint), 0)"
+_ROW_TUPLE = (
+    "a.response_id, a.question_id, a.answer_text, array_to_string(a.selected_option_ids, ',')"
+)
+_ITEM_OPTIONS = (
+    "CASE WHEN jsonb_typeof(item->'option_ids') = 'array' THEN item->'option_ids' ELSE '[]' END"
+)
+_ITEM_TUPLE = (
+    "r.id, q.id, coalesce(item->>'text', ''), "
+    f"array_to_string(ARRAY(SELECT jsonb_array_elements_text({_ITEM_OPTIONS})), ',')"
+)
+
+_ROWS_CHECKSUM = f"""
+    SELECT count(*), {_HASH.format(_ROW_TUPLE)}
+    FROM {Answer._meta.db_table} a
+    WHERE a.response_id IN ({{responses}})
+"""
+
+# Items whose question no longer exists cannot be Answer rows, so they are left out
+_SNAPSHOT_CHECKSUM = f"""
+    SELECT count(*), {_HASH.format(_ITEM_TUPLE)}
+    FROM {InterviewResponse._meta.db_table} r
+    CROSS JOIN LATERAL jsonb_array_elements(
+        CASE WHEN jsonb_typeof(r.answers_transcript->'answers') = 'array'
+             THEN r.answers_transcript->'answers' ELSE '[]' END
+    ) AS item
+    JOIN {Question._meta.db_table} q ON q.id::text = item->>'question'
+    WHERE r.id IN ({{responses}})
+"""
+
+
+def _scope(direction, interview_ids=None, since=None):
+    """Responses to rebuild: those carrying the side that is copied from."""
+    responses = InterviewResponse.objects.order_by()
+    if interview_ids:
+        responses = responses.filter(interview_id__in=interview_ids)
+    if since is not None:
+        responses = responses.filter(submitted_at__gte=since)
+    if direction == "rows":
+        return responses.filter(answers_transcript__has_key="answers")
+    return responses.filter(Exists(Answer.objects.filter(response=OuterRef("pk"))))
+
+
+def _snapshot_items(snapshot):
+    items = snapshot.get("answers") if isinstance(snapshot, dict) else None
+    return [i for i in items if isinstance(i, dict)] if isinstance(items, list) else []
+
+
+def _question_id(item):
+    try:
+        return int(item.get("question"))
+    except (TypeError, ValueError):
+        return None
+
+
+def _rows_from_snapshots(responses):
+    """Make each response's Answer rows match its snapshot answers. Returns counters."""
+    counts = Counter()
+    qids = {_question_id(i) for _, snapshot in responses for i in _snapshot_items(snapshot)}
+    known = set(Question.objects.filter(pk__in=qids - {None}).values_list("pk", flat=True))
+    existing = defaultdict(list)
+    for row in Answer.objects.filter(response_id__in=[pk for pk, _ in responses]).order_by("pk"):
+        existing[row.response_id].append(row)
+
+    to_create, to_update, to_delete = [], [], []
+    for pk, snapshot in responses:
+        wanted = [
+            (qid, str(item.get("text") or ""), [int(i) for i in item.get("option_ids") or []])
+            for item in _snapshot_items(snapshot)
+            if (qid := _question_id(item)) in known
+        ]
+        rows = existing.get(pk, [])
+        have = [(r.question_id, r.answer_text, r.selected_option_ids) for r in rows]
+        if have == wanted:
+            continue
+        if [r.question_id for r in rows] == [qid for qid, _, _ in wanted]:
+            # Same questions in the same order: fix the values in place
+            for row, (_, text, option_ids) in zip(rows, wanted):
+                if (row.answer_text, row.selected_option_ids) != (text, option_ids):
+                    row.answer_text, row.selected_option_ids = text, option_ids
+                    to_update.append(row)
+            continue
+        to_delete.extend(r.pk for r in rows)
+        to_create.extend(
+            Answer(response_id=pk, question_id=qid, answer_text=text, selected_option_ids=ids)
+            for qid, text, ids in wanted
+        )
+
+    with transaction.atomic():
+        if to_delete:
+            Answer.objects.filter(pk__in=to_delete).delete()
+        Answer.objects.bulk_create(to_create)
+        Answer.objects.bulk_update(to_update, ["answer_text", "selected_option_ids"])
+    counts.update(
+        rows_created=len(to_create), rows_updated=len(to_update), rows_deleted=len(to_delete)
+    )
+    return counts
+
+
+def _snapshots_from_rows(batch):
+    """
+    Rewrite the "answers" of each locked response's snapshot from its Answer rows. A
+    question_text stored on an item (responses from before versioning) is carried over.
+    """
+    rows = defaultdict(list)
+    for response_id, qid, text, option_ids in (
+        Answer.objects.filter(response_id__in=[r.pk for r in batch])
+        .order_by("pk")
+        .values_list("response_id", "question_id", "answer_text", "selected_option_ids")
+    ):
+        rows[response_id].append({"question": qid, "text": text, "option_ids": option_ids})
+
+    changed = []
+    for response in batch:
+        snapshot = (
+            response.answers_transcript if isinstance(response.answers_transcript, dict) else {}
+        )
+        texts = {
+            _question_id(item): item["question_text"]
+            for item in _snapshot_items(snapshot)
+            if "question_text" in item
+        }
+        answers = [
+            (
+                {**item, "question_text": texts[item["question"]]}
+                if item["question"] in texts
+                else item
+            )
+            for item in rows[response.pk]
+        ]
+        if snapshot.get("answers") != answers:
+            snapshot["answers"] = answers
+            response.answers_transcript = snapshot
+            changed.append(response)
+    InterviewResponse.objects.bulk_update(changed, ["answers_transcript"])
+    return Counter(snapshots_updated=len(changed))
+
+
+def checksums(responses):
+    """(count, checksum) of the Answer rows and of the snapshot answers of `responses`."""
+    sql, params = responses.values("pk").query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(_ROWS_CHECKSUM.format(responses=sql), params)
+        rows = tuple(cursor.fetchone())
+        cursor.execute(_SNAPSHOT_CHECKSUM.format(responses=sql), params)
+        snapshots = tuple(cursor.fetchone())
+    return rows, snapshots
+
+
+def rematerialize_range(start, end, direction, batch_size, interview_ids, since, write=True):
+    """
+    Rebuild one side from the other for the in-scope responses with start <= id < end,
+    in keyset batches (one short transaction each), then compare both sides' checksums.
+    Responses that already match are left untouched, so rerunning a range is safe.
+    """
+    scope = _scope(direction, interview_ids, since).filter(pk__gte=start, pk__lt=end)
+    counts = Counter()
+    last = start - 1
+    while write:
+        batch = scope.filter(pk__gt=last).order_by("pk")[:batch_size]
+        if direction == "rows":
+            responses = list(batch.values_list("pk", "answers_transcript"))
+            if responses:
+                counts += _rows_from_snapshots(responses)
+        else:
+            with transaction.atomic():
+                responses = list(batch.select_for_update().only("pk", "answers_transcript"))
+                if responses:
+                    counts += _snapshots_from_rows(responses)
+        if not responses:
+            break
+        last = responses[-1][0] if direction == "rows" else responses[-1].pk
+        counts["responses"] += len(responses)
+
+    rows, snapshots = checksums(scope)
+    counts["answers"] += rows[0]
+    if rows != snapshots:
+        counts["mismatched"] += 1
+    return counts
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild Answer rows from the answers_transcript snapshots (--to rows) or the snapshots' "
+        "answers from Answer rows (--to snapshots), in keyset chunks over id ranges spread "
+        "across worker processes, then verify each range by comparing checksums of both sides."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--to", choices=DIRECTIONS, required=True, help="The side to rebuild from the other."
+        )
+        parser.add_argument(
+            "--interview",
+            type=int,
+            action="append",
+            dest="interview_ids",
+            help="Only responses to this interview id (repeatable). Defaults to all interviews.",
+        )
+        parser.add_argument(
+            "--since", help="Only responses submitted at or after this ISO date or datetime."
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=1000, help="Responses rebuilt per transaction."
+        )
+        parser.add_argument(
+            "--range-size",
+            type=int,
+            default=50000,
+            help="Response ids per unit of work handed to a worker and recorded in the checkpoint.",
+        )
+        parser.add_argument(
+            "--workers", type=int, default=1, help="Worker processes (1 runs in-process)."
+        )
+        parser.add_argument(
+            "--checkpoint",
+            default="rematerialize_answers.checkpoint.json",
+            help="File recording finished id ranges; removed once every range verifies.",
+        )
+        parser.add_argument(
+            "--restart", action="store_true", help="Ignore an existing checkpoint file."
+        )
+        parser.add_argument(
+            "--verify-only",
+            action="store_true",
+            help="Only compare checksums; write nothing and keep no checkpoint.",
+        )
+
+    def _since(self, value):
+        if not value:
+            return None
+        parsed = parse_datetime(value)
+        if parsed is None:
+            day = parse_date(value)
+            if day is None:
+                raise CommandError(f"--since must be an ISO date or datetime, not {value!r}.")
+            parsed = datetime.combine(day, dt_time.min)
+        if timezone.is_naive(parsed):
+            parsed = timezone.make_aware(parsed)
+        return parsed
+
+    def handle(self, *args, **options):
+        direction = options["to"]
+        since = self._since(options["since"])
+        interview_ids = sorted(options["interview_ids"] or []) or None
+        if min(options["batch_size"], options["range_size"], options["workers"]) < 1:
+            raise CommandError("--batch-size, --range-size and --workers must be positive.")
+        verify_only = options["verify_only"]
+
+        ranges = id_ranges(_scope(direction, interview_ids, since), options["range_size"])
+        checkpoint = None
+        if not verify_only:
+            checkpoint = Checkpoint(
+                options["checkpoint"],
+                {
+                    "command": "rematerialize_answers",
+                    "to": direction,
+                    "interviews": interview_ids,
+                    "since": since.isoformat() if since else None,
+                    "range_size": options["range_size"],
+                },
+            )
+            if options["restart"]:
+                checkpoint.clear()
+            if checkpoint.done:
+                remaining = sum(r not in checkpoint for r in ranges)
+                self.stdout.write(
+                    f"Resuming from {options['checkpoint']}: {remaining} ranges left."
+                )
+
+        started = time.monotonic()
+        counts = Counter()
+        mismatched = []
+        for (start, end), done in run_ranges(
+            rematerialize_range,
+            ranges,
+            workers=options["workers"],
+            checkpoint=checkpoint,
+            direction=direction,
+            batch_size=options["batch_size"],
+            interview_ids=interview_ids,
+            since=since,
+            write=not verify_only,
+        ):
+            counts += done
+            if done["mismatched"]:
+                mismatched.append((start, end))
+            rate = counts["responses"] / max(time.monotonic() - started, 1e-6)
+            self.stdout.write(
+                f"  ids {start}-{end - 1}: {counts['responses']} responses ({rate:.0f} rows/s)"
+                + (" CHECKSUM MISMATCH" if done["mismatched"] else "")
+            )
+
+        elapsed = time.monotonic() - started
+        self.stdout.write("")
+        self.stdout.write(f"  Responses rebuilt: {counts['responses']} in {elapsed:.2f}s")
+        if direction == "rows":
+            self.stdout.write(
+                f"  Answer rows created: {counts['rows_created']}, updated: "
+                f"{counts['rows_updated']}, deleted: {counts['rows_deleted']}"
+            )
+        else:
+            self.stdout.write(f"  Snapshots updated: {counts['snapshots_updated']}")
+        self.stdout.write(f"  Answers verified: {counts['answers']} in {len(ranges)} id ranges")
+        if mismatched:
+            for id_range in mismatched:
+                if checkpoint is not None:
+                    checkpoint.discard(id_range)
+            listed = ", ".join(f"{start}-{end - 1}" for start, end in mismatched)
+            raise CommandError(f"Checksums differ for response ids {listed}.")
+        if checkpoint is not None:
+            checkpoint.clear()
+        self.stdout.write(
+            self.style.SUCCESS(
+                "Answers verified." if verify_only else "Answers rematerialized and verified."
+            )
+        )
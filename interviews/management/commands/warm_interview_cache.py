@@ -0,0 +1,55 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from interviews.models import Interview
+from interviews.prompts import get_realtime_instructions
+from interviews.snapshots import get_interview_snapshot
+
+
+class Command(BaseCommand):
+    help = (
+        "Pre-warm the interview snapshot and realtime instruction caches for active interviews. "
+        "Only useful with a shared cache backend (DJANGO_CACHE_BACKEND), since local memory "
+        "caches die with this process."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--interview",
+            type=int,
+            action="append",
+            dest="interview_ids",
+            help="Warm only this interview id (repeatable). Defaults to all active interviews.",
+        )
+
+    def handle(self, *args, **options):
+        ids = options.get("interview_ids")
+        qs = Interview.objects.filter(is_active=True)
+        if ids:
+            qs = qs.filter(pk__in=ids)
+        interview_ids = list(qs.order_by("id").values_list("id", flat=True))
+
+        if not interview_ids:
+            self.stdout.write(self.style.SUCCESS("No active interviews to warm."))
+            return
+
+        started = time.monotonic()
+        total_tokens = 0
+        for interview_id in interview_ids:
+            snapshot = get_interview_snapshot(interview_id)
+            if snapshot is None:
+                continue
+            instructions = get_realtime_instructions(snapshot)
+            total_tokens += instructions.estimated_tokens
+            self.stdout.write(
+                f"  #{interview_id} v{snapshot.version}: {len(snapshot.questions)} questions, "
+                f"~{instructions.estimated_tokens} instruction tokens"
+            )
+
+        elapsed = time.monotonic() - started
+        self.stdout.write("")
+        self.stdout.write(
+            self.style.SUCCESS(f"Warmed {len(interview_ids)} interview(s) in {elapsed:.2f}s")
+        )
+        self.stdout.write(f"  Estimated instruction tokens: {total_tokens}")
@@ -0,0 +1,66 @@
+# Generated by Django 5.2.18 on 2026-10-17 00:08
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interviews', '0008_rename_answers_json_to_answers_transcript'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='InterviewRollup',
+            fields=[
+                (
+                    'id',
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name='ID'
+                    ),
+                ),
+                (
+                    'kind',
+                    models.CharField(
+                        choices=[
+                            ('total', 'Total responses'),
+                            ('day', 'Responses per day'),
+                            ('option', 'Option selections'),
+                        ],
+                        max_length=10,
+                    ),
+                ),
+                ('day', models.DateField(blank=True, null=True)),
+                ('option', models.TextField(blank=True, default='')),
+                ('count', models.PositiveBigIntegerField(default=0)),
+                (
+                    'interview',
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='rollups',
+                        to='interviews.interview',
+                    ),
+                ),
+                (
+                    'question',
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='rollups',
+                        to='interviews.question',
+                    ),
+                ),
+            ],
+            options={
+                'constraints': [
+                    models.UniqueConstraint(
+                        fields=('interview', 'kind', 'question', 'day', 'option'),
+                        name='interview_rollup_key',
+                        nulls_distinct=False,
+                    )
+                ],
+            },
+        ),
+    ]
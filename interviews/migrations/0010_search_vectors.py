@@ -0,0 +1,26 @@
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+
+import interviews.models
+
+
+class Migration(migrations.Migration):
+    # Answer search uses a GIN index on the to_tsvector() expression rather than a STORED
+    # generated column: adding such a column rewrites the whole table under an ACCESS
+    # EXCLUSIVE lock, while CREATE INDEX CONCURRENTLY (which cannot run inside a
+    # transaction) keeps answers writable during the build.
+    atomic = False
+
+    dependencies = [
+        ('interviews', '0009_interview_rollup'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='answer',
+            index=django.contrib.postgres.indexes.GinIndex(
+                interviews.models.AnswerTextVector(), name='interviews_answer_search_gin'
+            ),
+        ),
+    ]
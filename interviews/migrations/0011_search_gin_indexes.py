@@ -0,0 +1,24 @@
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+
+import interviews.models
+
+
+class Migration(migrations.Migration):
+    # Same as 0010 for transcripts: an expression GIN index built CONCURRENTLY, so responses
+    # stay writable and the table is not rewritten.
+    atomic = False
+
+    dependencies = [
+        ('interviews', '0010_search_vectors'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='interviewresponse',
+            index=django.contrib.postgres.indexes.GinIndex(
+                interviews.models.TranscriptVector(), name='interviews_response_search_gin'
+            ),
+        ),
+    ]
@@ -0,0 +1,43 @@
+import django.contrib.postgres.indexes
+import django.db.models.functions.comparison
+import django.db.models.functions.text
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Indexes are built CONCURRENTLY, which cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('interviews', '0011_search_gin_indexes'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='candidate',
+            index=models.Index(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper(
+                        django.db.models.functions.comparison.Cast(
+                            'full_name', models.TextField()
+                        )
+                    ),
+                    name='text_pattern_ops',
+                ),
+                name='interviews_cand_name_prefix',
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name='candidate',
+            index=models.Index(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper(
+                        django.db.models.functions.comparison.Cast('email', models.TextField())
+                    ),
+                    name='text_pattern_ops',
+                ),
+                name='interviews_cand_email_prefix',
+            ),
+        ),
+    ]
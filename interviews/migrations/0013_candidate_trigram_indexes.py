@@ -0,0 +1,30 @@
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently, TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    # Indexes are built CONCURRENTLY, which cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('interviews', '0012_candidate_prefix_indexes'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        AddIndexConcurrently(
+            model_name='candidate',
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass('full_name', name='gin_trgm_ops'),
+                name='interviews_cand_name_trgm',
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name='candidate',
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass('email', name='gin_trgm_ops'),
+                name='interviews_cand_email_trgm',
+            ),
+        ),
+    ]
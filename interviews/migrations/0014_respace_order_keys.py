@@ -0,0 +1,36 @@
+from django.db import migrations
+
+# Spread existing positions ORDER_GAP (1024) apart, keeping the current (order, id)
+# sequence: sections within each interview, questions within each section.
+RESPACE_SECTIONS = """
+UPDATE interviews_section AS s
+SET "order" = r.position * 1024
+FROM (
+    SELECT id, row_number() OVER (PARTITION BY interview_id ORDER BY "order", id) AS position
+    FROM interviews_section
+) AS r
+WHERE s.id = r.id
+"""
+
+RESPACE_QUESTIONS = """
+UPDATE interviews_question AS q
+SET "order" = r.position * 1024
+FROM (
+    SELECT id, row_number() OVER (PARTITION BY section_id ORDER BY "order", id) AS position
+    FROM interviews_question
+    WHERE section_id IS NOT NULL
+) AS r
+WHERE q.id = r.id
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interviews', '0013_candidate_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.RunSQL(RESPACE_SECTIONS, migrations.RunSQL.noop),
+        migrations.RunSQL(RESPACE_QUESTIONS, migrations.RunSQL.noop),
+    ]
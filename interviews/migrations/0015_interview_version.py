@@ -0,0 +1,54 @@
+# Generated by Django 5.2.18 on 2026-10-17 00:35
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interviews', '0014_respace_order_keys'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='InterviewVersion',
+            fields=[
+                (
+                    'id',
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name='ID'
+                    ),
+                ),
+                ('content_hash', models.CharField(max_length=64)),
+                ('structure', models.JSONField()),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                (
+                    'interview',
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='versions',
+                        to='interviews.interview',
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddField(
+            model_name='interviewresponse',
+            name='version',
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.RESTRICT,
+                related_name='responses',
+                to='interviews.interviewversion',
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name='interviewversion',
+            constraint=models.UniqueConstraint(
+                fields=('interview', 'content_hash'), name='interview_version_hash'
+            ),
+        ),
+    ]
@@ -0,0 +1,33 @@
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+
+import interviews.models
+
+
+class Migration(migrations.Migration):
+    # Indexes are built CONCURRENTLY, which cannot run inside a transaction; responses stay
+    # writable while they are built.
+    atomic = False
+
+    dependencies = [
+        ('interviews', '0015_interview_version'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='interviewresponse',
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    'answers_transcript', name='jsonb_path_ops'
+                ),
+                name='interviews_resp_answers_gin',
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name='interviewresponse',
+            index=django.contrib.postgres.indexes.GinIndex(
+                interviews.models.SnapshotAnswersVector(), name='interviews_resp_answers_fts'
+            ),
+        ),
+    ]
@@ -0,0 +1,216 @@
+from django.db import migrations, transaction
+
+# Rows converted per transaction; each chunk commits on its own so no lock is held for
+# the whole run.
+CHUNK_SIZE = 2000
+
+
+class OptionIds:
+    """
+    Per-question label <-> id maps. Current options get ids 0..n-1 in their stored order;
+    labels found in answers but no longer configured get fresh ids and are kept as retired
+    options, so every stored selection stays decodable.
+
+    The maps are persisted on Question (option_ids, retired_options) before any row that
+    uses them: save() runs first, and flush() commits newly retired labels in the same
+    transaction as the chunk that introduced them. An interrupted run therefore leaves only
+    decodable ids behind, and a rerun starts from the persisted maps, so a label keeps the
+    id it was given.
+    """
+
+    def __init__(self, Question):
+        self.Question = Question
+        self.ids = {}
+        self.next_id = {}
+        self.retired = {}
+        self.dirty = set()
+        for pk, options, stored_ids, retired in Question.objects.values_list(
+            'pk', 'options', 'option_ids', 'retired_options'
+        ).iterator():
+            labels = [str(o) for o in options or []]
+            ids = list(stored_ids or [])
+            if len(ids) != len(labels):
+                ids = list(range(len(labels)))
+            # A label listed twice encodes to its first position
+            self.ids[pk] = {label: i for label, i in reversed(list(zip(labels, ids)))}
+            self.retired[pk] = {str(k): v for k, v in (retired or {}).items()}
+            for key, label in self.retired[pk].items():
+                self.ids[pk].setdefault(label, int(key))
+            self.next_id[pk] = max([*ids, *map(int, self.retired[pk]), -1]) + 1
+
+    def knows(self, question_id):
+        return question_id in self.ids
+
+    def encode(self, question_id, values):
+        ids = self.ids[question_id]
+        encoded = []
+        for value in dict.fromkeys(map(str, values or [])):
+            if value not in ids:
+                ids[value] = self.next_id[question_id]
+                self.next_id[question_id] = ids[value] + 1
+                self.retired[question_id][str(ids[value])] = value
+                self.dirty.add(question_id)
+            encoded.append(ids[value])
+        return encoded
+
+    def save(self, pks=None):
+        """Persist option_ids and retired_options for `pks` (default: every question)."""
+        rows = []
+        queryset = self.Question.objects.all()
+        if pks is not None:
+            queryset = queryset.filter(pk__in=pks)
+        for pk, options in queryset.values_list('pk', 'options').iterator():
+            labels = [str(o) for o in options or []]
+            question = self.Question(pk=pk)
+            question.option_ids = [self.ids[pk][label] for label in labels]
+            question.retired_options = self.retired[pk]
+            rows.append(question)
+        self.Question.objects.bulk_update(
+            rows, ['option_ids', 'retired_options'], batch_size=CHUNK_SIZE
+        )
+
+    def flush(self):
+        """Persist the questions that gained retired labels; call in the chunk's transaction."""
+        if self.dirty:
+            self.save(self.dirty)
+            self.dirty = set()
+
+
+def _chunks(queryset, *fields):
+    """Yield lists of value tuples (pk first) in primary-key order, CHUNK_SIZE at a time."""
+    last = 0
+    while True:
+        chunk = list(
+            queryset.filter(pk__gt=last).order_by('pk').values_list('pk', *fields)[:CHUNK_SIZE]
+        )
+        if not chunk:
+            return
+        last = chunk[-1][0]
+        yield chunk
+
+
+def _question_id(item):
+    try:
+        return int(item.get('question'))
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
+def encode(apps, schema_editor):
+    Question = apps.get_model('interviews', 'Question')
+    Answer = apps.get_model('interviews', 'Answer')
+    InterviewResponse = apps.get_model('interviews', 'InterviewResponse')
+    InterviewRollup = apps.get_model('interviews', 'InterviewRollup')
+    option_ids = OptionIds(Question)
+    # Ids of the configured options are committed before any row refers to them
+    with transaction.atomic():
+        option_ids.save()
+
+    for chunk in _chunks(
+        Answer.objects.exclude(selected_options=[]), 'question_id', 'selected_options'
+    ):
+        rows = [
+            Answer(pk=pk, selected_option_ids=option_ids.encode(qid, values))
+            for pk, qid, values in chunk
+        ]
+        with transaction.atomic():
+            option_ids.flush()
+            Answer.objects.bulk_update(rows, ['selected_option_ids'])
+
+    responses = InterviewResponse.objects.filter(answers_transcript__has_key='answers')
+    for chunk in _chunks(responses, 'answers_transcript'):
+        rows = []
+        for pk, snapshot in chunk:
+            items = snapshot.get('answers')
+            if not isinstance(items, list):
+                continue
+            # Items of deleted questions keep their labels: there is no question to hold ids
+            legacy = [
+                i
+                for i in items
+                if isinstance(i, dict)
+                and 'option_values' in i
+                and option_ids.knows(_question_id(i))
+            ]
+            for item in legacy:
+                item['option_ids'] = option_ids.encode(
+                    _question_id(item), item.pop('option_values')
+                )
+            if legacy:
+                rows.append(InterviewResponse(pk=pk, answers_transcript=snapshot))
+        with transaction.atomic():
+            option_ids.flush()
+            InterviewResponse.objects.bulk_update(rows, ['answers_transcript'])
+
+    with transaction.atomic():
+        # Labels that map to the same id (duplicate options) are merged into one counter
+        kept = {}
+        for rollup in InterviewRollup.objects.filter(
+            kind='option', option_id__isnull=True
+        ).order_by('pk'):
+            rollup.option_id = option_ids.encode(rollup.question_id, [rollup.option])[0]
+            key = (rollup.interview_id, rollup.question_id, rollup.option_id)
+            if key in kept:
+                kept[key].count += rollup.count
+                rollup.delete()
+            else:
+                kept[key] = rollup
+        option_ids.flush()
+        InterviewRollup.objects.bulk_update(kept.values(), ['option_id', 'count'])
+
+
+def decode(apps, schema_editor):
+    Question = apps.get_model('interviews', 'Question')
+    Answer = apps.get_model('interviews', 'Answer')
+    InterviewResponse = apps.get_model('interviews', 'InterviewResponse')
+    InterviewRollup = apps.get_model('interviews', 'InterviewRollup')
+    labels = {}
+    for pk, options, ids, retired in Question.objects.values_list(
+        'pk', 'options', 'option_ids', 'retired_options'
+    ).iterator():
+        labels[pk] = {int(k): v for k, v in (retired or {}).items()}
+        labels[pk].update(zip(ids or [], options or []))
+
+    def _decode(qid, ids):
+        known = labels.get(qid, {})
+        return [known[i] for i in ids or [] if i in known]
+
+    for chunk in _chunks(
+        Answer.objects.exclude(selected_option_ids=[]), 'question_id', 'selected_option_ids'
+    ):
+        rows = [Answer(pk=pk, selected_options=_decode(qid, ids)) for pk, qid, ids in chunk]
+        with transaction.atomic():
+            Answer.objects.bulk_update(rows, ['selected_options'])
+
+    responses = InterviewResponse.objects.filter(answers_transcript__has_key='answers')
+    for chunk in _chunks(responses, 'answers_transcript'):
+        rows = []
+        for pk, snapshot in chunk:
+            items = snapshot.get('answers')
+            if not isinstance(items, list):
+                continue
+            encoded = [i for i in items if isinstance(i, dict) and 'option_ids' in i]
+            for item in encoded:
+                item['option_values'] = _decode(_question_id(item), item.pop('option_ids'))
+            if encoded:
+                rows.append(InterviewResponse(pk=pk, answers_transcript=snapshot))
+        with transaction.atomic():
+            InterviewResponse.objects.bulk_update(rows, ['answers_transcript'])
+
+    rollups = list(InterviewRollup.objects.filter(kind='option'))
+    for rollup in rollups:
+        rollup.option = labels.get(rollup.question_id, {}).get(rollup.option_id, '')
+    InterviewRollup.objects.bulk_update(rollups, ['option'])
+
+
+class Migration(migrations.Migration):
+    # Converts in committed chunks (see CHUNK_SIZE) rather than one long transaction
+    atomic = False
+
+    dependencies = [
+        ('interviews', '0017_option_ids'),
+    ]
+
+    operations = [
+        migrations.RunPython(encode, decode),
+    ]
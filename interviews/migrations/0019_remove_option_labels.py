@@ -0,0 +1,31 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interviews', '0018_encode_option_ids'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='answer',
+            name='selected_options',
+        ),
+        migrations.RemoveConstraint(
+            model_name='interviewrollup',
+            name='interview_rollup_key',
+        ),
+        migrations.RemoveField(
+            model_name='interviewrollup',
+            name='option',
+        ),
+        migrations.AddConstraint(
+            model_name='interviewrollup',
+            constraint=models.UniqueConstraint(
+                fields=('interview', 'kind', 'question', 'day', 'option_id'),
+                name='interview_rollup_key',
+                nulls_distinct=False,
+            ),
+        ),
+    ]
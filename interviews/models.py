@@ -1,7 +1,66 @@
 from django.contrib.auth.models import User
-from django.db import models
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchConfig, SearchVectorField
+from django.db import models, transaction
+from django.db.models.fields.json import KeyTextTransform, KeyTransform
+from django.db.models.functions import Cast, Upper
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.utils import timezone
 
+from .cache import adjust_response_count, bump_interview_version
+
+# Text search configuration baked into the tsvector expression indexes (changing it needs a
+# migration that rebuilds them)
+SEARCH_CONFIG = 'english'
+
+
+class AnswerTextVector(models.Func):
+    """
+    tsvector of Answer.answer_text. Backs the expression GIN index on Answer; search filters
+    on this same expression so the planner can use the index.
+    """
+
+    function = 'to_tsvector'
+    output_field = SearchVectorField()
+
+    def __init__(self, **extra):
+        super().__init__(SearchConfig(SEARCH_CONFIG), models.F('answer_text'), **extra)
+
+
+class TranscriptVector(models.Func):
+    """
+    tsvector of a response's answers_transcript -> 'transcript'. Backs the expression GIN
+    index on InterviewResponse.
+    """
+
+    function = 'to_tsvector'
+    output_field = SearchVectorField()
+
+    def __init__(self, **extra):
+        super().__init__(
+            SearchConfig(SEARCH_CONFIG),
+            KeyTextTransform('transcript', 'answers_transcript'),
+            **extra,
+        )
+
+
+class SnapshotAnswersVector(models.Func):
+    """
+    tsvector of the string values (answer texts; selections are stored as option ids) of a
+    response's answers_transcript -> 'answers'. Backs a functional GIN index, so answer search works
+    when answers are only stored in the snapshot (ANSWER_STORAGE = "json").
+    """
+
+    function = 'to_tsvector'
+    output_field = SearchVectorField()
+
+    def __init__(self, **extra):
+        super().__init__(
+            SearchConfig(SEARCH_CONFIG), KeyTransform('answers', 'answers_transcript'), **extra
+        )
+
 
 class Interview(models.Model):
     """Interview Form - similar to Google Forms"""
@@ -23,9 +82,12 @@ class Interview(models.Model):
     def questions(self):
         """
         Compatibility shim after removing Question.interview FK.
-        Returns a QuerySet of Questions belonging to this interview via Sections.
+        Returns a QuerySet of Questions belonging to this interview via Sections,
+        in display order (section order, then question order within each section).
         """
-        return Question.objects.filter(section__interview=self)
+        return Question.objects.filter(section__interview=self).order_by(
+            'section__order', 'section_id', 'order', 'id'
+        )
 
 
 class Section(models.Model):
@@ -34,6 +96,7 @@ class Section(models.Model):
     interview = models.ForeignKey(Interview, on_delete=models.CASCADE, related_name='sections')
     title = models.CharField(max_length=255)
     description = models.TextField(blank=True)
+    # Position within the interview: gap-spaced keys (see interviews.ordering)
     order = models.IntegerField(default=0)
 
     class Meta:
@@ -59,10 +122,15 @@ class Question(models.Model):
     question_text = models.TextField()
     question_type = models.CharField(max_length=20, choices=QUESTION_TYPES, default='text')
     is_required = models.BooleanField(default=True)
-    # Global order across the interview (kept for backward compatibility)
+    # Position within the section: gap-spaced keys (see interviews.ordering)
     order = models.IntegerField(default=0)
     # For multiple_choice questions, store options inline as an ordered list of strings
     options = models.JSONField(default=list, blank=True)
+    # Stable small-integer id of each entry of `options` (same length and order). Answers
+    # store these ids, so options can be renamed and reordered without touching them.
+    option_ids = ArrayField(models.PositiveSmallIntegerField(), default=list, blank=True)
+    # Labels of removed options by id, so older answers still decode and ids are never reused
+    retired_options = models.JSONField(default=dict, blank=True)
 
     class Meta:
         ordering = ['order']
@@ -78,6 +146,76 @@ class Question(models.Model):
             prefix = "Question"
         return f"{prefix} - Q{self.order}: {self.question_text[:50]}"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        if 'options' in instance.__dict__ and 'option_ids' in instance.__dict__:
+            instance._stored_options = (list(instance.options or []), list(instance.option_ids))
+        return instance
+
+    def refresh_from_db(self, *args, **kwargs):
+        super().refresh_from_db(*args, **kwargs)
+        if 'options' in self.__dict__ and 'option_ids' in self.__dict__:
+            self._stored_options = (list(self.options or []), list(self.option_ids))
+
+    def save(self, *args, **kwargs):
+        options, option_ids = list(self.options or []), list(self.option_ids or [])
+        stored = getattr(self, '_stored_options', None)
+        # `options` edited without going through add_option/remove_option
+        replaced = stored is not None and options != stored[0] and option_ids == stored[1]
+        if replaced or len(option_ids) != len(options):
+            self.sync_option_ids(stored)
+            update_fields = kwargs.get('update_fields')
+            if update_fields is not None:
+                kwargs['update_fields'] = set(update_fields) | {'option_ids', 'retired_options'}
+        super().save(*args, **kwargs)
+        self._stored_options = (list(self.options or []), list(self.option_ids))
+
+    def _next_option_id(self, *taken) -> int:
+        used = set(self.option_ids or []) | {int(k) for k in self.retired_options or {}}
+        for ids in taken:
+            used |= set(ids)
+        return max(used, default=-1) + 1
+
+    def add_option(self, label: str) -> int:
+        """Append an option with a fresh id and return that id."""
+        option_id = self._next_option_id()
+        self.options = list(self.options or []) + [label]
+        self.option_ids = list(self.option_ids or []) + [option_id]
+        return option_id
+
+    def remove_option(self, index: int) -> None:
+        """Remove the option at `index`, keeping its label for decoding older answers."""
+        options, option_ids = list(self.options or []), list(self.option_ids or [])
+        label, option_id = options.pop(index), option_ids.pop(index)
+        self.retired_options = {**(self.retired_options or {}), str(option_id): label}
+        self.options, self.option_ids = options, option_ids
+
+    def sync_option_ids(self, stored=None) -> None:
+        """
+        Give `options` ids after it was replaced wholesale (admin, fixtures, scripts): labels
+        that were already stored keep their id, new ones get fresh ids, dropped ones retire.
+        `stored` is the saved (options, option_ids), read from the database when not given.
+        """
+        if stored is None and self.pk is not None:
+            stored = (
+                Question.objects.filter(pk=self.pk).values_list('options', 'option_ids').first()
+            )
+        previous = {}
+        if stored and len(stored[0] or []) == len(stored[1] or []):
+            previous = {str(label): oid for label, oid in zip(stored[0] or [], stored[1] or [])}
+        retired = dict(self.retired_options or {})
+        ids = []
+        for label in self.options or []:
+            option_id = previous.get(str(label))
+            if option_id is None or option_id in ids:
+                option_id = self._next_option_id(ids, previous.values())
+            ids.append(option_id)
+        for label, option_id in previous.items():
+            if option_id not in ids:
+                retired[str(option_id)] = label
+        self.option_ids, self.retired_options = ids, retired
+
 
 class Candidate(models.Model):
     """Normalized candidate entity, shared across multiple interview responses."""
@@ -91,11 +229,55 @@ class Candidate(models.Model):
 
     class Meta:
         ordering = ['full_name', 'email']
+        indexes = [
+            # Prefix indexes on the exact expression Django emits for istartswith
+            # (UPPER(col::text) LIKE 'x%'), so admin search on candidates is index-backed
+            models.Index(
+                OpClass(Upper(Cast('full_name', models.TextField())), name='text_pattern_ops'),
+                name='interviews_cand_name_prefix',
+            ),
+            models.Index(
+                OpClass(Upper(Cast('email', models.TextField())), name='text_pattern_ops'),
+                name='interviews_cand_email_prefix',
+            ),
+            # Trigram indexes for fuzzy (typo-tolerant) lookup, see interviews/candidate_search.py
+            GinIndex(OpClass('full_name', name='gin_trgm_ops'), name='interviews_cand_name_trgm'),
+            GinIndex(OpClass('email', name='gin_trgm_ops'), name='interviews_cand_email_trgm'),
+        ]
 
     def __str__(self):
         return f"{self.full_name} <{self.email}>"
 
 
+class InterviewVersion(models.Model):
+    """
+    Immutable, content-addressed copy of an interview's structure as candidates saw it
+    (see interviews/versions.py). Responses reference the version they were submitted
+    against, so their snapshots only need question ids. Rows are never updated.
+    """
+
+    interview = models.ForeignKey(Interview, on_delete=models.CASCADE, related_name='versions')
+    # sha256 of the canonical JSON of `structure`
+    content_hash = models.CharField(max_length=64)
+    structure = models.JSONField()
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['interview', 'content_hash'], name='interview_version_hash'
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.interview_id}@{self.content_hash[:12]}"
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding:
+            raise ValueError("Published interview versions are immutable")
+        super().save(*args, **kwargs)
+
+
 class InterviewResponse(models.Model):
     """Candidate's response to an interview"""
 
@@ -109,14 +291,29 @@ class InterviewResponse(models.Model):
         related_name='responses',
         db_index=True,
     )
+    # Published structure the response was submitted against (null for older responses)
+    version = models.ForeignKey(
+        InterviewVersion,
+        null=True,
+        blank=True,
+        on_delete=models.RESTRICT,
+        related_name='responses',
+    )
     submitted_at = models.DateTimeField(default=timezone.now)
-    # JSON snapshot: answers + transcript + source (denormalized for export/render)
+    # JSON snapshot: answers (by question id) + transcript + source
     answers_transcript = models.JSONField(default=dict, blank=True)
 
     class Meta:
         ordering = ['-submitted_at']
         indexes = [
             models.Index(fields=['interview', 'submitted_at']),
+            GinIndex(TranscriptVector(), name='interviews_response_search_gin'),
+            # Containment queries on the answer snapshot (see interviews/answers.py)
+            GinIndex(
+                OpClass('answers_transcript', name='jsonb_path_ops'),
+                name='interviews_resp_answers_gin',
+            ),
+            GinIndex(SnapshotAnswersVector(), name='interviews_resp_answers_fts'),
         ]
 
     def __str__(self):
@@ -144,12 +341,13 @@ class Answer(models.Model):
     )
     question = models.ForeignKey(Question, on_delete=models.CASCADE)
     answer_text = models.TextField(blank=True)
-    # For non-text questions, capture selected option values (strings) if applicable
-    selected_options = models.JSONField(default=list, blank=True)
+    # For multiple_choice questions, the ids (Question.option_ids) of the selected options
+    selected_option_ids = ArrayField(models.PositiveSmallIntegerField(), default=list, blank=True)
 
     class Meta:
         indexes = [
             models.Index(fields=['response', 'question']),
+            GinIndex(AnswerTextVector(), name='interviews_answer_search_gin'),
         ]
 
     def __str__(self):
@@ -159,3 +357,92 @@ class Answer(models.Model):
             else "Unknown"
         )
         return f"{person} - {self.question.question_text[:30]}"
+
+
+class InterviewRollup(models.Model):
+    """
+    Incrementally maintained counters for an interview's responses: one total row, one row
+    per submission day and one row per (multiple-choice question, option). Updated in the
+    submit transaction (see interviews/rollups.py), rebuilt with `rebuild_rollups`.
+    """
+
+    KIND_CHOICES = [
+        ('total', 'Total responses'),
+        ('day', 'Responses per day'),
+        ('option', 'Option selections'),
+    ]
+
+    interview = models.ForeignKey(Interview, on_delete=models.CASCADE, related_name='rollups')
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES)
+    question = models.ForeignKey(
+        Question, null=True, blank=True, on_delete=models.CASCADE, related_name='rollups'
+    )
+    day = models.DateField(null=True, blank=True)
+    # Question.option_ids entry counted by an 'option' row
+    option_id = models.PositiveSmallIntegerField(null=True, blank=True)
+    count = models.PositiveBigIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['interview', 'kind', 'question', 'day', 'option_id'],
+                name='interview_rollup_key',
+                nulls_distinct=False,
+            ),
+        ]
+
+    def __str__(self):
+        label = self.option_id if self.kind == 'option' else self.day or self.kind
+        return f"{self.interview_id}:{self.kind}:{label} = {self.count}"
+
+
+@receiver([post_save, post_delete], sender=Interview)
+@receiver([post_save, post_delete], sender=Section)
+@receiver([post_save, post_delete], sender=Question)
+def bump_interview_structure_version(sender, instance, **kwargs):
+    """
+    Rotate the interview's version token whenever its structure changes (builder AJAX
+    actions, admin saves, deletes) so cached snapshots are rebuilt on next read.
+    Section and question changes also move Interview.updated_at, which candidate pages
+    send as Last-Modified.
+    The bump runs on commit, so readers never cache uncommitted structure.
+    Skip during fixture loading (raw saves).
+    """
+    if kwargs.get('raw', False):
+        return
+    if sender is Interview:
+        interview_id = instance.pk
+    elif sender is Section:
+        interview_id = instance.interview_id
+    else:
+        interview_id = (
+            Section.objects.filter(pk=instance.section_id)
+            .values_list('interview_id', flat=True)
+            .first()
+            if instance.section_id
+            else None
+        )
+    if interview_id is None:
+        return
+    if sender is not Interview:
+        Interview.objects.filter(pk=interview_id).update(updated_at=timezone.now())
+    transaction.on_commit(lambda: bump_interview_version(interview_id))
+
+
+@receiver(post_save, sender=InterviewResponse)
+@receiver(post_delete, sender=InterviewResponse)
+def adjust_cached_response_count(sender, instance, created=False, **kwargs):
+    """
+    Keep the per-interview response counter (see get_response_count) in step with
+    inserts and deletes once they commit.
+    """
+    if kwargs.get('raw', False):
+        return
+    if kwargs.get('signal') is post_delete:
+        delta = -1
+    elif created:
+        delta = 1
+    else:
+        return
+    interview_id = instance.interview_id
+    transaction.on_commit(lambda: adjust_response_count(interview_id, delta))
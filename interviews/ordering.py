@@ -0,0 +1,75 @@
+"""
+Gap-based ordering keys for sections and questions.
+
+Sections are ordered within their interview and questions within their section, by
+(order, id). Keys are spaced ORDER_GAP apart, so appending or moving a row to a new
+position writes that row only: it takes a key between its new neighbours. Only when two
+neighbours have no integer left between them is the sibling list respaced, which writes
+just the rows whose key actually changes.
+"""
+
+from typing import List, Optional, Sequence
+
+ORDER_GAP = 1024
+
+
+def sort_key(row) -> tuple:
+    """(order, id) with unsaved rows after saved ones that share their key."""
+    return (row.order, row.pk is None, row.pk or 0)
+
+
+def key_between(before: Optional[int], after: Optional[int]) -> Optional[int]:
+    """
+    A key strictly between two neighbouring keys (either may be None at the ends), or None
+    when they are adjacent or equal and the siblings need respacing.
+    """
+    if before is None and after is None:
+        return ORDER_GAP
+    if after is None:
+        return before + ORDER_GAP
+    if before is None:
+        return after - ORDER_GAP
+    if after - before > 1:
+        return (before + after) // 2
+    return None
+
+
+def respace(rows: Sequence) -> List:
+    """Give `rows` keys ORDER_GAP apart in their current sequence; return those changed."""
+    changed = []
+    for position, row in enumerate(rows, start=1):
+        key = position * ORDER_GAP
+        if row.order != key:
+            row.order = key
+            changed.append(row)
+    return changed
+
+
+def insert_at(siblings: Sequence, row, index: int) -> List:
+    """
+    Position `row` at `index` among `siblings` (sorted, not containing `row`) and return the
+    rows whose key changed: normally just `row`, or the respaced siblings.
+    """
+    index = max(0, min(int(index), len(siblings)))
+    before = siblings[index - 1].order if index > 0 else None
+    after = siblings[index].order if index < len(siblings) else None
+    key = key_between(before, after)
+    if key is None:
+        return respace(list(siblings[:index]) + [row] + list(siblings[index:]))
+    row.order = key
+    return [row]
+
+
+def append_key(siblings: Sequence) -> int:
+    """Key placing a row after every one of `siblings`."""
+    return key_between(max((s.order for s in siblings), default=None), None)
+
+
+__all__ = [
+    "ORDER_GAP",
+    "append_key",
+    "insert_at",
+    "key_between",
+    "respace",
+    "sort_key",
+]
@@ -0,0 +1,165 @@
+"""
+Pagination helpers for large tables.
+
+Keyset (cursor) pagination for newest-first listings ordered by (timestamp, id): a cursor
+is an opaque url-safe token holding the sort key of the row at a page boundary, so each
+page is a bounded range scan on the (parent, timestamp) index however deep the reader
+pages, where OFFSET would read and discard every earlier row.
+
+EstimatedCountPaginator replaces the exact COUNT(*) of Django's paginator with the
+planner's row estimate once a result set is known to be large.
+"""
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import Q, QuerySet
+from django.utils.functional import cached_property
+
+
+@dataclass(frozen=True)
+class KeysetPage:
+    items: List[Any]
+    # Cursor for older rows (pass as ?after=), None on the last page
+    next_cursor: Optional[str]
+    # Cursor for newer rows (pass as ?before=), None on the first page
+    prev_cursor: Optional[str]
+
+
+def pack_cursor(*parts: Any) -> str:
+    """Encode sort-key parts into an opaque url-safe token."""
+    raw = "|".join(str(p) for p in parts).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def unpack_cursor(token: Optional[str], count: int) -> Optional[List[str]]:
+    """Split a token from pack_cursor into `count` string parts, or None if malformed."""
+    if not token:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)).decode("utf-8")
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        return None
+    parts = raw.rsplit("|", count - 1)
+    return parts if len(parts) == count else None
+
+
+def encode_cursor(value: datetime, pk: int) -> str:
+    return pack_cursor(value.isoformat(), pk)
+
+
+def decode_cursor(token: Optional[str]) -> Optional[Tuple[datetime, int]]:
+    """Return (value, pk) for a cursor token, or None when missing or malformed."""
+    parts = unpack_cursor(token, 2)
+    if parts is None:
+        return None
+    try:
+        return datetime.fromisoformat(parts[0]), int(parts[1])
+    except ValueError:
+        return None
+
+
+def keyset_page(
+    queryset: QuerySet,
+    field: str,
+    size: int,
+    after: Optional[str] = None,
+    before: Optional[str] = None,
+) -> KeysetPage:
+    """
+    Return one page of `queryset` ordered newest first by (`field`, pk).
+    `after` continues towards older rows, `before` goes back towards newer ones; invalid
+    cursors fall back to the first page. Fetches size + 1 rows to detect a further page.
+    """
+    key = decode_cursor(before)
+    if key is not None:
+        value, pk = key
+        rows = list(
+            queryset.filter(
+                Q(**{f"{field}__gt": value}) | Q(**{field: value, "pk__gt": pk})
+            ).order_by(field, "pk")[: size + 1]
+        )
+        has_newer = len(rows) > size
+        items = rows[:size][::-1]
+        return KeysetPage(
+            items=items,
+            next_cursor=_cursor(items[-1], field) if items else None,
+            prev_cursor=_cursor(items[0], field) if has_newer else None,
+        )
+
+    key = decode_cursor(after)
+    if key is not None:
+        value, pk = key
+        queryset = queryset.filter(Q(**{f"{field}__lt": value}) | Q(**{field: value, "pk__lt": pk}))
+    rows = list(queryset.order_by(f"-{field}", "-pk")[: size + 1])
+    items = rows[:size]
+    return KeysetPage(
+        items=items,
+        next_cursor=_cursor(items[-1], field) if len(rows) > size else None,
+        prev_cursor=_cursor(items[0], field) if key is not None and items else None,
+    )
+
+
+def _cursor(obj: Any, field: str) -> str:
+    return encode_cursor(getattr(obj, field), obj.pk)
+
+
+def estimate_count(queryset: QuerySet) -> Optional[int]:
+    """
+    Cheap row-count estimate for a queryset on Postgres: pg_class.reltuples for an
+    unfiltered table, otherwise the planner's row estimate from EXPLAIN. None elsewhere
+    or when no statistics exist yet.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return None
+    if not queryset.query.where:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                [queryset.model._meta.db_table],
+            )
+            row = cursor.fetchone()
+        if row and row[0] >= 0:
+            return int(row[0])
+    try:
+        plan = json.loads(queryset.order_by().explain(format="json"))
+        return int(plan[0]["Plan"]["Plan Rows"])
+    except (KeyError, IndexError, TypeError, ValueError):
+        return None
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator that counts exactly while results are small and switches to the Postgres
+    estimate above `exact_threshold` rows, where an exact COUNT(*) would scan the table.
+    Page links beyond the estimate simply come back empty.
+    """
+
+    exact_threshold = 10000
+
+    @cached_property
+    def count(self) -> int:
+        if isinstance(self.object_list, QuerySet):
+            estimate = estimate_count(self.object_list)
+            if estimate is not None and estimate > self.exact_threshold:
+                return estimate
+        return super().count
+
+
+__all__ = [
+    "EstimatedCountPaginator",
+    "KeysetPage",
+    "decode_cursor",
+    "encode_cursor",
+    "estimate_count",
+    "keyset_page",
+    "pack_cursor",
+    "unpack_cursor",
+]
@@ -1,27 +1,29 @@
+from dataclasses import dataclass
 from typing import List
 
+from django.conf import settings
+
+from .cache import LRUCache, two_tier_get
+from .snapshots import InterviewSnapshot, get_interview_snapshot
+
+_local = LRUCache(getattr(settings, "INTERVIEW_SNAPSHOT_LRU_SIZE", 256))
+
 
 def _questions_block_for_interview(interview) -> str:
     """
     Build a human-readable questions block grouped by sections, in strict order.
+    Reads the cached interview snapshot, so no queries are issued once it is warm.
     """
+    snapshot = interview
+    if not isinstance(snapshot, InterviewSnapshot):
+        snapshot = get_interview_snapshot(interview.pk)
     lines: List[str] = []
     idx = 1
-    try:
-        sections = list(interview.sections.all().order_by("order", "id"))
-    except Exception:
-        sections = []
-    for s in sections:
+    for s in snapshot.sections if snapshot else ():
         lines.append(f"Section: {s.title}")
-        try:
-            qtexts = list(
-                s.questions.all().order_by("order", "id").values_list("question_text", flat=True)
-            )
-        except Exception:
-            qtexts = []
-        if qtexts:
-            for q in qtexts:
-                lines.append(f"{idx}. {q}")
+        if s.questions:
+            for q in s.questions:
+                lines.append(f"{idx}. {q.question_text}")
                 idx += 1
         else:
             lines.append(f"{idx}. (no questions)")
@@ -64,6 +66,46 @@ def build_realtime_instructions(interview=None) -> str:
     )
 
 
+@dataclass(frozen=True)
+class RealtimeInstructions:
+    """Generated session instructions plus their approximate prompt size."""
+
+    text: str
+    estimated_tokens: int
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Cheap token estimate for English prompt text (~4 characters per token).
+    """
+    return max(1, (len(text or "") + 3) // 4)
+
+
+def _instructions(text: str) -> RealtimeInstructions:
+    return RealtimeInstructions(text=text, estimated_tokens=estimate_tokens(text))
+
+
+def get_realtime_instructions(interview=None) -> RealtimeInstructions:
+    """
+    Memoized build_realtime_instructions.
+    Cached per interview version in the two-tier cache; editing the interview rotates its
+    version, which invalidates the cached instructions along with the snapshot.
+    """
+    snapshot = interview
+    if interview is not None and not isinstance(interview, InterviewSnapshot):
+        snapshot = get_interview_snapshot(interview.pk)
+    if snapshot is None:
+        key = "interviews:instructions:generic"
+    else:
+        key = f"interviews:instructions:{snapshot.id}:{snapshot.version}"
+    return two_tier_get(
+        _local,
+        key,
+        lambda: _instructions(build_realtime_instructions(snapshot)),
+        timeout=getattr(settings, "INTERVIEW_SNAPSHOT_TIMEOUT", 86400),
+    )
+
+
 def verbatim_question_template() -> str:
     """
     Template used client-side to force the model to speak only the exact question text.
@@ -92,7 +134,10 @@ def first_utterance_template() -> str:
 
 
 __all__ = [
+    "RealtimeInstructions",
     "build_realtime_instructions",
+    "estimate_tokens",
+    "get_realtime_instructions",
     "verbatim_question_template",
     "first_utterance_template",
 ]
@@ -0,0 +1,187 @@
+"""
+Per-interview rollups: response totals, submissions per day and option selection counts.
+
+Submissions bump the counters inside their own transaction with F() increments, so
+dashboards read a handful of InterviewRollup rows instead of scanning Answer. Counter
+rows are created on first use (INSERT ... ON CONFLICT DO NOTHING), then locked in primary
+key order before the single UPDATE so concurrent submissions cannot deadlock.
+Deleted responses are not subtracted; `manage.py rebuild_rollups` recomputes from scratch.
+"""
+
+from collections import Counter
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from .models import Answer, InterviewResponse, InterviewRollup, Question
+
+# (kind, question_id, day, option_id)
+RollupKey = Tuple[str, Optional[int], Optional[date], Optional[int]]
+
+
+def _day(submitted_at: datetime) -> date:
+    return (
+        timezone.localdate(submitted_at) if timezone.is_aware(submitted_at) else submitted_at.date()
+    )
+
+
+def submission_keys(answers: Iterable[Dict[str, Any]], submitted_at: datetime) -> List[RollupKey]:
+    """Counter keys one submission increments: total, its day, and every selected option."""
+    keys: List[RollupKey] = [("total", None, None, None), ("day", None, _day(submitted_at), None)]
+    for item in answers or []:
+        for option_id in dict.fromkeys(item.get("option_ids") or []):
+            keys.append(("option", item["question"], None, option_id))
+    return keys
+
+
+def _key_filter(keys: Iterable[RollupKey]) -> Q:
+    condition = Q()
+    for kind, question_id, day, option_id in keys:
+        condition |= Q(kind=kind, question_id=question_id, day=day, option_id=option_id)
+    return condition
+
+
+def record_submission(
+    interview_id: int, answers: Iterable[Dict[str, Any]], submitted_at: datetime
+) -> None:
+    """
+    Increment the rollups for one submission (three queries). Must run in the transaction
+    that inserts the response, so the counters commit or roll back with it.
+    """
+    keys = submission_keys(answers, submitted_at)
+    InterviewRollup.objects.bulk_create(
+        [
+            InterviewRollup(
+                interview_id=interview_id, kind=kind, question_id=qid, day=day, option_id=option_id
+            )
+            for kind, qid, day, option_id in keys
+        ],
+        ignore_conflicts=True,
+    )
+    rows = InterviewRollup.objects.filter(_key_filter(keys), interview_id=interview_id)
+    ids = list(rows.select_for_update().order_by("pk").values_list("pk", flat=True))
+    InterviewRollup.objects.filter(pk__in=ids).update(count=F("count") + 1)
+
+
+def _response_options(
+    response_ids: List[int], transcripts: Dict[int, Dict[str, Any]], mc_questions: set
+) -> Counter:
+    """Option selection counts for a chunk, from Answer rows or the transcript fallback."""
+    counts: Counter = Counter()
+    for response_id, question_id, option_ids in Answer.objects.filter(
+        response_id__in=response_ids, question_id__in=mc_questions
+    ).values_list("response_id", "question_id", "selected_option_ids"):
+        for option_id in dict.fromkeys(option_ids or []):
+            counts[(question_id, option_id)] += 1
+    has_answers = set(
+        Answer.objects.filter(response_id__in=response_ids)
+        .values_list("response_id", flat=True)
+        .distinct()
+    )
+    for response_id, snapshot in transcripts.items():
+        if response_id in has_answers:
+            continue
+        for item in (snapshot or {}).get("answers") or []:
+            qid = item.get("question")
+            if qid in mc_questions:
+                for option_id in dict.fromkeys(item.get("option_ids") or []):
+                    counts[(qid, option_id)] += 1
+    return counts
+
+
+def _scan_responses(
+    interview_id: int, mc_questions: set, after_id: int, chunk_size: int
+) -> Tuple[int, Counter, Counter, int]:
+    """Count responses with pk > after_id in primary-key chunks: (total, days, options, last pk)."""
+    days: Counter = Counter()
+    options: Counter = Counter()
+    total = 0
+    while True:
+        chunk = list(
+            InterviewResponse.objects.filter(interview_id=interview_id, pk__gt=after_id)
+            .order_by("pk")
+            .values_list("pk", "submitted_at", "answers_transcript")[:chunk_size]
+        )
+        if not chunk:
+            return total, days, options, after_id
+        after_id = chunk[-1][0]
+        total += len(chunk)
+        days.update(_day(submitted_at) for _, submitted_at, _ in chunk)
+        if mc_questions:
+            options.update(
+                _response_options(
+                    [pk for pk, _, _ in chunk], {pk: t for pk, _, t in chunk}, mc_questions
+                )
+            )
+
+
+def rebuild_interview_rollups(interview_id: int, chunk_size: int = 2000) -> int:
+    """
+    Recompute one interview's rollups from its responses, walking them in primary-key
+    chunks outside any transaction. The swap happens in one short transaction that also
+    counts responses committed while the scan ran. Returns the number of responses counted.
+    """
+    mc_questions = set(
+        Question.objects.filter(
+            section__interview_id=interview_id, question_type="multiple_choice"
+        ).values_list("id", flat=True)
+    )
+    total, days, options, last_id = _scan_responses(interview_id, mc_questions, 0, chunk_size)
+
+    with transaction.atomic():
+        InterviewRollup.objects.filter(interview_id=interview_id).delete()
+        tail_total, tail_days, tail_options, _ = _scan_responses(
+            interview_id, mc_questions, last_id, chunk_size
+        )
+        total += tail_total
+        days.update(tail_days)
+        options.update(tail_options)
+
+        rows = [InterviewRollup(interview_id=interview_id, kind="total", count=total)]
+        rows += [
+            InterviewRollup(interview_id=interview_id, kind="day", day=day, count=count)
+            for day, count in days.items()
+        ]
+        rows += [
+            InterviewRollup(
+                interview_id=interview_id,
+                kind="option",
+                question_id=qid,
+                option_id=option_id,
+                count=count,
+            )
+            for (qid, option_id), count in options.items()
+        ]
+        InterviewRollup.objects.bulk_create(rows, batch_size=1000)
+    return total
+
+
+def get_interview_rollup(interview_id: int) -> Dict[str, Any]:
+    """
+    Read an interview's rollups (one query): total responses, per-day counts (oldest
+    first) and per-question counts keyed by option id.
+    """
+    total = 0
+    daily = []
+    options: Dict[int, Dict[int, int]] = {}
+    for row in InterviewRollup.objects.filter(interview_id=interview_id).order_by(
+        "kind", "day", "question_id", "-count", "option_id"
+    ):
+        if row.kind == "total":
+            total = row.count
+        elif row.kind == "day":
+            daily.append((row.day, row.count))
+        else:
+            options.setdefault(row.question_id, {})[row.option_id] = row.count
+    return {"total": total, "daily": daily, "options": options}
+
+
+__all__ = [
+    "get_interview_rollup",
+    "rebuild_interview_rollups",
+    "record_submission",
+    "submission_keys",
+]
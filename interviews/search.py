@@ -0,0 +1,286 @@
+"""
+Full-text search over an interview's answers and conversation transcripts.
+
+Both sources are matched through expression GIN indexes (AnswerTextVector on Answer,
+TranscriptVector on InterviewResponse), so matching never scans text.
+With ANSWER_STORAGE = "json", answers stored only in the response snapshot are matched
+through the functional GIN index on SnapshotAnswersVector instead. Hits from all sources
+are merged into one ranking (ts_rank, then kind, then id) and paged with a keyset cursor
+on that ordering; headlines are only computed for the rows of the page.
+"""
+
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional
+
+from django.contrib.postgres.search import SearchHeadline, SearchQuery, SearchRank
+from django.db.models import F, FloatField, Q, QuerySet, Value
+from django.db.models.fields.json import KeyTextTransform, KeyTransform
+from django.db.models.functions import Cast
+from django.utils.html import escape
+
+from .answers import storage_mode
+from .models import (
+    SEARCH_CONFIG,
+    Answer,
+    AnswerTextVector,
+    InterviewResponse,
+    SnapshotAnswersVector,
+    TranscriptVector,
+)
+from .pagination import pack_cursor, unpack_cursor
+from .versions import get_published_version
+
+# Control characters used as highlight delimiters, so stored text can be HTML-escaped
+# before the <mark> tags are inserted
+_START_SEL = "\x02"
+_STOP_SEL = "\x03"
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    # "answer", "snapshot" (an answer stored only in the response snapshot; id is the
+    # response's) or "transcript"
+    kind: str
+    id: int
+    response_id: int
+    rank: float
+    # HTML-escaped excerpt with matches wrapped in <mark>
+    headline: str
+    question_id: Optional[int]
+    question_text: str
+    candidate_name: str
+    candidate_email: str
+    submitted_at: datetime
+
+
+@dataclass(frozen=True)
+class SearchPage:
+    hits: List[SearchHit]
+    # Pass as ?after= for the next page, None on the last page
+    next_cursor: Optional[str]
+
+
+@dataclass(frozen=True)
+class _SnapshotQuestion:
+    pk: Optional[int]
+    question_text: str
+
+
+def build_search_query(text: str) -> Optional[SearchQuery]:
+    """Parse user input with websearch syntax ("quoted phrases", or, -excluded)."""
+    text = (text or "").strip()
+    if not text:
+        return None
+    return SearchQuery(text, search_type="websearch", config=SEARCH_CONFIG)
+
+
+def _highlight(headline: Optional[str]) -> str:
+    return escape(headline or "").replace(_START_SEL, "<mark>").replace(_STOP_SEL, "</mark>")
+
+
+def _after(kind: str, cursor: Optional[tuple]) -> Q:
+    """Rows ranked strictly after the cursor, within one branch of constant `kind`."""
+    if cursor is None:
+        return Q()
+    rank, cursor_kind, pk = cursor
+    if kind > cursor_kind:
+        return Q(rank__lte=rank)
+    if kind == cursor_kind:
+        return Q(rank__lt=rank) | Q(rank=rank, pk__lt=pk)
+    return Q(rank__lt=rank)
+
+
+def _decode(token: Optional[str]) -> Optional[tuple]:
+    parts = unpack_cursor(token, 3)
+    if parts is None:
+        return None
+    try:
+        return float(parts[0]), parts[1], int(parts[2])
+    except ValueError:
+        return None
+
+
+def _snapshot_match(headline: Optional[str]) -> tuple:
+    """(question id, highlighted text) of the first snapshot answer item with a match."""
+    try:
+        items = json.loads(headline or "[]")
+    except ValueError:
+        return None, ""
+    for item in items if isinstance(items, list) else []:
+        if not isinstance(item, dict):
+            continue
+        value = item.get("text")
+        if isinstance(value, str) and _START_SEL in value:
+            question = item.get("question")
+            return (question if isinstance(question, int) else None), value
+    return None, ""
+
+
+def _ranked(queryset: QuerySet, vector: str, kind: str, query: SearchQuery, cursor) -> QuerySet:
+    return (
+        queryset.filter(**{vector: query})
+        # ts_rank is float4; compare and return it as float8 so cursor values round-trip
+        .annotate(rank=Cast(SearchRank(F(vector), query), FloatField()), kind=Value(kind))
+        .filter(_after(kind, cursor))
+        .values("id", "rank", "kind")
+        .order_by()
+    )
+
+
+def search_responses(
+    interview_id: int, text: str, size: int = 20, after: Optional[str] = None
+) -> SearchPage:
+    """
+    Return one page of ranked hits for `text` among an interview's answers and transcripts
+    (at most three queries: the merged ranking, then answer and transcript details).
+    """
+    query = build_search_query(text)
+    if query is None:
+        return SearchPage(hits=[], next_cursor=None)
+    cursor = _decode(after)
+
+    answers = _ranked(
+        Answer.objects.filter(response__interview_id=interview_id).alias(
+            answer_vector=AnswerTextVector()
+        ),
+        "answer_vector",
+        "answer",
+        query,
+        cursor,
+    )
+    transcripts = _ranked(
+        InterviewResponse.objects.filter(interview_id=interview_id).alias(
+            transcript_vector=TranscriptVector()
+        ),
+        "transcript_vector",
+        "transcript",
+        query,
+        cursor,
+    )
+    branches = [transcripts]
+    if storage_mode() == "json":
+        # Answer rows remain only for responses written before the switch
+        answers = answers.exclude(response__answers_transcript__has_key="answers")
+        branches.append(
+            _ranked(
+                InterviewResponse.objects.filter(interview_id=interview_id).alias(
+                    answers_vector=SnapshotAnswersVector()
+                ),
+                "answers_vector",
+                "snapshot",
+                query,
+                cursor,
+            )
+        )
+    rows = list(answers.union(*branches, all=True).order_by("-rank", "kind", "-id")[: size + 1])
+    page = rows[:size]
+
+    details = {}
+    answer_ids = [r["id"] for r in page if r["kind"] == "answer"]
+    if answer_ids:
+        for a in (
+            Answer.objects.filter(pk__in=answer_ids)
+            .select_related("question", "response__candidate")
+            .only(
+                "id",
+                "question__id",
+                "question__question_text",
+                "response__id",
+                "response__submitted_at",
+                "response__candidate__full_name",
+                "response__candidate__email",
+            )
+            .annotate(
+                headline=SearchHeadline(
+                    "answer_text",
+                    query,
+                    config=SEARCH_CONFIG,
+                    start_sel=_START_SEL,
+                    stop_sel=_STOP_SEL,
+                )
+            )
+        ):
+            details[("answer", a.pk)] = (a.headline, a.question, a.response)
+    transcript_ids = [r["id"] for r in page if r["kind"] == "transcript"]
+    if transcript_ids:
+        for resp in (
+            InterviewResponse.objects.filter(pk__in=transcript_ids)
+            .select_related("candidate")
+            .only("id", "submitted_at", "candidate__full_name", "candidate__email")
+            .annotate(
+                headline=SearchHeadline(
+                    KeyTextTransform("transcript", "answers_transcript"),
+                    query,
+                    config=SEARCH_CONFIG,
+                    start_sel=_START_SEL,
+                    stop_sel=_STOP_SEL,
+                    max_fragments=3,
+                )
+            )
+        ):
+            details[("transcript", resp.pk)] = (resp.headline, None, resp)
+
+    snapshot_ids = [r["id"] for r in page if r["kind"] == "snapshot"]
+    if snapshot_ids:
+        for resp in (
+            InterviewResponse.objects.filter(pk__in=snapshot_ids)
+            .select_related("candidate")
+            .only("id", "submitted_at", "version_id", "candidate__full_name", "candidate__email")
+            .annotate(
+                # ts_headline over jsonb highlights each string value in place
+                headline=SearchHeadline(
+                    KeyTransform("answers", "answers_transcript"),
+                    query,
+                    config=SEARCH_CONFIG,
+                    start_sel=_START_SEL,
+                    stop_sel=_STOP_SEL,
+                )
+            )
+        ):
+            question_id, text = _snapshot_match(resp.headline)
+            version = get_published_version(resp.version_id)
+            details[("snapshot", resp.pk)] = (
+                text,
+                _SnapshotQuestion(
+                    question_id, version.question_text(question_id) if version else ""
+                ),
+                resp,
+            )
+
+    hits = []
+    for row in page:
+        detail = details.get((row["kind"], row["id"]))
+        if detail is None:  # deleted since the ranking query
+            continue
+        headline, question, response = detail
+        candidate = response.candidate
+        hits.append(
+            SearchHit(
+                kind=row["kind"],
+                id=row["id"],
+                response_id=response.pk,
+                rank=row["rank"],
+                headline=_highlight(headline),
+                question_id=question.pk if question else None,
+                question_text=question.question_text if question else "",
+                candidate_name=candidate.full_name if candidate else "",
+                candidate_email=candidate.email if candidate else "",
+                submitted_at=response.submitted_at,
+            )
+        )
+
+    next_cursor = None
+    if len(rows) > size and page:
+        last = page[-1]
+        next_cursor = pack_cursor(repr(last["rank"]), last["kind"], last["id"])
+    return SearchPage(hits=hits, next_cursor=next_cursor)
+
+
+__all__ = [
+    "SearchHit",
+    "SearchPage",
+    "build_search_query",
+    "search_responses",
+]
@@ -2,7 +2,7 @@ from typing import Any, Dict, List
 
 from rest_framework import serializers
 
-from .models import Question
+from .snapshots import get_interview_snapshot
 
 
 class AnswerItemSerializer(serializers.Serializer):
@@ -35,13 +35,17 @@ class SubmitResponseSerializer(serializers.Serializer):
         if not interview:
             raise serializers.ValidationError("Interview context missing")
 
-        valid_qids = set(
-            Question.objects.filter(section__interview=interview).values_list("id", flat=True)
-        )
+        # Validate against the cached snapshot's question index; the view reuses it when persisting
+        questions = self.context.get("questions")
+        if questions is None:
+            snapshot = get_interview_snapshot(interview.pk)
+            questions = snapshot.questions_by_id if snapshot else {}
+            self.context["questions"] = questions
 
         for item in value:
             qid = item.get("question")
-            if qid not in valid_qids:
+            q = questions.get(qid)
+            if q is None:
                 raise serializers.ValidationError(
                     f"Question {qid} is not part of interview {interview.pk}"
                 )
@@ -58,13 +62,8 @@ class SubmitResponseSerializer(serializers.Serializer):
                     raise serializers.ValidationError("option_values must be a list of strings")
 
                 # For multiple choice, enforce membership in configured options
-                try:
-                    q = Question.objects.get(pk=qid, section__interview=interview)
-                except Question.DoesNotExist:
-                    q = None
-                if q and q.question_type == "multiple_choice":
-                    allowed = set(q.options or [])
-                    invalid = [v for v in vals if v not in allowed]
+                if q.question_type == "multiple_choice":
+                    invalid = [v for v in vals if v not in q.option_set]
                     if invalid:
                         raise serializers.ValidationError(
                             f"Invalid options for question {qid}: {invalid}"
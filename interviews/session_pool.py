@@ -0,0 +1,208 @@
+"""
+Optional per-process pool of pre-minted realtime sessions.
+
+Sessions are interchangeable when their upstream payload is identical (same interview
+version, model, voice and instructions), so entries are keyed by a hash of the payload.
+A payload becomes "hot" when realtime_session mints it; a background thread then keeps
+`depth` unused sessions ready for each hot payload, discarding entries before their
+client_secret expires, and forgets payloads that have not been requested for a while.
+
+Ephemeral secrets are single-use, so the pool lives in process memory rather than in the
+shared cache (which cannot pop atomically).
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+
+from django.conf import settings
+
+from .upstream import RealtimeClient, get_realtime_client
+
+logger = logging.getLogger(__name__)
+
+# Used when the upstream response carries no client_secret.expires_at
+DEFAULT_SESSION_TTL = 60
+
+
+def payload_key(payload: Dict[str, Any]) -> str:
+    return hashlib.sha1(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _expires_at(data: Dict[str, Any], now: float) -> float:
+    secret = data.get("client_secret") or {}
+    try:
+        return float(secret.get("expires_at"))
+    except (AttributeError, TypeError, ValueError):
+        return now + DEFAULT_SESSION_TTL
+
+
+class SessionPool:
+    """Thread-safe pool of pre-minted sessions with TTL-based refresh and metrics."""
+
+    def __init__(
+        self,
+        depth: int = 2,
+        min_ttl: float = 20,
+        idle_timeout: float = 300,
+        refresh_interval: float = 5,
+        client: Optional[RealtimeClient] = None,
+    ):
+        self.depth = depth
+        self.min_ttl = min_ttl
+        self.idle_timeout = idle_timeout
+        self.refresh_interval = refresh_interval
+        self._client = client
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        # key -> deque of (expires_at, session data), oldest first
+        self._entries: Dict[str, Deque[Tuple[float, Dict[str, Any]]]] = {}
+        # key -> (payload, api_key, last requested at)
+        self._hot: Dict[str, Tuple[Dict[str, Any], str, float]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.minted = 0
+        self.expired = 0
+        self.errors = 0
+
+    def _usable(self, expires_at: float, now: float) -> bool:
+        return expires_at - now > self.min_ttl
+
+    def take(self, payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Pop a warm session for this payload, or None (counted as a miss)."""
+        key = payload_key(payload)
+        now = time.time()
+        with self._lock:
+            hot = self._hot.get(key)
+            if hot is not None:
+                self._hot[key] = (hot[0], hot[1], now)
+            entries = self._entries.get(key)
+            while entries:
+                expires_at, data = entries.popleft()
+                if self._usable(expires_at, now):
+                    self.hits += 1
+                    self._wake.set()
+                    return data
+                self.expired += 1
+            self.misses += 1
+        return None
+
+    def register(self, payload: Dict[str, Any], api_key: str) -> None:
+        """Mark a payload as hot so the refiller keeps sessions ready for it."""
+        key = payload_key(payload)
+        with self._lock:
+            self._hot[key] = (payload, api_key, time.time())
+        self._wake.set()
+
+    def refill_once(self) -> int:
+        """
+        Drop idle payloads and near-expiry sessions, then mint up to `depth` per hot payload.
+        Minting happens outside the lock. Returns the number of sessions minted.
+        """
+        now = time.time()
+        todo = []
+        with self._lock:
+            for key, (payload, api_key, last_used) in list(self._hot.items()):
+                entries = self._entries.setdefault(key, deque())
+                if now - last_used > self.idle_timeout:
+                    self.expired += len(entries)
+                    del self._hot[key]
+                    del self._entries[key]
+                    continue
+                fresh = deque(e for e in entries if self._usable(e[0], now))
+                self.expired += len(entries) - len(fresh)
+                self._entries[key] = fresh
+                if len(fresh) < self.depth:
+                    todo.append((key, payload, api_key, self.depth - len(fresh)))
+
+        client = self._client or get_realtime_client()
+        minted = 0
+        for key, payload, api_key, need in todo:
+            for _ in range(need):
+                try:
+                    data = client.create_session(payload, api_key=api_key)
+                except Exception:
+                    logger.warning("Realtime session pre-mint failed", exc_info=True)
+                    with self._lock:
+                        self.errors += 1
+                    break
+                with self._lock:
+                    self.minted += 1
+                    if key in self._entries:
+                        self._entries[key].append((_expires_at(data, time.time()), data))
+                minted += 1
+        return minted
+
+    def start(self) -> None:
+        """Start the background refiller thread (idempotent)."""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(
+                target=self._run, name="realtime-session-pool", daemon=True
+            )
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait(self.refresh_interval)
+            self._wake.clear()
+            try:
+                self.refill_once()
+            except Exception:
+                logger.exception("Realtime session pool refill failed")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            depths = {key[:12]: len(entries) for key, entries in self._entries.items()}
+            served = self.hits + self.misses
+            return {
+                "hot_payloads": len(self._hot),
+                "depth": sum(depths.values()),
+                "depth_by_payload": depths,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / served, 4) if served else 0.0,
+                "minted": self.minted,
+                "expired": self.expired,
+                "expiry_waste": round(self.expired / self.minted, 4) if self.minted else 0.0,
+                "errors": self.errors,
+            }
+
+
+_pool: Optional[SessionPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_session_pool() -> Optional[SessionPool]:
+    """
+    Return the process-wide pool (starting its refiller on first use), or None when
+    REALTIME_POOL_ENABLED is off.
+    """
+    global _pool
+    if not getattr(settings, "REALTIME_POOL_ENABLED", False):
+        return None
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                pool = SessionPool(
+                    depth=getattr(settings, "REALTIME_POOL_DEPTH", 2),
+                    min_ttl=getattr(settings, "REALTIME_POOL_MIN_TTL", 20),
+                    idle_timeout=getattr(settings, "REALTIME_POOL_IDLE_TIMEOUT", 300),
+                    refresh_interval=getattr(settings, "REALTIME_POOL_REFRESH_INTERVAL", 5),
+                )
+                pool.start()
+                _pool = pool
+    return _pool
+
+
+__all__ = [
+    "SessionPool",
+    "get_session_pool",
+    "payload_key",
+]
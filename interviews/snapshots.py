@@ -0,0 +1,190 @@
+"""
+Compiled, cacheable view of an interview's structure.
+
+Candidate-facing pages, the realtime prompt builder and the submit pipeline all read the
+same interview definition. `get_interview_snapshot` compiles it once per interview version
+(three queries) and serves it from the two-tier cache afterwards (zero queries).
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.http import Http404
+
+from .cache import LRUCache, get_interview_version, two_tier_get
+from .models import Interview, Question, Section
+
+_QUESTION_TYPE_LABELS = dict(Question.QUESTION_TYPES)
+
+_local = LRUCache(getattr(settings, "INTERVIEW_SNAPSHOT_LRU_SIZE", 256))
+
+
+@dataclass(frozen=True)
+class QuestionDef:
+    id: int
+    section_id: Optional[int]
+    question_text: str
+    question_type: str
+    is_required: bool
+    order: int
+    options: Tuple[str, ...]
+    option_set: FrozenSet[str]
+    # Stable id of each entry of `options`
+    option_ids: Tuple[int, ...] = ()
+    # Option id -> label, including retired options that older answers may still reference
+    option_labels: Dict[int, str] = field(default_factory=dict)
+
+    @property
+    def pk(self) -> int:
+        return self.id
+
+    @property
+    def choices(self) -> Tuple[Tuple[int, str], ...]:
+        """(id, label) of the current options, in display order."""
+        return tuple(zip(self.option_ids, self.options))
+
+    def encode_options(self, values: Iterable[str]) -> List[int]:
+        """Ids of the given current option labels, in order; unknown labels are dropped."""
+        ids = dict(zip(self.options, self.option_ids))
+        return [ids[v] for v in dict.fromkeys(map(str, values)) if v in ids]
+
+    def decode_options(self, option_ids: Iterable[int]) -> List[str]:
+        """Labels of stored option ids; ids the question never had are dropped."""
+        return [self.option_labels[i] for i in option_ids or [] if i in self.option_labels]
+
+    def get_question_type_display(self) -> str:
+        return _QUESTION_TYPE_LABELS.get(self.question_type, self.question_type)
+
+
+@dataclass(frozen=True)
+class SectionDef:
+    id: int
+    title: str
+    description: str
+    order: int
+    questions: Tuple[QuestionDef, ...]
+
+    @property
+    def pk(self) -> int:
+        return self.id
+
+
+@dataclass(frozen=True)
+class InterviewSnapshot:
+    id: int
+    version: str
+    title: str
+    description: str
+    is_active: bool
+    created_by_id: int
+    updated_at: datetime
+    # Sections in (order, id) order, each with its questions in (order, id) order
+    sections: Tuple[SectionDef, ...]
+    # All sectioned questions in display order: by section, then (order, id) within it
+    questions: Tuple[QuestionDef, ...]
+    # Question-id index used for validation and answer materialization, in display order
+    questions_by_id: Dict[int, QuestionDef]
+
+    @property
+    def pk(self) -> int:
+        return self.id
+
+
+def _question_def(q: Question) -> QuestionDef:
+    options = tuple(str(o) for o in (q.options or []))
+    option_ids = tuple(q.option_ids or [])
+    if len(option_ids) != len(options):  # rows written without Question.save()
+        option_ids = tuple(range(len(options)))
+    option_labels = {int(k): str(v) for k, v in (q.retired_options or {}).items()}
+    option_labels.update(zip(option_ids, options))
+    return QuestionDef(
+        id=q.id,
+        section_id=q.section_id,
+        question_text=q.question_text,
+        question_type=q.question_type,
+        is_required=q.is_required,
+        order=q.order,
+        options=options,
+        option_set=frozenset(options),
+        option_ids=option_ids,
+        option_labels=option_labels,
+    )
+
+
+def build_interview_snapshot(interview_id: int, version: str = "") -> Optional[InterviewSnapshot]:
+    """
+    Compile an interview's structure from the database (three queries), or None if missing.
+    """
+    interview = Interview.objects.filter(pk=interview_id).first()
+    if interview is None:
+        return None
+    sections = list(Section.objects.filter(interview_id=interview_id).order_by("order", "id"))
+    questions = [
+        _question_def(q)
+        for q in Question.objects.filter(section__interview_id=interview_id).order_by("order", "id")
+    ]
+
+    by_section: Dict[int, list] = {}
+    for q in questions:
+        by_section.setdefault(q.section_id, []).append(q)
+
+    # Question order is a gap key within each section, so display order is by section first
+    ordered = tuple(q for s in sections for q in by_section.get(s.id, ()))
+    return InterviewSnapshot(
+        id=interview.id,
+        version=version,
+        title=interview.title,
+        description=interview.description,
+        is_active=interview.is_active,
+        created_by_id=interview.created_by_id,
+        updated_at=interview.updated_at,
+        sections=tuple(
+            SectionDef(
+                id=s.id,
+                title=s.title,
+                description=s.description,
+                order=s.order,
+                questions=tuple(by_section.get(s.id, ())),
+            )
+            for s in sections
+        ),
+        questions=ordered,
+        questions_by_id={q.id: q for q in ordered},
+    )
+
+
+def get_interview_snapshot(interview_id: int) -> Optional[InterviewSnapshot]:
+    """
+    Return the compiled snapshot for the interview's current version, or None if missing.
+    """
+    try:
+        interview_id = int(interview_id)
+    except (TypeError, ValueError):
+        return None
+    version = get_interview_version(interview_id)
+    return two_tier_get(
+        _local,
+        f"interviews:snapshot:{interview_id}:{version}",
+        lambda: build_interview_snapshot(interview_id, version),
+        timeout=getattr(settings, "INTERVIEW_SNAPSHOT_TIMEOUT", 86400),
+    )
+
+
+def get_active_snapshot_or_404(interview_id: int) -> InterviewSnapshot:
+    """Snapshot counterpart of get_object_or_404(Interview, pk=..., is_active=True)."""
+    snapshot = get_interview_snapshot(interview_id)
+    if snapshot is None or not snapshot.is_active:
+        raise Http404("No Interview matches the given query.")
+    return snapshot
+
+
+__all__ = [
+    "InterviewSnapshot",
+    "QuestionDef",
+    "SectionDef",
+    "build_interview_snapshot",
+    "get_active_snapshot_or_404",
+    "get_interview_snapshot",
+]
@@ -0,0 +1,138 @@
+"""
+Set-based write path for interview submissions.
+
+Validation, enrichment and Answer materialization all run against the id-keyed question
+index of the cached interview snapshot, so persisting a submission costs the same number
+of queries whether it carries one answer or hundreds. Snapshot items store question ids
+and multiple-choice selections as the question's small-integer option ids; question texts
+live in the published version the response references. ANSWER_STORAGE decides whether
+answers go to the snapshot, to Answer rows or to both (see answers.py).
+"""
+
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+from .answers import writes_answer_rows, writes_snapshot_answers
+from .models import Answer, InterviewResponse
+from .rollups import record_submission
+from .snapshots import QuestionDef
+
+QuestionIndex = Mapping[int, QuestionDef]
+
+
+def enrich_answers(
+    items: Iterable[Dict[str, Any]], questions: QuestionIndex
+) -> List[Dict[str, Any]]:
+    """
+    Normalize submitted answer items against the question map.
+    Unknown questions are dropped; selected option labels are stored as the question's option
+    ids, and labels not configured on the question are filtered.
+    """
+    enriched = []
+    for item in items or []:
+        try:
+            qid = int(item.get("question"))
+        except Exception:
+            continue
+        q = questions.get(qid)
+        if q is None:
+            continue
+
+        enriched.append(
+            {
+                "question": q.id,
+                "text": item.get("text") or "",
+                "option_ids": q.encode_options(item.get("option_values") or []),
+            }
+        )
+    return enriched
+
+
+def form_answers(post, questions: Iterable[QuestionDef]) -> List[Dict[str, Any]]:
+    """
+    Build the snapshot items for an HTML form POST: one item per question of `questions`
+    (the snapshot's display-ordered tuple), in that order.
+    Multiple-choice fields post the option label, stored as its option id; values not
+    configured on the question are ignored.
+    """
+    answers = []
+    for q in questions:
+        text_val = ""
+        opt_ids: List[int] = []
+        if q.question_type in ["text", "textarea"]:
+            text_val = post.get(f"question_{q.id}", "") or ""
+        elif q.question_type == "multiple_choice":
+            option_value = post.get(f"question_{q.id}")
+            if option_value:
+                opt_ids = q.encode_options([option_value])
+        answers.append(
+            {
+                "question": q.id,
+                "text": text_val,
+                "option_ids": opt_ids,
+            }
+        )
+    return answers
+
+
+def build_answer_rows(
+    response: InterviewResponse, answers: Iterable[Dict[str, Any]], questions: QuestionIndex
+) -> List[Answer]:
+    """
+    Build unsaved Answer rows for an enriched snapshot (no queries).
+    """
+    rows = []
+    for item in answers:
+        q = questions.get(item["question"])
+        if q is None:
+            continue
+        rows.append(
+            Answer(
+                response=response,
+                question_id=q.id,
+                answer_text=item.get("text") or "",
+                selected_option_ids=list(item.get("option_ids") or []),
+            )
+        )
+    return rows
+
+
+def create_response(
+    interview_id: int,
+    candidate,
+    answers: List[Dict[str, Any]],
+    questions: QuestionIndex,
+    transcript: Optional[str] = None,
+    source: str = "api",
+    version_id: Optional[int] = None,
+) -> InterviewResponse:
+    """
+    Insert the InterviewResponse with its final answers_transcript snapshot, bulk-insert
+    the relational Answer rows (each as the storage mode allows) and bump the interview's
+    rollups. Call inside a transaction; `version_id` is the published version (see
+    versions.publish_interview) answered.
+    """
+    snapshot: Dict[str, Any] = {}
+    if writes_snapshot_answers():
+        snapshot["answers"] = answers
+    if transcript is not None:
+        snapshot["transcript"] = transcript
+    snapshot["source"] = source
+
+    response = InterviewResponse.objects.create(
+        interview_id=interview_id,
+        candidate=candidate,
+        version_id=version_id,
+        answers_transcript=snapshot,
+    )
+    if writes_answer_rows():
+        Answer.objects.bulk_create(build_answer_rows(response, answers, questions))
+    record_submission(interview_id, answers, response.submitted_at)
+    return response
+
+
+__all__ = [
+    "enrich_answers",
+    "form_answers",
+    "build_answer_rows",
+    "create_response",
+]
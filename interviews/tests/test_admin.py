@@ -0,0 +1,75 @@
+from unittest import mock
+
+from django.contrib import admin
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from interviews.models import Answer, Candidate, Interview, InterviewResponse, Question, Section
+from interviews.pagination import EstimatedCountPaginator, estimate_count
+
+
+class AdminChangelistTests(TestCase):
+    """
+    Response/answer changelists load in a fixed number of queries and avoid exact counts.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_superuser("admin", "admin@example.com", "pw")
+        interview = Interview.objects.create(title="Backend", created_by=cls.admin)
+        section = Section.objects.create(interview=interview, title="Section 1")
+        question = Question.objects.create(section=section, question_text="Why?", order=1)
+        for i in range(12):
+            candidate = Candidate.objects.create(full_name=f"Cand {i}", email=f"c{i}@example.com")
+            response = InterviewResponse.objects.create(interview=interview, candidate=candidate)
+            Answer.objects.create(
+                response=response, question=question, answer_text=f"Tuned postgres {i}"
+            )
+
+    def setUp(self):
+        self.client.force_login(self.admin)
+
+    def _queries(self, url, **params):
+        with CaptureQueriesContext(connection) as ctx:
+            res = self.client.get(url, params)
+        self.assertEqual(res.status_code, 200)
+        return len(ctx.captured_queries)
+
+    def test_changelist_query_count_does_not_grow_with_rows(self):
+        for model in (Answer, InterviewResponse, Candidate, Question):
+            url = reverse(f"admin:interviews_{model._meta.model_name}_changelist")
+            with mock.patch.object(type(admin.site._registry[model]), "list_per_page", 5):
+                few = self._queries(url)
+            many = self._queries(url)
+            self.assertEqual(few, many, model.__name__)
+
+    def test_answer_search_uses_full_text(self):
+        url = reverse("admin:interviews_answer_changelist")
+        res = self.client.get(url, {"q": "postgres"})
+        self.assertEqual(res.context["cl"].result_count, 12)
+        res = self.client.get(url, {"q": "mysql"})
+        self.assertEqual(res.context["cl"].result_count, 0)
+
+    def test_candidate_search(self):
+        url = reverse("admin:interviews_candidate_changelist")
+        res = self.client.get(url, {"q": "c11@"})
+        self.assertEqual([c.email for c in res.context["cl"].result_list], ["c11@example.com"])
+
+
+class EstimatedCountPaginatorTests(TestCase):
+    def test_small_results_are_counted_exactly(self):
+        Candidate.objects.create(full_name="A", email="a@example.com")
+        paginator = EstimatedCountPaginator(Candidate.objects.all(), 10)
+        self.assertEqual(paginator.count, 1)
+
+    def test_large_results_use_the_estimate(self):
+        qs = Candidate.objects.filter(email__startswith="x")
+        self.assertIsInstance(estimate_count(qs), int)
+        with mock.patch("interviews.pagination.estimate_count", return_value=5_000_000):
+            paginator = EstimatedCountPaginator(qs, 10)
+            with CaptureQueriesContext(connection) as ctx:
+                self.assertEqual(paginator.count, 5_000_000)
+        self.assertEqual(len(ctx.captured_queries), 0)
@@ -0,0 +1,203 @@
+import json
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from interviews.answers import (
+    load_answers,
+    responses_answering,
+    snapshot_option_counts,
+    storage_mode,
+)
+from interviews.models import Answer, Interview, InterviewResponse, Question, Section
+
+
+class AnswerStorageTests(TestCase):
+    """
+    ANSWER_STORAGE decides where submissions write their answers; every page reads them
+    back through load_answers() whatever the mode.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create_user(username="owner", password="pw")
+        self.interview = Interview.objects.create(title="Backend", created_by=self.owner)
+        section = Section.objects.create(interview=self.interview, title="Intro")
+        self.text_q = Question.objects.create(
+            section=section, question_text="Tell us about databases", order=1
+        )
+        self.pick_q = Question.objects.create(
+            section=section,
+            question_text="Stack",
+            question_type="multiple_choice",
+            options=["Django", "Flask"],
+            order=2,
+        )
+
+    def _submit(self, email, text="I tuned Postgres indexes", option="Django"):
+        res = self.client.post(
+            reverse("interviews:submit_json", args=[self.interview.pk]),
+            json.dumps(
+                {
+                    "candidate_name": "Alice",
+                    "candidate_email": email,
+                    "answers": [
+                        {"question": self.text_q.id, "text": text},
+                        {"question": self.pick_q.id, "option_values": [option]},
+                    ],
+                }
+            ),
+            content_type="application/json",
+        )
+        self.assertEqual(res.status_code, 200, res.content)
+        return InterviewResponse.objects.get(pk=res.json()["response_id"])
+
+    def _assert_readable(self, response):
+        items = load_answers([response])[0].answer_items
+        self.assertEqual(
+            [(i.question_text, i.text, i.option_values) for i in items],
+            [
+                ("Tell us about databases", "I tuned Postgres indexes", []),
+                ("Stack", "", ["Django"]),
+            ],
+        )
+        page = self.client.get(reverse("interviews:response_detail", args=[response.pk]))
+        self.assertContains(page, "I tuned Postgres indexes")
+        self.assertContains(page, "Tell us about databases")
+
+    def test_dual_mode_writes_both(self):
+        response = self._submit("a@example.com")
+        self.assertEqual(response.answers.count(), 2)
+        self.assertEqual(len(response.answers_transcript["answers"]), 2)
+        self._assert_readable(response)
+
+    @override_settings(ANSWER_STORAGE="json")
+    def test_json_mode_writes_snapshot_only(self):
+        response = self._submit("a@example.com")
+        self.assertFalse(Answer.objects.exists())
+        self._assert_readable(response)
+
+        self._submit("b@example.com", text="Spreadsheets", option="Flask")
+        self._submit("c@example.com", text="MySQL")
+        self.assertEqual(snapshot_option_counts(self.interview.pk, self.pick_q.id), {0: 2, 1: 1})
+        self.assertEqual(responses_answering(self.interview.pk, self.pick_q.id, 1).count(), 1)
+
+        self.client.force_login(self.owner)
+        page = self.client.get(reverse("interviews:responses", args=[self.interview.pk]))
+        self.assertContains(page, "Spreadsheets")
+        body = self.client.get(
+            reverse("interviews:search", args=[self.interview.pk]), {"q": "postgres"}
+        ).json()
+        [hit] = body["results"]
+        self.assertEqual(hit["kind"], "snapshot")
+        self.assertEqual(hit["response_id"], response.pk)
+        self.assertEqual(hit["question_text"], "Tell us about databases")
+        self.assertIn("<mark>Postgres</mark>", hit["headline"])
+
+    @override_settings(ANSWER_STORAGE="relational")
+    def test_relational_mode_writes_rows_only(self):
+        response = self._submit("a@example.com")
+        self.assertEqual(response.answers.count(), 2)
+        self.assertNotIn("answers", response.answers_transcript)
+        self.assertEqual(response.answers_transcript["source"], "api")
+        self._assert_readable(response)
+
+    def test_reads_fall_back_across_modes(self):
+        with self.settings(ANSWER_STORAGE="relational"):
+            rows_only = self._submit("a@example.com")
+        with self.settings(ANSWER_STORAGE="json"):
+            snapshot_only = self._submit("b@example.com")
+            self._assert_readable(rows_only)
+        self._assert_readable(snapshot_only)
+
+    @override_settings(ANSWER_STORAGE="both")
+    def test_unknown_mode_is_rejected(self):
+        with self.assertRaises(ImproperlyConfigured):
+            storage_mode()
+
+
+class OptionIdTests(TestCase):
+    """
+    Selections are stored as stable option ids that survive renames, reorders and removals.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create_user(username="owner", password="pw")
+        self.interview = Interview.objects.create(title="Backend", created_by=self.owner)
+        section = Section.objects.create(interview=self.interview, title="Intro")
+        self.question = Question.objects.create(
+            section=section,
+            question_text="Stack",
+            question_type="multiple_choice",
+            options=["Django", "Flask"],
+        )
+
+    def test_ids_survive_builder_edits(self):
+        self.assertEqual(self.question.option_ids, [0, 1])
+        response = InterviewResponse.objects.create(
+            interview=self.interview,
+            answers_transcript={"answers": [{"question": self.question.id, "option_ids": [0, 1]}]},
+        )
+        self.client.force_login(self.owner)
+        with self.captureOnCommitCallbacks(execute=True):
+            res = self.client.post(
+                reverse("interviews:edit_batch", args=[self.interview.pk]),
+                json.dumps(
+                    {
+                        "operations": [
+                            {
+                                "action": "delete_option",
+                                "question_id": self.question.id,
+                                "option_index": 0,
+                            },
+                            {
+                                "action": "update_option",
+                                "question_id": self.question.id,
+                                "option_index": 0,
+                                "option_text": "Flask 3",
+                            },
+                            {
+                                "action": "add_option",
+                                "question_id": self.question.id,
+                                "option_text": "FastAPI",
+                            },
+                        ]
+                    }
+                ),
+                content_type="application/json",
+            )
+        self.assertEqual(res.json()["results"][2]["option_id"], 2)
+        self.question.refresh_from_db()
+        self.assertEqual(self.question.option_ids, [1, 2])
+        self.assertEqual(self.question.retired_options, {"0": "Django"})
+        [item] = load_answers([response])[0].answer_items
+        self.assertEqual(item.option_values, ["Django", "Flask 3"])
+
+    def test_replacing_options_keeps_known_ids(self):
+        self.question.options = ["Rails", "Flask"]
+        self.question.save()
+        self.assertEqual(self.question.option_ids, [2, 1])
+        self.assertEqual(self.question.retired_options, {"0": "Django"})
+
+    @override_settings(ANSWER_STORAGE="json")
+    def test_selections_of_deleted_questions_decode_through_the_version(self):
+        res = self.client.post(
+            reverse("interviews:submit_json", args=[self.interview.pk]),
+            json.dumps(
+                {
+                    "candidate_name": "Alice",
+                    "candidate_email": "a@example.com",
+                    "answers": [{"question": self.question.id, "option_values": ["Flask"]}],
+                }
+            ),
+            content_type="application/json",
+        )
+        response = InterviewResponse.objects.get(pk=res.json()["response_id"])
+        with self.captureOnCommitCallbacks(execute=True):
+            self.question.delete()
+        [item] = load_answers([response])[0].answer_items
+        self.assertEqual((item.question_text, item.option_values), ("Stack", ["Flask"]))
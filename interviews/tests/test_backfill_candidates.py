@@ -0,0 +1,114 @@
+import os
+import tempfile
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+
+from interviews.management.commands import backfill_candidates
+from interviews.models import Candidate, Interview, InterviewResponse
+
+_TABLE = InterviewResponse._meta.db_table
+
+
+class BackfillCandidatesTests(TestCase):
+    """
+    backfill_candidates links responses to candidates from the legacy candidate_email and
+    candidate_name columns, on databases that still carry them, and resumes from its
+    checkpoint after an interruption.
+    """
+
+    def setUp(self):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"ALTER TABLE {_TABLE} ADD COLUMN candidate_email varchar(254), "
+                "ADD COLUMN candidate_name varchar(255)"
+            )
+        owner = User.objects.create_user(username="owner", password="pw")
+        self.interview = Interview.objects.create(title="Backend", created_by=owner)
+        self.checkpoint = os.path.join(tempfile.mkdtemp(), "backfill.json")
+
+    def _response(self, email, name=""):
+        response = InterviewResponse.objects.create(interview=self.interview)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"UPDATE {_TABLE} SET candidate_email = %s, candidate_name = %s WHERE id = %s",
+                [email, name, response.pk],
+            )
+        return response
+
+    def _run(self, *args):
+        out = StringIO()
+        call_command(
+            "backfill_candidates",
+            *args,
+            "--batch-size=2",
+            "--range-size=2",
+            f"--checkpoint={self.checkpoint}",
+            stdout=out,
+        )
+        return out.getvalue()
+
+    def test_links_responses_and_fills_blank_names(self):
+        existing = Candidate.objects.create(email="ada@example.com", full_name="")
+        first = self._response("Ada@Example.com ", "Ada Lovelace")
+        second = self._response("ada@example.com")
+        other = self._response("bob@example.com", "Bob")
+        blank = self._response("   ")
+
+        out = self._run()
+        self.assertIn("Candidate rows created: 1", out)
+        self.assertIn("InterviewResponses linked: 3", out)
+        self.assertNotIn("skipped", out)
+        for response in (first, second, other, blank):
+            response.refresh_from_db()
+        self.assertEqual(first.candidate_id, existing.pk)
+        self.assertEqual(second.candidate_id, existing.pk)
+        self.assertEqual(other.candidate.full_name, "Bob")
+        self.assertIsNone(blank.candidate_id)
+        existing.refresh_from_db()
+        self.assertEqual(existing.full_name, "Ada Lovelace")
+        self.assertFalse(os.path.exists(self.checkpoint))
+
+        # Linked rows are not read again
+        self.assertIn("No InterviewResponse rows require backfill.", self._run())
+
+    def test_dry_run_writes_nothing(self):
+        response = self._response("ada@example.com", "Ada")
+        out = self._run("--dry-run")
+        self.assertIn("InterviewResponses to link: 1", out)
+        response.refresh_from_db()
+        self.assertIsNone(response.candidate_id)
+        self.assertFalse(Candidate.objects.exists())
+
+    def test_interrupted_run_resumes_remaining_ranges(self):
+        responses = [self._response(f"user{i}@example.com") for i in range(5)]
+        link_range = backfill_candidates.link_range
+        calls = []
+
+        def interrupted(start, end, batch_size):
+            if calls:
+                raise KeyboardInterrupt
+            calls.append((start, end))
+            return link_range(start, end, batch_size)
+
+        with mock.patch.object(backfill_candidates, "link_range", interrupted):
+            with self.assertRaises(KeyboardInterrupt):
+                self._run()
+        self.assertTrue(os.path.exists(self.checkpoint))
+        linked = InterviewResponse.objects.filter(candidate__isnull=False).count()
+        self.assertGreater(linked, 0)
+
+        # The rerun skips the finished range even though its rows no longer need linking
+        ranges = backfill_candidates.id_ranges(InterviewResponse.objects.all(), 2)
+        with mock.patch.object(backfill_candidates, "link_range", wraps=link_range) as work:
+            out = self._run()
+        self.assertIn(f"{len(ranges) - 1} ranges left", out)
+        self.assertEqual(sorted(c.args[:2] for c in work.call_args_list), sorted(ranges[1:]))
+        self.assertIn(f"InterviewResponses linked: {5 - linked}", out)
+        for response in responses:
+            response.refresh_from_db()
+            self.assertIsNotNone(response.candidate_id)
@@ -0,0 +1,61 @@
+import os
+import tempfile
+
+from django.contrib.auth.models import User
+from django.test import TransactionTestCase
+
+from interviews.batches import Checkpoint, id_ranges, run_ranges
+from interviews.models import Interview, InterviewResponse
+
+
+def count_range(start, end, kind):
+    return {kind: InterviewResponse.objects.filter(pk__gte=start, pk__lt=end).count()}
+
+
+class RangeRunTests(TransactionTestCase):
+    """
+    Long-running commands split work into id ranges, run them on a process pool and resume
+    from a checkpoint of finished ranges.
+    """
+
+    def setUp(self):
+        owner = User.objects.create_user(username="owner", password="pw")
+        interview = Interview.objects.create(title="Backend", created_by=owner)
+        self.responses = InterviewResponse.objects.bulk_create(
+            InterviewResponse(interview=interview) for _ in range(25)
+        )
+        self.low = self.responses[0].pk
+        self.path = os.path.join(tempfile.mkdtemp(), "job.json")
+
+    def test_ranges_cover_every_id(self):
+        ranges = id_ranges(InterviewResponse.objects.all(), 10)
+        first = self.low - self.low % 10
+        self.assertEqual(ranges[0], (first, first + 10))
+        self.assertLessEqual(ranges[-1][0], self.low + 24)
+        self.assertGreater(ranges[-1][1], self.low + 24)
+        covered = [pk for start, end in ranges for pk in range(start, end)]
+        self.assertEqual(covered, list(range(first, ranges[-1][1])))
+        # Boundaries do not move when the lowest rows go away
+        InterviewResponse.objects.filter(pk__lt=self.low + 12).delete()
+        later = id_ranges(InterviewResponse.objects.all(), 10)
+        self.assertTrue(set(later) <= set(ranges))
+        self.assertEqual(id_ranges(InterviewResponse.objects.none(), 10), [])
+
+    def test_workers_and_checkpoint_resume(self):
+        ranges = id_ranges(InterviewResponse.objects.all(), 10)
+        checkpoint = Checkpoint(self.path, {"job": "count"})
+        runs = run_ranges(count_range, ranges, checkpoint=checkpoint, kind="rows")
+        (first, counted) = next(runs)
+        runs.close()  # interrupted after the first range
+        self.assertEqual(first, ranges[0])
+
+        resumed = Checkpoint(self.path, {"job": "count"})
+        self.assertIn(ranges[0], resumed)
+        finished = dict(run_ranges(count_range, ranges, workers=2, checkpoint=resumed, kind="rows"))
+        self.assertEqual(set(finished), set(ranges[1:]))
+        self.assertEqual(sum(finished.values(), counted)["rows"], 25)
+
+        # A checkpoint written for other options does not apply
+        self.assertFalse(Checkpoint(self.path, {"job": "other"}).done)
+        resumed.clear()
+        self.assertFalse(os.path.exists(self.path))
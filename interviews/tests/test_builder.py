@@ -0,0 +1,368 @@
+import json
+import re
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from interviews import builder
+from interviews.models import Interview, Question, Section
+from interviews.ordering import ORDER_GAP, key_between
+from interviews.snapshots import get_interview_snapshot
+
+
+class BuilderBatchTests(TestCase):
+    """
+    The batch endpoint applies ordered builder operations in one transaction with a
+    constant number of queries.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create_user(username="owner", password="pw")
+        self.interview = Interview.objects.create(title="Backend", created_by=self.owner)
+        self.section = Section.objects.create(interview=self.interview, title="Intro")
+        self.question = Question.objects.create(section=self.section, question_text="Why?", order=0)
+        self.url = reverse("interviews:edit_batch", args=[self.interview.pk])
+        self.client.force_login(self.owner)
+
+    def _batch(self, operations):
+        return self.client.post(
+            self.url, json.dumps({"operations": operations}), content_type="application/json"
+        )
+
+    def test_operations_reference_rows_added_in_the_same_batch(self):
+        before = get_interview_snapshot(self.interview.pk).version
+        with self.captureOnCommitCallbacks(execute=True):
+            res = self._batch(
+                [
+                    {"action": "add_section", "title": "Skills", "ref": "s1"},
+                    {"action": "add_question", "section_id": "s1", "ref": "q1"},
+                    {"action": "update_question", "question_id": "q1", "question_text": "Stack"},
+                    {
+                        "action": "update_question",
+                        "question_id": "q1",
+                        "question_type": "multiple_choice",
+                    },
+                    {"action": "add_option", "question_id": "q1", "option_text": "Django"},
+                    {"action": "add_option", "question_id": "q1", "option_text": "Flask"},
+                    {"action": "delete_option", "question_id": "q1", "option_index": 1},
+                    {
+                        "action": "move_question",
+                        "question_id": self.question.id,
+                        "section_id": "s1",
+                    },
+                    {"action": "update_interview", "title": "Backend II"},
+                ]
+            )
+        self.assertEqual(res.status_code, 200, res.content)
+        results = res.json()["results"]
+        section = Section.objects.get(pk=results[0]["section_id"])
+        question = Question.objects.get(pk=results[1]["question_id"])
+        self.assertEqual(results[1]["ref"], "q1")
+        self.assertEqual(results[5]["option_index"], 1)
+        self.assertEqual(
+            (question.section_id, question.question_text, question.question_type),
+            (section.pk, "Stack", "multiple_choice"),
+        )
+        self.assertEqual(question.options, ["Django"])
+        self.question.refresh_from_db()
+        self.assertEqual(self.question.section_id, section.pk)
+        self.assertEqual(Interview.objects.get(pk=self.interview.pk).title, "Backend II")
+        self.assertNotEqual(get_interview_snapshot(self.interview.pk).version, before)
+
+    def test_query_count_does_not_grow_with_batch_size(self):
+        def operations(n):
+            edits = [
+                {
+                    "action": "update_question",
+                    "question_id": self.question.id,
+                    "question_text": f"Q{i}",
+                }
+                for i in range(n)
+            ]
+            return edits + [{"action": "add_question", "section_id": self.section.id}] * n
+
+        with CaptureQueriesContext(connection) as small:
+            self._batch(operations(2))
+        with CaptureQueriesContext(connection) as large:
+            self._batch(operations(40))
+        self.assertEqual(len(large.captured_queries), len(small.captured_queries))
+        self.assertEqual(Question.objects.filter(section=self.section).count(), 1 + 2 + 40)
+
+    def test_failing_operation_rolls_back_the_batch(self):
+        res = self._batch(
+            [
+                {
+                    "action": "update_question",
+                    "question_id": self.question.id,
+                    "question_text": "X",
+                },
+                {"action": "add_section", "title": "Skills"},
+                {"action": "delete_option", "question_id": self.question.id, "option_index": 3},
+            ]
+        )
+        self.assertEqual(res.status_code, 400)
+        self.assertEqual(res.json()["index"], 2)
+        self.question.refresh_from_db()
+        self.assertEqual(self.question.question_text, "Why?")
+        self.assertEqual(self.interview.sections.count(), 1)
+
+    def test_batch_locks_interview_and_writes_only_touched_fields(self):
+        other = Question.objects.create(section=self.section, question_text="Who?", order=1)
+        real_apply = builder._apply
+
+        def apply_after_concurrent_edit(batch, op):
+            # An edit committed after this batch loaded its rows
+            Question.objects.filter(pk=other.pk).update(question_text="Who are you?")
+            return real_apply(batch, op)
+
+        with (
+            mock.patch.object(builder, "_apply", side_effect=apply_after_concurrent_edit),
+            CaptureQueriesContext(connection) as ctx,
+        ):
+            res = self._batch(
+                [
+                    {
+                        "action": "update_question",
+                        "question_id": self.question.id,
+                        "question_text": "X",
+                    },
+                    {
+                        "action": "reorder_questions",
+                        "section_id": self.section.id,
+                        "question_ids": [other.id, self.question.id],
+                    },
+                ]
+            )
+        self.assertEqual(res.status_code, 200, res.content)
+        self.assertTrue(any("FOR UPDATE" in q["sql"] for q in ctx.captured_queries))
+        other.refresh_from_db()
+        self.question.refresh_from_db()
+        self.assertEqual((other.question_text, self.question.question_text), ("Who are you?", "X"))
+        self.assertLess(other.order, self.question.order)
+
+    def test_update_question_writes_only_the_fields_it_carries(self):
+        real_apply = builder._apply
+
+        def apply_after_concurrent_edit(batch, op):
+            # Another tab flips the type and required flag after this batch loaded its rows
+            Question.objects.filter(pk=self.question.pk).update(
+                question_type="textarea", is_required=True
+            )
+            return real_apply(batch, op)
+
+        with (
+            mock.patch.object(builder, "_apply", side_effect=apply_after_concurrent_edit),
+            CaptureQueriesContext(connection) as ctx,
+        ):
+            res = self._batch(
+                [
+                    {
+                        "action": "update_question",
+                        "question_id": self.question.id,
+                        "question_text": 'What does "done" mean?',
+                    }
+                ]
+            )
+        self.assertEqual(res.status_code, 200, res.content)
+        [update] = [
+            q["sql"]
+            for q in ctx.captured_queries
+            if q["sql"].startswith('UPDATE "interviews_question"') and "question_text" in q["sql"]
+        ]
+        self.assertNotIn("is_required", update)
+        self.question.refresh_from_db()
+        self.assertEqual(
+            (self.question.question_text, self.question.question_type, self.question.is_required),
+            ('What does "done" mean?', "textarea", True),
+        )
+
+    def test_delete_section_moves_questions_to_fallback(self):
+        other = Section.objects.create(interview=self.interview, title="Other", order=1)
+        res = self._batch([{"action": "delete_section", "section_id": self.section.id}])
+        self.assertEqual(res.json()["results"][0]["fallback_section_id"], other.pk)
+        self.question.refresh_from_db()
+        self.assertEqual(self.question.section_id, other.pk)
+
+    def test_only_owner_can_edit(self):
+        User.objects.create_user(username="other", password="pw")
+        self.client.login(username="other", password="pw")
+        self.assertEqual(self._batch([]).status_code, 404)
+
+    def test_single_action_endpoint_does_not_rewrite_interview(self):
+        updated_at = self.interview.updated_at
+        res = self.client.post(
+            reverse("interviews:edit", args=[self.interview.pk]),
+            json.dumps({"action": "add_section", "title": "Skills"}),
+            content_type="application/json",
+            HTTP_X_REQUESTED_WITH="XMLHttpRequest",
+        )
+        self.assertTrue(res.json()["section_id"])
+        self.interview.refresh_from_db()
+        # Structural edits stamp updated_at; title and description are left alone
+        self.assertGreater(self.interview.updated_at, updated_at)
+        self.assertEqual(self.interview.title, "Backend")
+
+
+class BuilderOrderingTests(TestCase):
+    """
+    Positions are gap-spaced keys: moves and inserts write one row, bulk reorders one
+    bulk_update, and respacing only happens when neighbours run out of room.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create_user(username="owner", password="pw")
+        self.interview = Interview.objects.create(title="Backend", created_by=self.owner)
+        self.section = Section.objects.create(
+            interview=self.interview, title="Intro", order=ORDER_GAP
+        )
+        self.questions = [
+            Question.objects.create(
+                section=self.section, question_text=f"Q{i}", order=(i + 1) * ORDER_GAP
+            )
+            for i in range(5)
+        ]
+        self.url = reverse("interviews:edit_batch", args=[self.interview.pk])
+        self.client.force_login(self.owner)
+
+    def _batch(self, operations):
+        res = self.client.post(
+            self.url, json.dumps({"operations": operations}), content_type="application/json"
+        )
+        self.assertEqual(res.status_code, 200, res.content)
+        return res.json()["results"]
+
+    def _texts(self):
+        return [q.question_text for q in self.interview.questions]
+
+    def test_move_writes_only_the_moved_question(self):
+        with CaptureQueriesContext(connection) as ctx:
+            self._batch(
+                [
+                    {
+                        "action": "move_question",
+                        "question_id": self.questions[4].id,
+                        "section_id": self.section.id,
+                        "index": 1,
+                    }
+                ]
+            )
+        self.assertEqual(self._texts(), ["Q0", "Q4", "Q1", "Q2", "Q3"])
+        update = [q["sql"] for q in ctx.captured_queries if q["sql"].startswith("UPDATE")]
+        # bulk_update of a single row: one CASE branch
+        self.assertEqual(update[0].count("WHEN"), 1)
+
+    def test_insert_at_index_and_respace_when_keys_run_out(self):
+        Question.objects.filter(pk=self.questions[1].pk).update(order=ORDER_GAP + 1)
+        results = self._batch(
+            [{"action": "add_question", "section_id": self.section.id, "index": 1, "ref": "n"}]
+        )
+        new = Question.objects.get(pk=results[0]["question_id"])
+        self.assertEqual(self._texts()[1], new.question_text)
+        orders = [q.order for q in self.interview.questions]
+        self.assertEqual(orders, sorted(set(orders)))
+
+    def test_bulk_reorder(self):
+        ids = [q.id for q in reversed(self.questions)]
+        with CaptureQueriesContext(connection) as ctx:
+            self._batch(
+                [
+                    {
+                        "action": "reorder_questions",
+                        "section_id": self.section.id,
+                        "question_ids": ids[:3],
+                    }
+                ]
+            )
+        self.assertEqual(self._texts(), ["Q4", "Q3", "Q2", "Q0", "Q1"])
+        updates = [q for q in ctx.captured_queries if q["sql"].startswith("UPDATE")]
+        # One bulk_update plus the interview's updated_at stamp
+        self.assertEqual(len(updates), 2)
+
+        second = Section.objects.create(interview=self.interview, title="Skills", order=0)
+        self._batch([{"action": "reorder_sections", "section_ids": [self.section.id]}])
+        self.assertEqual(
+            list(self.interview.sections.values_list("title", flat=True)), ["Intro", "Skills"]
+        )
+        second.refresh_from_db()
+        self.assertEqual(second.order, 2 * ORDER_GAP)
+
+
+class OrderingKeyTests(SimpleTestCase):
+    def test_key_between(self):
+        self.assertEqual(key_between(None, None), ORDER_GAP)
+        self.assertEqual(key_between(ORDER_GAP, None), 2 * ORDER_GAP)
+        self.assertEqual(key_between(None, ORDER_GAP), 0)
+        self.assertEqual(key_between(0, 10), 5)
+        self.assertIsNone(key_between(4, 5))
+        self.assertIsNone(key_between(5, 5))
+
+
+class EditorLoadTests(TestCase):
+    """
+    The editor page loads the whole section -> questions tree in a fixed number of queries.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create_user(username="owner", password="pw")
+        self.interview = Interview.objects.create(title="Backend", created_by=self.owner)
+        self.url = reverse("interviews:edit", args=[self.interview.pk])
+        self.client.force_login(self.owner)
+
+    def _add(self, sections, questions):
+        for i in range(sections):
+            section = Section.objects.create(interview=self.interview, title=f"S{i}", order=i)
+            Question.objects.bulk_create(
+                Question(section=section, question_text=f"S{i}Q{j}", order=j)
+                for j in range(questions)
+            )
+
+    def test_json_tree(self):
+        self._add(2, 2)
+        tree = self.client.get(self.url, {"format": "json"}).json()
+        self.assertEqual([s["title"] for s in tree["sections"]], ["S0", "S1"])
+        self.assertEqual([q["text"] for q in tree["sections"][1]["questions"]], ["S1Q0", "S1Q1"])
+
+    def test_query_count_does_not_grow_with_tree_size(self):
+        self._add(1, 1)
+        with CaptureQueriesContext(connection) as small:
+            self.assertEqual(self.client.get(self.url).status_code, 200)
+        self._add(10, 20)
+        with CaptureQueriesContext(connection) as large:
+            res = self.client.get(self.url)
+        self.assertEqual(len(large.captured_queries), len(small.captured_queries))
+        self.assertContains(res, 'id="builder-tree"')
+        self.assertEqual(len(res.context["builder_tree"]["sections"]), 11)
+
+    def test_quoted_texts_reach_the_editor_intact(self):
+        section = Section.objects.create(interview=self.interview, title='The "core" part', order=0)
+        Question.objects.create(
+            section=section,
+            question_text='What does "done" mean?',
+            question_type="multiple_choice",
+            options=['It\'s "shipped"', "<b>Tested</b>"],
+        )
+        res = self.client.get(self.url)
+        tree = json.loads(
+            re.search(r'id="builder-tree"[^>]*>(.*?)</script>', res.content.decode(), re.S)[1]
+        )
+        section_tree = tree["sections"][0]
+        self.assertEqual(section_tree["title"], 'The "core" part')
+        self.assertEqual(section_tree["questions"][0]["text"], 'What does "done" mean?')
+        self.assertEqual(
+            section_tree["questions"][0]["options"], ['It\'s "shipped"', "<b>Tested</b>"]
+        )
+        # Inputs are filled through input.value, never by splicing text into attributes
+        self.assertNotRegex(res.content.decode(), r'value="\$\{escapeHtml')
+        self.assertContains(res, "querySelector('.question-text').value = q.text")
+
+    def test_default_section_created(self):
+        tree = self.client.get(self.url, {"format": "json"}).json()
+        self.assertEqual([s["title"] for s in tree["sections"]], ["Section 1"])
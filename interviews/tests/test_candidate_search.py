@@ -0,0 +1,55 @@
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.urls import reverse
+
+from interviews.models import Candidate
+
+
+class CandidateSearchTests(TestCase):
+    """
+    Fuzzy lookup tolerates typos and ranks by similarity; prefix mode autocompletes.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.recruiter = User.objects.create_user(username="hr", password="pw")
+        for name, email in [
+            ("Jonathan Smith", "jsmith@example.com"),
+            ("Joanna Smythe", "joanna@example.com"),
+            ("Maria Garcia", "mgarcia@example.com"),
+            ("Smita Patel", "spatel@example.com"),
+        ]:
+            Candidate.objects.create(full_name=name, email=email)
+
+    def setUp(self):
+        self.client.force_login(self.recruiter)
+        self.url = reverse("interviews:candidate_search")
+
+    def test_fuzzy_tolerates_typos_and_ranks_by_similarity(self):
+        results = self.client.get(self.url, {"q": "jonathon smith"}).json()["results"]
+        self.assertEqual(results[0]["full_name"], "Jonathan Smith")
+        scores = [r["similarity"] for r in results]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+        self.assertTrue(all(0 < s <= 1 for s in scores))
+
+        results = self.client.get(self.url, {"q": "garsia"}).json()["results"]
+        self.assertEqual([r["email"] for r in results], ["mgarcia@example.com"])
+
+    def test_prefix_autocomplete(self):
+        body = self.client.get(self.url, {"q": "jo", "mode": "prefix"}).json()
+        self.assertEqual(
+            [r["full_name"] for r in body["results"]], ["Joanna Smythe", "Jonathan Smith"]
+        )
+        body = self.client.get(self.url, {"q": "SPAT", "mode": "prefix"}).json()
+        self.assertEqual([r["email"] for r in body["results"]], ["spatel@example.com"])
+
+    def test_limit_short_terms_and_validation(self):
+        body = self.client.get(self.url, {"q": "smith", "limit": 1}).json()
+        self.assertEqual(len(body["results"]), 1)
+        self.assertEqual(self.client.get(self.url, {"q": "jo"}).json()["results"], [])
+        self.assertEqual(self.client.get(self.url, {"q": "x", "mode": "regex"}).status_code, 400)
+
+    def test_interviewer_role_is_forbidden(self):
+        self.recruiter.profile.role = "INTERVIEWER"
+        self.recruiter.profile.save()
+        self.assertEqual(self.client.get(self.url, {"q": "smith"}).status_code, 403)
@@ -0,0 +1,68 @@
+import threading
+
+from django.db import connections
+from django.test import TestCase, TransactionTestCase
+
+from interviews.candidates import resolve_candidate, resolve_candidates
+from interviews.models import Candidate
+
+
+class ResolveCandidateTests(TestCase):
+    """
+    Candidates are resolved by email in one upsert; a blank stored name gets filled in.
+    """
+
+    def test_creates_then_fills_blank_name_only(self):
+        with self.assertNumQueries(1):
+            first = resolve_candidate(" Alice@Example.com ")
+        self.assertTrue(first.created)
+        self.assertEqual((first.email, first.full_name), ("alice@example.com", ""))
+
+        with self.assertNumQueries(1):
+            named = resolve_candidate("alice@example.com", "Alice")
+        self.assertFalse(named.created)
+        self.assertEqual((named.pk, named.full_name), (first.pk, "Alice"))
+
+        kept = resolve_candidate("alice@example.com", "Someone Else")
+        self.assertEqual(kept.full_name, "Alice")
+        self.assertEqual(Candidate.objects.get().full_name, "Alice")
+
+    def test_bulk_resolves_in_one_statement(self):
+        Candidate.objects.create(email="old@example.com", full_name="")
+        Candidate.objects.create(email="named@example.com", full_name="Named")
+        pairs = [("new@example.com", ""), ("NEW@example.com", "New"), ("", "Nobody")]
+        pairs += [("old@example.com", "Old"), ("named@example.com", "Renamed")]
+        pairs += [(f"user{i}@example.com", f"User {i}") for i in range(1000)]
+        with self.assertNumQueries(1):
+            candidates = resolve_candidates(pairs)
+        self.assertEqual(len(candidates), 1003)
+        self.assertEqual(candidates["new@example.com"].full_name, "New")
+        self.assertEqual(candidates["old@example.com"].full_name, "Old")
+        self.assertEqual(candidates["named@example.com"].full_name, "Named")
+        self.assertEqual(sum(c.created for c in candidates.values()), 1001)
+        self.assertEqual(Candidate.objects.count(), 1003)
+        self.assertEqual(resolve_candidates([]), {})
+
+
+class ConcurrentResolveTests(TransactionTestCase):
+    def test_concurrent_first_submissions_share_one_candidate(self):
+        barrier = threading.Barrier(4)
+        ids, errors = [], []
+
+        def resolve(i):
+            try:
+                barrier.wait()
+                ids.append(resolve_candidate("race@example.com", f"Racer {i}").pk)
+            except Exception as exc:  # pragma: no cover - reported below
+                errors.append(exc)
+            finally:
+                connections.close_all()
+
+        threads = [threading.Thread(target=resolve, args=(i,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(len(set(ids)), 1)
+        self.assertEqual(Candidate.objects.count(), 1)
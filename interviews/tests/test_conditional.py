@@ -0,0 +1,81 @@
+from django.contrib.auth.models import User
+from django.contrib.messages import get_messages
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+
+from interviews.models import Candidate, Interview, InterviewResponse, Question, Section
+
+
+class ConditionalGetTests(TestCase):
+    """
+    Candidate pages answer revalidation with 304 until the interview changes; receipts are
+    long-lived. Anonymous renders without per-visitor content may be kept by shared caches.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create_user(username="owner", password="pw")
+        self.interview = Interview.objects.create(title="Backend", created_by=self.owner)
+        self.section = Section.objects.create(interview=self.interview, title="Section 1")
+        Question.objects.create(section=self.section, question_text="Why?", order=1)
+
+    def _revalidate(self, url, response):
+        return self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+
+    def test_interview_pages_return_304_until_edited(self):
+        for name in ("detail", "take", "ai_interview", "ai_interview_live"):
+            url = reverse(f"interviews:{name}", args=[self.interview.pk])
+            # The take form sets the CSRF cookie on the first visit, which is never skipped
+            self.client.get(url)
+            first = self.client.get(url)
+            self.assertEqual(first.status_code, 200, name)
+            self.assertIn("Last-Modified", first)
+            self.assertIn("Cookie", first["Vary"])
+            if name == "take":  # carries the visitor's CSRF token
+                self.assertIn("private", first["Cache-Control"])
+                self.assertIn("no-cache", first["Cache-Control"])
+            else:
+                self.assertEqual(first["Cache-Control"], "public, max-age=0, s-maxage=60")
+            with self.assertNumQueries(0):
+                again = self._revalidate(url, first)
+            self.assertEqual(again.status_code, 304, name)
+
+        url = reverse("interviews:take", args=[self.interview.pk])
+        first = self.client.get(url)
+        with self.captureOnCommitCallbacks(execute=True):
+            Question.objects.create(section=self.section, question_text="New", order=2)
+        self.assertEqual(self._revalidate(url, first).status_code, 200)
+
+    def test_etag_depends_on_viewer(self):
+        url = reverse("interviews:detail", args=[self.interview.pk])
+        anonymous = self.client.get(url)
+        self.client.force_login(self.owner)
+        signed_in = self._revalidate(url, anonymous)
+        self.assertEqual(signed_in.status_code, 200)
+        # The signed-in header is never stored by shared caches
+        self.assertIn("private", signed_in["Cache-Control"])
+
+    def test_receipt_is_cacheable_after_flash_message(self):
+        response = InterviewResponse.objects.create(
+            interview=self.interview,
+            candidate=Candidate.objects.create(full_name="A", email="a@example.com"),
+            answers_transcript={},
+        )
+        url = reverse("interviews:response_detail", args=[response.pk])
+        first = self.client.get(url)
+        self.assertEqual(first["Cache-Control"], "public, max-age=604800")
+        self.assertEqual(self._revalidate(url, first).status_code, 304)
+
+        # A receipt carrying the one-off "submitted" message is rendered and not stored
+        storage = get_messages(first.wsgi_request)
+        storage.add(20, "Interview submitted successfully!")
+        storage.update(first)
+        self.client.cookies.update(first.cookies)
+        flashed = self._revalidate(url, first)
+        self.assertEqual(flashed.status_code, 200)
+        self.assertIn("no-cache", flashed["Cache-Control"])
+        self.assertIn("private", flashed["Cache-Control"])
+
+        self.client.force_login(self.owner)
+        self.assertEqual(self.client.get(url)["Cache-Control"], "private, max-age=604800")
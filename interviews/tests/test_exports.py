@@ -0,0 +1,116 @@
+import csv
+import gzip
+import io
+import json
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from interviews.models import Answer, Candidate, Interview, InterviewResponse, Question, Section
+
+
+@override_settings(EXPORT_CHUNK_SIZE=3)
+class InterviewExportTests(TestCase):
+    """
+    Exports stream one row per response, in section order, from answers or the transcript.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create_user(username="owner", password="pw")
+        self.interview = Interview.objects.create(title="Backend", created_by=self.owner)
+        first = Section.objects.create(interview=self.interview, title="First", order=1)
+        second = Section.objects.create(interview=self.interview, title="Second", order=2)
+        # Global order differs from section order on purpose
+        self.q_late = Question.objects.create(section=second, question_text="Why us?", order=0)
+        self.q_pick = Question.objects.create(
+            section=first,
+            question_text="Stack",
+            question_type="multiple_choice",
+            options=["Django", "Flask"],
+            order=5,
+        )
+        for i in range(7):
+            candidate = Candidate.objects.create(full_name=f"C{i}", email=f"c{i}@example.com")
+            response = InterviewResponse.objects.create(
+                interview=self.interview,
+                candidate=candidate,
+                answers_transcript={
+                    "answers": [
+                        {"question": self.q_late.id, "text": f"legacy {i}", "option_values": []},
+                    ]
+                },
+            )
+            if i % 2:
+                Answer.objects.bulk_create(
+                    [
+                        Answer(response=response, question=self.q_late, answer_text=f"fit {i}"),
+                        Answer(
+                            response=response,
+                            question=self.q_pick,
+                            selected_option_ids=[0, 1],
+                        ),
+                    ]
+                )
+        self.url = reverse("interviews:export", args=[self.interview.pk])
+        self.client.force_login(self.owner)
+
+    def _body(self, res):
+        return b"".join(res.streaming_content)
+
+    def test_csv_has_one_column_per_question_in_section_order(self):
+        res = self.client.get(self.url)
+        self.assertEqual(res["Content-Type"], "text/csv; charset=utf-8")
+        rows = list(csv.reader(io.StringIO(self._body(res).decode("utf-8"))))
+        self.assertEqual(
+            rows[0],
+            ["response_id", "submitted_at", "candidate_name", "candidate_email"]
+            + ["Stack", "Why us?"],
+        )
+        self.assertEqual(len(rows), 8)
+        by_name = {row[2]: row[4:] for row in rows[1:]}
+        self.assertEqual(by_name["C1"], ["Django; Flask", "fit 1"])
+        # Falls back to the JSON snapshot when no relational answers exist
+        self.assertEqual(by_name["C0"], ["", "legacy 0"])
+
+    def test_csv_neutralizes_formula_cells(self):
+        candidate = Candidate.objects.create(full_name="=HYPERLINK(1)", email="x@example.com")
+        response = InterviewResponse.objects.create(interview=self.interview, candidate=candidate)
+        Answer.objects.create(response=response, question=self.q_late, answer_text="@SUM(A1)")
+        Answer.objects.create(response=response, question=self.q_pick, answer_text="-2+3")
+        rows = list(csv.reader(io.StringIO(self._body(self.client.get(self.url)).decode("utf-8"))))
+        self.assertEqual(rows[-1][2:], ["'=HYPERLINK(1)", "x@example.com", "'-2+3", "'@SUM(A1)"])
+        # JSONL keeps the values as submitted
+        res = self.client.get(self.url, {"format": "jsonl"})
+        record = json.loads(self._body(res).decode("utf-8").splitlines()[-1])
+        self.assertEqual(record["candidate"]["full_name"], "=HYPERLINK(1)")
+
+    def test_jsonl_and_gzip(self):
+        res = self.client.get(self.url, {"format": "jsonl", "gzip": "1"})
+        self.assertEqual(res["Content-Type"], "application/gzip")
+        self.assertIn("responses.jsonl.gz", res["Content-Disposition"])
+        lines = gzip.decompress(self._body(res)).decode("utf-8").splitlines()
+        records = [json.loads(line) for line in lines]
+        self.assertEqual(len(records), 7)
+        self.assertEqual(records[1]["candidate"]["full_name"], "C1")
+        self.assertEqual(records[1]["answers"][1]["value"], "fit 1")
+
+    def test_queries_scale_with_chunks_not_rows(self):
+        self.client.get(self.url)  # warm snapshot
+        with CaptureQueriesContext(connection) as ctx:
+            self._body(self.client.get(self.url))
+        # 7 responses in chunks of 3: per chunk one fetch + one answers prefetch
+        response_queries = [q for q in ctx.captured_queries if "interviews_answer" in q["sql"]]
+        self.assertEqual(len(response_queries), 3)
+
+    def test_rejects_unknown_format_and_non_owner(self):
+        self.assertEqual(self.client.get(self.url, {"format": "xml"}).status_code, 400)
+        User.objects.create_user(username="other", password="pw")
+        self.client.login(username="other", password="pw")
+        self.assertRedirects(
+            self.client.get(self.url), reverse("interviews:detail", args=[self.interview.pk])
+        )
@@ -0,0 +1,78 @@
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from interviews.models import Interview, InterviewResponse, InterviewRollup, Question, Section
+
+
+class InterviewListTests(TestCase):
+    """
+    The list page runs a fixed number of queries whatever the number of interviews,
+    paginates, and refreshes cached cards when an interview's structure changes.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create_user(username="owner", password="pw")
+        self.url = reverse("interviews:list")
+
+    def _interview(self, title, questions=2):
+        interview = Interview.objects.create(title=title, created_by=self.owner)
+        section = Section.objects.create(interview=interview, title="Section 1")
+        for i in range(questions):
+            Question.objects.create(section=section, question_text=f"Q{i}", order=i)
+        return interview
+
+    def _query_count(self):
+        with CaptureQueriesContext(connection) as ctx:
+            self.assertEqual(self.client.get(self.url).status_code, 200)
+        return len(ctx.captured_queries)
+
+    def test_query_count_does_not_grow_with_interviews(self):
+        self.client.force_login(self.owner)
+        self._interview("First")
+        baseline = self._query_count()
+        for i in range(5):
+            self._interview(f"Extra {i}", questions=i)
+        cache.clear()
+        self.assertEqual(self._query_count(), baseline)
+
+    def test_counts_are_annotated(self):
+        interview = self._interview("Backend", questions=3)
+        InterviewResponse.objects.bulk_create(
+            InterviewResponse(interview=interview) for _ in range(7)
+        )
+        # A rollup total that disagrees is not what the list shows
+        InterviewRollup.objects.create(interview=interview, kind="total", count=9)
+        self.client.force_login(self.owner)
+        res = self.client.get(self.url)
+        card = res.context["user_interviews"][0]
+        self.assertEqual((card.question_count, card.response_count), (3, 7))
+        self.assertContains(res, "3 questions")
+        self.assertContains(res, "7 responses")
+
+        # Same cached counter as the responses page, so both move together
+        with self.captureOnCommitCallbacks(execute=True):
+            InterviewResponse.objects.filter(interview=interview).first().delete()
+        self.assertContains(self.client.get(self.url), "6 responses")
+        responses_page = self.client.get(reverse("interviews:responses", args=[interview.pk]))
+        self.assertEqual(responses_page.context["total_responses"], 6)
+
+    @override_settings(INTERVIEW_LIST_PAGE_SIZE=2)
+    def test_pagination(self):
+        for i in range(5):
+            self._interview(f"Interview {i}")
+        res = self.client.get(self.url, {"page": 3})
+        self.assertEqual([i.title for i in res.context["interviews"]], ["Interview 0"])
+        self.assertContains(res, "Page 3 of 3")
+
+    def test_cached_card_refreshes_on_structure_change(self):
+        interview = self._interview("Backend", questions=1)
+        self.assertContains(self.client.get(self.url), "1 questions")
+        section = interview.sections.get()
+        with self.captureOnCommitCallbacks(execute=True):
+            Question.objects.create(section=section, question_text="Another", order=5)
+        self.assertContains(self.client.get(self.url), "2 questions")
@@ -0,0 +1,148 @@
+import os
+import tempfile
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from interviews.answers import load_answers
+from interviews.models import Answer, Interview, InterviewResponse, Question, Section
+
+
+class RematerializeAnswersTests(TestCase):
+    """
+    rematerialize_answers rebuilds Answer rows from snapshots or snapshots from rows, in
+    chunks, and verifies every range with checksums of both sides.
+    """
+
+    def setUp(self):
+        owner = User.objects.create_user(username="owner", password="pw")
+        self.interview = Interview.objects.create(title="Backend", created_by=owner)
+        section = Section.objects.create(interview=self.interview, title="Intro")
+        self.text_q = Question.objects.create(section=section, question_text="Why?", order=1)
+        self.pick_q = Question.objects.create(
+            section=section,
+            question_text="Stack",
+            question_type="multiple_choice",
+            options=["Django", "Flask"],
+            order=2,
+        )
+        self.checkpoint = os.path.join(tempfile.mkdtemp(), "rematerialize.json")
+
+    def _response(self, text, option_ids, interview=None):
+        return InterviewResponse.objects.create(
+            interview=interview or self.interview,
+            answers_transcript={
+                "answers": [
+                    {"question": self.text_q.id, "text": text, "option_ids": []},
+                    {"question": self.pick_q.id, "text": "", "option_ids": option_ids},
+                ],
+                "source": "api",
+            },
+        )
+
+    def _run(self, *args):
+        out = StringIO()
+        call_command(
+            "rematerialize_answers",
+            *args,
+            "--batch-size=2",
+            "--range-size=3",
+            f"--checkpoint={self.checkpoint}",
+            stdout=out,
+        )
+        return out.getvalue()
+
+    def _rows(self, response):
+        return list(
+            response.answers.order_by("pk").values_list(
+                "question_id", "answer_text", "selected_option_ids"
+            )
+        )
+
+    def test_rows_rebuilt_from_snapshots(self):
+        responses = [self._response(f"Answer {i}", [i % 2]) for i in range(5)]
+        # An existing row with a stale value, and a response whose rows are incomplete
+        Answer.objects.create(response=responses[0], question=self.text_q, answer_text="Old")
+        Answer.objects.create(response=responses[0], question=self.pick_q)
+        Answer.objects.create(response=responses[1], question=self.pick_q)
+
+        out = self._run("--to=rows")
+        self.assertIn("Answer rows created: 8, updated: 2, deleted: 1", out)
+        self.assertIn("Answers verified: 10", out)
+        self.assertEqual(
+            self._rows(responses[3]), [(self.text_q.id, "Answer 3", []), (self.pick_q.id, "", [1])]
+        )
+        self.assertFalse(os.path.exists(self.checkpoint))
+
+        # Idempotent: a second run writes nothing and still verifies
+        self.assertIn("Answer rows created: 0, updated: 0, deleted: 0", self._run("--to=rows"))
+
+    def test_snapshots_rebuilt_from_rows_with_filters(self):
+        other = Interview.objects.create(title="Other", created_by=self.interview.created_by)
+        response = InterviewResponse.objects.create(
+            interview=self.interview, answers_transcript={"transcript": "Hi", "source": "form"}
+        )
+        Answer.objects.create(response=response, question=self.text_q, answer_text="Rows")
+        skipped = InterviewResponse.objects.create(interview=other, answers_transcript={})
+        Answer.objects.create(response=skipped, question=self.text_q, answer_text="Other")
+
+        out = self._run("--to=snapshots", f"--interview={self.interview.pk}", "--since=2000-01-01")
+        self.assertIn("Snapshots updated: 1", out)
+        response.refresh_from_db()
+        self.assertEqual(
+            response.answers_transcript,
+            {
+                "transcript": "Hi",
+                "source": "form",
+                "answers": [{"question": self.text_q.id, "text": "Rows", "option_ids": []}],
+            },
+        )
+        skipped.refresh_from_db()
+        self.assertEqual(skipped.answers_transcript, {})
+        self.assertIn("Snapshots updated: 0", self._run("--to=snapshots", "--since=2999-01-01"))
+
+    def test_verify_only_reports_mismatched_ranges(self):
+        response = self._response("Snapshot", [0])
+        Answer.objects.create(response=response, question=self.text_q, answer_text="Different")
+        with self.assertRaisesMessage(CommandError, "Checksums differ"):
+            self._run("--to=rows", "--verify-only")
+        self.assertEqual(self._rows(response), [(self.text_q.id, "Different", [])])
+        with self.assertRaisesMessage(CommandError, "--since"):
+            self._run("--to=rows", "--since=yesterday")
+
+    @override_settings(ANSWER_STORAGE="json")
+    def test_version_less_snapshots_keep_their_question_text(self):
+        # Submitted before versioning: the snapshot carries the wording it was answered under
+        response = InterviewResponse.objects.create(
+            interview=self.interview,
+            answers_transcript={
+                "answers": [{"question": self.text_q.id, "question_text": "Why, originally?"}]
+            },
+        )
+        Answer.objects.create(response=response, question=self.text_q, answer_text="Because")
+        Answer.objects.create(response=response, question=self.pick_q, selected_option_ids=[1])
+
+        self.assertIn("Snapshots updated: 1", self._run("--to=snapshots"))
+        response.refresh_from_db()
+        self.assertEqual(
+            response.answers_transcript["answers"][0],
+            {
+                "question": self.text_q.id,
+                "question_text": "Why, originally?",
+                "text": "Because",
+                "option_ids": [],
+            },
+        )
+        Answer.objects.all().delete()
+        items = load_answers([response])[0].answer_items
+        # The item that never had a copy falls back to the current wording
+        self.assertEqual(
+            [(i.question_text, i.text, i.option_values) for i in items],
+            [("Why, originally?", "Because", []), ("Stack", "", ["Flask"])],
+        )
+        receipt = self.client.get(reverse("interviews:response_detail", args=[response.pk]))
+        self.assertContains(receipt, "Why, originally?")
@@ -0,0 +1,101 @@
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from interviews.models import Answer, Candidate, Interview, InterviewResponse, Question, Section
+from interviews.pagination import decode_cursor, encode_cursor
+
+
+@override_settings(RESPONSES_PAGE_SIZE=5)
+class InterviewResponsesPageTests(TestCase):
+    """
+    The responses page is keyset-paginated and loads each page in a fixed number of queries.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create_user(username="owner", password="pw")
+        self.interview = Interview.objects.create(title="Backend", created_by=self.owner)
+        section = Section.objects.create(interview=self.interview, title="Section 1")
+        self.questions = [
+            Question.objects.create(section=section, question_text=f"Q{i}", order=i)
+            for i in range(3)
+        ]
+        now = timezone.now()
+        # Pairs of responses share a timestamp to exercise the id tie-breaker
+        for i in range(12):
+            candidate = Candidate.objects.create(full_name=f"C{i}", email=f"c{i}@example.com")
+            response = InterviewResponse.objects.create(
+                interview=self.interview,
+                candidate=candidate,
+                submitted_at=now - timedelta(minutes=i // 2),
+                answers_transcript={"answers": [{"question_text": "Legacy", "text": f"t{i}"}]},
+            )
+            if i % 4:
+                Answer.objects.bulk_create(
+                    Answer(response=response, question=q, answer_text=f"a{i}")
+                    for q in self.questions
+                )
+        self.url = reverse("interviews:responses", args=[self.interview.pk])
+        self.client.force_login(self.owner)
+        self.expected = list(
+            InterviewResponse.objects.order_by("-submitted_at", "-id").values_list(
+                "candidate__full_name", flat=True
+            )
+        )
+
+    def _names(self, res):
+        return [r.candidate.full_name for r in res.context["responses"]]
+
+    def test_pages_walk_all_responses_newest_first(self):
+        seen = []
+        res = self.client.get(self.url)
+        while True:
+            seen += self._names(res)
+            cursor = res.context["page"].next_cursor
+            if not cursor:
+                break
+            res = self.client.get(self.url, {"after": cursor})
+        self.assertEqual(seen, self.expected)
+
+        # And back towards newer rows from the last page
+        back = self.client.get(self.url, {"before": res.context["page"].prev_cursor})
+        self.assertEqual(self._names(back), self.expected[5:10])
+
+    def test_query_count_is_constant_per_page(self):
+        self.client.get(self.url)  # warm snapshot and counter
+        with CaptureQueriesContext(connection) as first:
+            res = self.client.get(self.url)
+        with CaptureQueriesContext(connection) as second:
+            self.client.get(self.url, {"after": res.context["page"].next_cursor})
+        self.assertEqual(len(first), len(second))
+        self.assertLessEqual(len(first), 6)
+        self.assertContains(res, "12 responses")
+        self.assertContains(res, "a1")
+        # Transcript fallback for responses without relational answers
+        self.assertContains(res, "t0")
+
+    def test_counter_tracks_new_responses(self):
+        self.client.get(self.url)
+        with self.captureOnCommitCallbacks(execute=True):
+            InterviewResponse.objects.create(interview=self.interview)
+        self.assertContains(self.client.get(self.url), "13 responses")
+
+    def test_invalid_cursor_falls_back_to_first_page(self):
+        self.assertIsNone(decode_cursor("not-a-cursor"))
+        res = self.client.get(self.url, {"after": "not-a-cursor"})
+        self.assertEqual(self._names(res), self.expected[:5])
+        now = timezone.now()
+        self.assertEqual(decode_cursor(encode_cursor(now, 7)), (now, 7))
+
+    def test_non_owner_is_redirected(self):
+        User.objects.create_user(username="other", password="pw")
+        self.client.login(username="other", password="pw")
+        res = self.client.get(self.url)
+        self.assertRedirects(res, reverse("interviews:detail", args=[self.interview.pk]))
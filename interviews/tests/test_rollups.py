@@ -0,0 +1,106 @@
+import json
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from interviews.models import Interview, InterviewResponse, InterviewRollup, Question, Section
+from interviews.rollups import get_interview_rollup
+
+
+class InterviewRollupTests(TestCase):
+    """
+    Submissions bump totals, per-day and per-option counters; the rebuild command agrees.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create_user(username="owner", password="pw")
+        self.interview = Interview.objects.create(title="Backend", created_by=self.owner)
+        section = Section.objects.create(interview=self.interview, title="Section 1")
+        self.text_q = Question.objects.create(section=section, question_text="Why?", order=1)
+        self.pick_q = Question.objects.create(
+            section=section,
+            question_text="Stack",
+            question_type="multiple_choice",
+            options=["Django", "Flask"],
+            order=2,
+        )
+
+    def _submit_json(self, email, option):
+        res = self.client.post(
+            reverse("interviews:submit_json", args=[self.interview.pk]),
+            json.dumps(
+                {
+                    "candidate_name": "Alice",
+                    "candidate_email": email,
+                    "answers": [
+                        {"question": self.text_q.id, "text": "because"},
+                        {"question": self.pick_q.id, "option_values": [option]},
+                    ],
+                }
+            ),
+            content_type="application/json",
+        )
+        self.assertEqual(res.status_code, 200, res.content)
+
+    def _submit_form(self, email, option):
+        res = self.client.post(
+            reverse("interviews:take", args=[self.interview.pk]),
+            {
+                "candidate_name": "Bob",
+                "candidate_email": email,
+                f"question_{self.text_q.id}": "hi",
+                f"question_{self.pick_q.id}": option,
+            },
+        )
+        self.assertEqual(res.status_code, 302)
+
+    def test_submissions_increment_rollups(self):
+        self._submit_json("a@example.com", "Django")
+        self._submit_json("b@example.com", "Django")
+        self._submit_form("c@example.com", "Flask")
+
+        rollup = get_interview_rollup(self.interview.pk)
+        self.assertEqual(rollup["total"], 3)
+        self.assertEqual(rollup["daily"], [(timezone.localdate(), 3)])
+        # Counted by option id ("Django" is option 0, "Flask" option 1)
+        self.assertEqual(rollup["options"], {self.pick_q.id: {0: 2, 1: 1}})
+
+        self.client.force_login(self.owner)
+        stats = self.client.get(reverse("interviews:stats", args=[self.interview.pk])).json()
+        self.assertEqual(stats["total_responses"], 3)
+        self.assertEqual(stats["options"][str(self.pick_q.id)], {"Django": 2, "Flask": 1})
+        page = self.client.get(reverse("interviews:responses", args=[self.interview.pk]))
+        self.assertContains(page, "2 (67%)")
+
+    def test_rebuild_command_matches_incremental_counts(self):
+        self._submit_json("a@example.com", "Django")
+        self._submit_form("b@example.com", "Flask")
+        # Legacy response carrying only the JSON snapshot
+        InterviewResponse.objects.create(
+            interview=self.interview,
+            answers_transcript={"answers": [{"question": self.pick_q.id, "option_ids": [1]}]},
+        )
+        incremental = get_interview_rollup(self.interview.pk)
+
+        out = StringIO()
+        call_command("rebuild_rollups", "--chunk-size", "2", stdout=out)
+        self.assertIn("Rebuilt rollups for 1 interview(s), 3 responses", out.getvalue())
+        rebuilt = get_interview_rollup(self.interview.pk)
+        self.assertEqual(rebuilt["total"], 3)
+        self.assertEqual(rebuilt["options"], {self.pick_q.id: {0: 1, 1: 2}})
+        self.assertEqual(incremental["options"][self.pick_q.id], {0: 1, 1: 1})
+        self.assertEqual(
+            InterviewRollup.objects.filter(interview=self.interview, kind="total").count(), 1
+        )
+
+    def test_stats_are_owner_only(self):
+        User.objects.create_user(username="other", password="pw")
+        self.client.login(username="other", password="pw")
+        res = self.client.get(reverse("interviews:stats", args=[self.interview.pk]))
+        self.assertEqual(res.status_code, 403)
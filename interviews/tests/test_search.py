@@ -0,0 +1,99 @@
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from interviews.models import (
+    Answer,
+    AnswerTextVector,
+    Candidate,
+    Interview,
+    InterviewResponse,
+    Question,
+    Section,
+    TranscriptVector,
+)
+from interviews.search import build_search_query
+
+
+class InterviewSearchTests(TestCase):
+    """
+    Full-text search ranks and highlights hits from answers and transcripts, paged by cursor.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create_user(username="owner", password="pw")
+        self.interview = Interview.objects.create(title="Backend", created_by=self.owner)
+        section = Section.objects.create(interview=self.interview, title="Section 1")
+        self.question = Question.objects.create(
+            section=section, question_text="Tell us about databases", order=1
+        )
+        texts = [
+            "I tuned Postgres indexes for a billing system",
+            "Mostly MySQL & some Postgres replication and Postgres upgrades",
+            "I prefer spreadsheets",
+        ]
+        for i, text in enumerate(texts):
+            candidate = Candidate.objects.create(full_name=f"C{i}", email=f"c{i}@example.com")
+            response = InterviewResponse.objects.create(
+                interview=self.interview, candidate=candidate, answers_transcript={}
+            )
+            Answer.objects.create(response=response, question=self.question, answer_text=text)
+        InterviewResponse.objects.create(
+            interview=self.interview,
+            answers_transcript={"transcript": "Candidate: we migrated to postgres last year"},
+        )
+        # Other interviews never leak into results
+        other = Interview.objects.create(title="Other", created_by=self.owner)
+        InterviewResponse.objects.create(
+            interview=other, answers_transcript={"transcript": "postgres postgres"}
+        )
+        self.url = reverse("interviews:search", args=[self.interview.pk])
+        self.client.force_login(self.owner)
+
+    def test_matching_uses_the_expression_indexes(self):
+        query = build_search_query("postgres")
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+        answers = Answer.objects.alias(vector=AnswerTextVector()).filter(vector=query)
+        self.assertIn("interviews_answer_search_gin", answers.explain())
+        transcripts = InterviewResponse.objects.alias(vector=TranscriptVector()).filter(
+            vector=query
+        )
+        self.assertIn("interviews_response_search_gin", transcripts.explain())
+
+    def test_ranked_highlighted_hits_from_answers_and_transcripts(self):
+        body = self.client.get(self.url, {"q": "postgres"}).json()
+        results = body["results"]
+        self.assertEqual(len(results), 3)
+        self.assertEqual({r["kind"] for r in results}, {"answer", "transcript"})
+        # Two mentions outrank one
+        self.assertEqual(results[0]["candidate_name"], "C1")
+        self.assertEqual(results[0]["question_text"], "Tell us about databases")
+        self.assertIn("<mark>Postgres</mark>", results[0]["headline"])
+        # Stored text is escaped before highlighting
+        self.assertIn("MySQL &amp; some", results[0]["headline"])
+        ranks = [r["rank"] for r in results]
+        self.assertEqual(ranks, sorted(ranks, reverse=True))
+        self.assertIsNone(body["next_cursor"])
+
+    @override_settings(SEARCH_PAGE_SIZE=1)
+    def test_cursor_pages_through_all_hits(self):
+        seen = []
+        params = {"q": "postgres"}
+        while True:
+            body = self.client.get(self.url, params).json()
+            seen += [(r["kind"], r["response_id"]) for r in body["results"]]
+            if not body["next_cursor"]:
+                break
+            params["after"] = body["next_cursor"]
+        self.assertEqual(len(seen), 3)
+        self.assertEqual(len(set(seen)), 3)
+
+    def test_empty_query_and_permissions(self):
+        self.assertEqual(self.client.get(self.url, {"q": "  "}).json()["results"], [])
+        User.objects.create_user(username="other", password="pw")
+        self.client.login(username="other", password="pw")
+        self.assertEqual(self.client.get(self.url, {"q": "postgres"}).status_code, 403)
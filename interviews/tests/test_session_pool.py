@@ -0,0 +1,67 @@
+from unittest import mock
+
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from interviews.session_pool import SessionPool
+from interviews.upstream import RealtimeClient
+from interviews.upstream_stub import StubUpstream
+
+PAYLOAD = {"model": "m", "instructions": "ask"}
+
+
+class SessionPoolTests(SimpleTestCase):
+    """
+    Pre-minted sessions are handed out warm, refreshed before expiry and accounted for.
+    """
+
+    def _pool(self, stub, **kwargs):
+        return SessionPool(client=RealtimeClient(stub.base_url), **kwargs)
+
+    def test_refill_then_hit(self):
+        with StubUpstream(ttl=60) as stub:
+            pool = self._pool(stub, depth=2, min_ttl=10)
+            self.assertIsNone(pool.take(PAYLOAD))
+            pool.register(PAYLOAD, "k")
+            self.assertEqual(pool.refill_once(), 2)
+            self.assertEqual(pool.take(PAYLOAD)["id"], "sess_1")
+        stats = pool.stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["depth"]), (1, 1, 1))
+        self.assertEqual(stats["hit_rate"], 0.5)
+
+    def test_near_expiry_sessions_are_discarded_and_replaced(self):
+        with StubUpstream(ttl=5) as stub:
+            pool = self._pool(stub, depth=2, min_ttl=10)
+            pool.register(PAYLOAD, "k")
+            pool.refill_once()
+            # Both entries already fall inside min_ttl: discarded and re-minted
+            pool.refill_once()
+            self.assertIsNone(pool.take(PAYLOAD))
+        stats = pool.stats()
+        self.assertEqual(stats["minted"], 4)
+        self.assertEqual(stats["expired"], 4)
+        self.assertEqual(stats["expiry_waste"], 1.0)
+
+    def test_idle_payloads_stop_refilling(self):
+        with StubUpstream() as stub:
+            pool = self._pool(stub, depth=1, idle_timeout=0)
+            pool.register(PAYLOAD, "k")
+            self.assertEqual(pool.refill_once(), 0)
+        self.assertEqual(pool.stats()["hot_payloads"], 0)
+
+
+class RealtimeSessionPoolViewTests(TestCase):
+    def test_view_serves_from_pool_after_warmup(self):
+        url = reverse("interviews:ai_interview_realtime_session")
+        with (
+            StubUpstream() as stub,
+            override_settings(OPENAI_API_KEY="k", OPENAI_API_BASE=stub.base_url),
+        ):
+            pool = SessionPool(client=RealtimeClient(stub.base_url), depth=1, min_ttl=10)
+            with mock.patch("interviews.views.get_session_pool", return_value=pool):
+                first = self.client.post(url, "{}", content_type="application/json")
+                pool.refill_once()
+                second = self.client.post(url, "{}", content_type="application/json")
+        self.assertEqual(first.json()["id"], "sess_1")
+        self.assertEqual(second.json()["id"], "sess_2")
+        self.assertEqual(pool.stats()["hits"], 1)
@@ -0,0 +1,127 @@
+import json
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from interviews.cache import LRUCache
+from interviews.checks import check_shared_cache
+from interviews.models import Interview, Question, Section
+from interviews.prompts import estimate_tokens, get_realtime_instructions
+from interviews.snapshots import get_interview_snapshot
+
+
+class InterviewSnapshotTests(TestCase):
+    """
+    Compiled interview snapshots are served from cache and rebuilt after edits.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create_user(username="owner", password="pw")
+        self.interview = Interview.objects.create(title="Backend", created_by=self.owner)
+        self.s1 = Section.objects.create(interview=self.interview, title="Intro", order=0)
+        self.s2 = Section.objects.create(interview=self.interview, title="Deep dive", order=1)
+        self.q1 = Question.objects.create(section=self.s2, question_text="Why?", order=1)
+        self.q2 = Question.objects.create(
+            section=self.s1,
+            question_text="Pick one",
+            question_type="multiple_choice",
+            options=["A", "B"],
+            order=0,
+        )
+
+    def test_structure_is_ordered_and_indexed(self):
+        snap = get_interview_snapshot(self.interview.pk)
+        self.assertEqual([s.title for s in snap.sections], ["Intro", "Deep dive"])
+        self.assertEqual([q.id for q in snap.sections[0].questions], [self.q2.id])
+        self.assertEqual([q.id for q in snap.questions], [self.q2.id, self.q1.id])
+        self.assertEqual(snap.questions_by_id[self.q2.id].option_set, frozenset({"A", "B"}))
+
+    def test_warm_reads_cost_zero_queries(self):
+        get_interview_snapshot(self.interview.pk)
+        with self.assertNumQueries(0):
+            snap = get_interview_snapshot(self.interview.pk)
+        self.assertEqual(snap.title, "Backend")
+
+    def test_missing_interview_returns_none(self):
+        self.assertIsNone(get_interview_snapshot(0))
+
+    def test_builder_edit_invalidates_snapshot(self):
+        before = get_interview_snapshot(self.interview.pk)
+        self.client.force_login(self.owner)
+        with self.captureOnCommitCallbacks(execute=True):
+            res = self.client.post(
+                reverse("interviews:edit", args=[self.interview.pk]),
+                json.dumps({"action": "add_option", "question_id": self.q2.id, "option_text": "C"}),
+                content_type="application/json",
+                HTTP_X_REQUESTED_WITH="XMLHttpRequest",
+            )
+        self.assertEqual(res.status_code, 200)
+        after = get_interview_snapshot(self.interview.pk)
+        self.assertNotEqual(before.version, after.version)
+        self.assertEqual(after.questions_by_id[self.q2.id].options, ("A", "B", "C"))
+
+
+class ProcessLocalCacheTests(SimpleTestCase):
+    """
+    With a process-local cache, version bumps stay in one worker: the local tier expires
+    its entries so other workers rebuild, and the deploy check asks for a shared cache.
+    """
+
+    def test_local_entries_expire(self):
+        local = LRUCache()
+        with mock.patch("interviews.cache.time.monotonic", return_value=100.0):
+            local.set("snapshot", "old", timeout=60)
+            local.set("forever", "kept")
+        with mock.patch("interviews.cache.time.monotonic", return_value=159.0):
+            self.assertEqual(local.get("snapshot"), "old")
+        with mock.patch("interviews.cache.time.monotonic", return_value=160.0):
+            self.assertIsNone(local.get("snapshot"))
+            self.assertEqual(local.get("forever"), "kept")
+        self.assertEqual(len(local), 1)
+
+    def test_deploy_check_requires_a_shared_cache(self):
+        locmem = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+        with override_settings(CACHES=locmem):
+            self.assertEqual([w.id for w in check_shared_cache(None)], ["interviews.W001"])
+        redis = {"default": {"BACKEND": "django.core.cache.backends.redis.RedisCache"}}
+        with override_settings(CACHES=redis):
+            self.assertEqual(check_shared_cache(None), [])
+
+
+class RealtimeInstructionsTests(TestCase):
+    """
+    Realtime instructions are memoized per interview version.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create_user(username="owner", password="pw")
+        self.interview = Interview.objects.create(title="Backend", created_by=self.owner)
+        self.section = Section.objects.create(interview=self.interview, title="Intro")
+        Question.objects.create(section=self.section, question_text="Tell me about you.")
+
+    def test_cached_after_first_build(self):
+        first = get_realtime_instructions(self.interview)
+        self.assertIn("1. Tell me about you.", first.text)
+        self.assertEqual(first.estimated_tokens, estimate_tokens(first.text))
+        with self.assertNumQueries(0):
+            self.assertEqual(get_realtime_instructions(self.interview), first)
+
+    def test_rebuilt_after_edit(self):
+        get_realtime_instructions(self.interview)
+        with self.captureOnCommitCallbacks(execute=True):
+            Question.objects.create(section=self.section, question_text="Why us?", order=1)
+        self.assertIn("2. Why us?", get_realtime_instructions(self.interview).text)
+
+    def test_warm_command(self):
+        out = StringIO()
+        call_command("warm_interview_cache", stdout=out)
+        self.assertIn("Warmed 1 interview(s)", out.getvalue())
+        with self.assertNumQueries(0):
+            get_realtime_instructions(get_interview_snapshot(self.interview.pk))
@@ -0,0 +1,215 @@
+import json
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from interviews.models import Answer, Interview, InterviewResponse, Question, Section
+from interviews.snapshots import get_interview_snapshot
+from interviews.versions import publish_interview
+
+
+class SubmitJsonTests(TestCase):
+    """
+    interview_submit_json persists a submission in a constant number of queries.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create_user(username="owner", password="pw")
+        self.interview = Interview.objects.create(title="Backend", created_by=self.owner)
+        self.section = Section.objects.create(interview=self.interview, title="Section 1")
+        self.questions = [
+            Question.objects.create(
+                section=self.section,
+                question_text=f"Question {i}",
+                question_type="multiple_choice" if i % 2 else "text",
+                options=["Yes", "No"] if i % 2 else [],
+                order=i,
+            )
+            for i in range(60)
+        ]
+        self.url = reverse("interviews:submit_json", args=[self.interview.pk])
+
+    def _payload(self, questions, email):
+        answers = []
+        for q in questions:
+            if q.question_type == "multiple_choice":
+                answers.append({"question": q.id, "option_values": ["Yes"]})
+            else:
+                answers.append({"question": q.id, "text": f"answer {q.id}"})
+        return json.dumps(
+            {
+                "candidate_name": "Alice",
+                "candidate_email": email,
+                "answers": answers,
+                "source": "realtime",
+            }
+        )
+
+    def _submit(self, questions, email):
+        with CaptureQueriesContext(connection) as ctx:
+            res = self.client.post(
+                self.url, self._payload(questions, email), content_type="application/json"
+            )
+        self.assertEqual(res.status_code, 200, res.content)
+        return res.json(), len(ctx.captured_queries)
+
+    def test_query_count_is_independent_of_answer_count(self):
+        # Warm the snapshot and its published version (first submission publishes it)
+        publish_interview(get_interview_snapshot(self.interview.pk))
+        _, few = self._submit(self.questions[:2], "few@example.com")
+        _, many = self._submit(self.questions, "many@example.com")
+        self.assertEqual(few, many)
+
+    def test_answers_materialized_and_snapshot_stored(self):
+        body, _ = self._submit(self.questions[:4], "alice@example.com")
+        response = InterviewResponse.objects.get(pk=body["response_id"])
+        self.assertEqual(response.answers_transcript["source"], "realtime")
+        self.assertEqual(len(response.answers_transcript["answers"]), 4)
+
+        answers = {a.question_id: a for a in Answer.objects.filter(response=response)}
+        self.assertEqual(len(answers), 4)
+        self.assertEqual(
+            answers[self.questions[0].id].answer_text, f"answer {self.questions[0].id}"
+        )
+        # Selections are stored as the question's option ids ("Yes" is option 0)
+        self.assertEqual(answers[self.questions[1].id].selected_option_ids, [0])
+
+    def test_rejects_invalid_option(self):
+        payload = json.dumps(
+            {
+                "candidate_name": "Alice",
+                "candidate_email": "alice@example.com",
+                "answers": [{"question": self.questions[1].id, "option_values": ["Maybe"]}],
+            }
+        )
+        res = self.client.post(self.url, payload, content_type="application/json")
+        self.assertEqual(res.status_code, 400)
+        self.assertFalse(InterviewResponse.objects.exists())
+
+
+class SubmitFormTests(TestCase):
+    """
+    The HTML form path in interview_take shares the bulk write pipeline.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create_user(username="owner", password="pw")
+        self.interview = Interview.objects.create(title="Backend", created_by=self.owner)
+        self.section = Section.objects.create(interview=self.interview, title="Section 1")
+        self.url = reverse("interviews:take", args=[self.interview.pk])
+
+    def _add_questions(self, count):
+        for i in range(count):
+            Question.objects.create(
+                section=self.section,
+                question_text=f"Question {i}",
+                question_type="multiple_choice" if i % 2 else "text",
+                options=["Yes", "No"] if i % 2 else [],
+                order=i,
+            )
+
+    def _post(self, email):
+        data = {"candidate_name": "Bob", "candidate_email": email}
+        for q in self.interview.questions.all():
+            data[f"question_{q.id}"] = "Yes" if q.question_type == "multiple_choice" else "hi"
+        with CaptureQueriesContext(connection) as ctx:
+            res = self.client.post(self.url, data)
+        self.assertEqual(res.status_code, 302)
+        return len(ctx.captured_queries)
+
+    def test_query_count_is_independent_of_question_count(self):
+        self._add_questions(2)
+        few = self._post("few@example.com")
+        with self.captureOnCommitCallbacks(execute=True):
+            self._add_questions(40)
+        many = self._post("many@example.com")
+        self.assertEqual(few, many)
+
+    def test_snapshot_and_answers_written_together(self):
+        self._add_questions(3)
+        self._post("bob@example.com")
+        response = InterviewResponse.objects.get()
+        self.assertEqual(response.answers_transcript["source"], "form")
+        self.assertEqual(
+            [a["option_ids"] for a in response.answers_transcript["answers"]],
+            [[], [0], []],
+        )
+        self.assertEqual(response.answers.count(), 3)
+
+    def test_answers_stored_in_display_order_across_sections(self):
+        self.section.order = 0
+        self.section.save()
+        second = Section.objects.create(interview=self.interview, title="Section 2", order=1)
+        # Order keys restart in each section, so a global (order, id) sort interleaves them
+        expected = []
+        for order in range(2):
+            for section in (self.section, second):
+                expected.append(
+                    Question.objects.create(
+                        section=section, question_text=f"{section.title} #{order}", order=order
+                    )
+                )
+        expected.sort(key=lambda q: (q.section_id != self.section.pk, q.order))
+        ids = [q.pk for q in expected]
+
+        self._post("bob@example.com")
+        response = InterviewResponse.objects.get()
+        self.assertEqual([a["question"] for a in response.answers_transcript["answers"]], ids)
+        self.assertEqual(
+            list(response.answers.order_by("pk").values_list("question", flat=True)), ids
+        )
+        self.assertEqual(list(get_interview_snapshot(self.interview.pk).questions_by_id), ids)
+
+
+class SubmitJsonAsyncTests(TestCase):
+    """
+    The async submit endpoint accepts the same payload as interview_submit_json.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create_user(username="owner", password="pw")
+        self.interview = Interview.objects.create(title="Backend", created_by=self.owner)
+        section = Section.objects.create(interview=self.interview, title="Section 1")
+        self.question = Question.objects.create(
+            section=section,
+            question_text="Pick one",
+            question_type="multiple_choice",
+            options=["Yes", "No"],
+        )
+        self.url = reverse("interviews:submit_json_async", args=[self.interview.pk])
+
+    async def test_submit(self):
+        payload = {
+            "candidate_name": "Carol",
+            "candidate_email": "Carol@Example.com",
+            "answers": [{"question": self.question.id, "option_values": ["No"]}],
+            "source": "realtime",
+        }
+        res = await self.async_client.post(
+            self.url, json.dumps(payload), content_type="application/json"
+        )
+        self.assertEqual(res.status_code, 200, res.content)
+        response = await InterviewResponse.objects.select_related("candidate").aget(
+            pk=res.json()["response_id"]
+        )
+        self.assertEqual(response.candidate.email, "carol@example.com")
+        answer = await Answer.objects.aget(response=response)
+        self.assertEqual(answer.selected_option_ids, [1])
+
+    async def test_rejects_unknown_question(self):
+        payload = {
+            "candidate_name": "Carol",
+            "candidate_email": "carol@example.com",
+            "answers": [{"question": 0, "text": "?"}],
+        }
+        res = await self.async_client.post(
+            self.url, json.dumps(payload), content_type="application/json"
+        )
+        self.assertEqual(res.status_code, 400)
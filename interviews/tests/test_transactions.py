@@ -0,0 +1,56 @@
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection, connections
+from django.test import TransactionTestCase, override_settings
+from django.urls import reverse
+
+from interviews.models import Interview, Question, Section
+from interviews.upstream_stub import StubUpstream
+
+
+class TransactionScopeTests(TransactionTestCase):
+    """
+    Read-only views and views waiting on external calls do not hold a transaction open.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create_user(username="owner", password="pw")
+        self.interview = Interview.objects.create(title="Backend", created_by=self.owner)
+        section = Section.objects.create(interview=self.interview, title="Section 1")
+        Question.objects.create(section=section, question_text="Why?", order=1)
+
+    def _backend_state(self, pid):
+        # Runs on the stub's thread, i.e. on a separate database connection
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT state FROM pg_stat_activity WHERE pid = %s", [pid])
+                row = cursor.fetchone()
+            return row[0] if row else None
+        finally:
+            connections.close_all()
+
+    def test_realtime_session_is_not_idle_in_transaction_during_mint(self):
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_backend_pid()")
+            pid = cursor.fetchone()[0]
+        request_connection = connections["default"]
+        seen = {}
+
+        def on_request(payload):
+            seen["in_atomic_block"] = request_connection.in_atomic_block
+            seen["state"] = self._backend_state(pid)
+
+        # Cold snapshot cache: the view reads the interview before calling upstream
+        with (
+            StubUpstream(on_request=on_request) as stub,
+            override_settings(OPENAI_API_KEY="k", OPENAI_API_BASE=stub.base_url),
+        ):
+            res = self.client.post(
+                reverse("interviews:ai_interview_realtime_session"),
+                {"interview_id": self.interview.pk},
+                content_type="application/json",
+            )
+        self.assertEqual(res.status_code, 200, res.content)
+        self.assertFalse(seen["in_atomic_block"])
+        self.assertNotEqual(seen["state"], "idle in transaction")
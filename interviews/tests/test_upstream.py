@@ -0,0 +1,93 @@
+import asyncio
+
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from interviews.upstream import AsyncRealtimeClient, RealtimeClient, UpstreamError
+from interviews.upstream_stub import StubUpstream
+
+
+class RealtimeClientTests(SimpleTestCase):
+    """
+    The pooled client reuses connections, retries rate limits and connection failures, and
+    honors the base URL.
+    """
+
+    def test_connections_are_reused(self):
+        with StubUpstream() as stub:
+            client = RealtimeClient(stub.base_url)
+            for _ in range(5):
+                data = client.create_session({"model": "m"}, api_key="k")
+                self.assertEqual(data["model"], "m")
+            client.close()
+        self.assertEqual(stub.requests, 5)
+        self.assertEqual(stub.connections, 1)
+
+    def test_retries_rate_limits(self):
+        with StubUpstream() as stub:
+            stub.fail_with = [429, 429]
+            client = RealtimeClient(stub.base_url, max_retries=2)
+            data = client.create_session({"model": "m"}, api_key="k")
+            client.close()
+        self.assertEqual(data["id"], "sess_3")
+
+    def test_gives_up_after_max_retries(self):
+        with StubUpstream() as stub:
+            stub.fail_with = [429, 429]
+            client = RealtimeClient(stub.base_url, max_retries=1)
+            with self.assertRaises(UpstreamError) as ctx:
+                client.create_session({"model": "m"}, api_key="k")
+            client.close()
+        self.assertEqual(ctx.exception.status, 429)
+
+    def test_client_and_server_errors_are_not_retried(self):
+        # A 5xx may come after the session was minted; retrying could mint a second one
+        for status in (401, 500, 503):
+            with self.subTest(status=status), StubUpstream() as stub:
+                stub.fail_with = [status]
+                client = RealtimeClient(stub.base_url, max_retries=2)
+                with self.assertRaises(UpstreamError) as ctx:
+                    client.create_session({"model": "m"}, api_key="k")
+                client.close()
+                self.assertEqual(ctx.exception.status, status)
+                self.assertEqual(stub.requests, 1)
+
+    async def test_async_pool_allows_hundreds_of_mints_in_flight(self):
+        with (
+            StubUpstream(latency=0.2) as stub,
+            override_settings(OPENAI_POOL_SIZE=2, OPENAI_ASYNC_POOL_SIZE=200),
+        ):
+            client = AsyncRealtimeClient(stub.base_url)
+            await asyncio.gather(
+                *(client.create_session({"model": "m"}, api_key="k") for _ in range(100))
+            )
+            await client.aclose()
+        self.assertEqual(stub.connections, 100)
+
+
+class RealtimeSessionViewTests(TestCase):
+    def test_mints_against_configured_base(self):
+        with (
+            StubUpstream() as stub,
+            override_settings(OPENAI_API_KEY="k", OPENAI_API_BASE=stub.base_url),
+        ):
+            res = self.client.post(
+                reverse("interviews:ai_interview_realtime_session"),
+                "{}",
+                content_type="application/json",
+            )
+        self.assertEqual(res.status_code, 200, res.content)
+        self.assertEqual(res.json()["client_secret"]["value"], "ek_1")
+
+    async def test_async_view_mints_against_configured_base(self):
+        with (
+            StubUpstream() as stub,
+            override_settings(OPENAI_API_KEY="k", OPENAI_API_BASE=stub.base_url),
+        ):
+            res = await self.async_client.post(
+                reverse("interviews:ai_interview_realtime_session_async"),
+                "{}",
+                content_type="application/json",
+            )
+        self.assertEqual(res.status_code, 200, res.content)
+        self.assertEqual(res.json()["id"], "sess_1")
@@ -0,0 +1,90 @@
+import json
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+
+from interviews.models import Interview, InterviewResponse, InterviewVersion, Question, Section
+from interviews.snapshots import get_interview_snapshot
+from interviews.versions import get_published_version, publish_interview
+
+
+class PublishedVersionTests(TestCase):
+    """
+    Submissions reference an immutable, content-hashed version of the structure and store
+    answers by question id only.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create_user(username="owner", password="pw")
+        self.interview = Interview.objects.create(title="Backend", created_by=self.owner)
+        section = Section.objects.create(interview=self.interview, title="Intro")
+        self.question = Question.objects.create(section=section, question_text="Why us?")
+
+    def _submit(self, email):
+        res = self.client.post(
+            reverse("interviews:submit_json", args=[self.interview.pk]),
+            json.dumps(
+                {
+                    "candidate_name": "Alice",
+                    "candidate_email": email,
+                    "answers": [{"question": self.question.id, "text": "Because"}],
+                }
+            ),
+            content_type="application/json",
+        )
+        self.assertEqual(res.status_code, 200, res.content)
+        return InterviewResponse.objects.get(pk=res.json()["response_id"])
+
+    def test_responses_reference_version_and_keep_their_question_text(self):
+        first = self._submit("a@example.com")
+        self.assertIsNotNone(first.version_id)
+        self.assertEqual(
+            first.answers_transcript["answers"][0],
+            {"question": self.question.id, "text": "Because", "option_ids": []},
+        )
+        self.assertEqual(self._submit("b@example.com").version_id, first.version_id)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.question.question_text = "Why this team?"
+            self.question.save()
+        second = self._submit("c@example.com")
+        self.assertNotEqual(second.version_id, first.version_id)
+
+        # Dual storage keeps the Answer rows; the receipt still shows the published wording
+        self.assertEqual(first.answers.count(), 1)
+        page = self.client.get(reverse("interviews:response_detail", args=[first.pk]))
+        self.assertContains(page, "Why us?")
+        self.assertNotContains(page, "Why this team?")
+
+        # So does rendering from the snapshot alone
+        first.answers.all().delete()
+        page = self.client.get(reverse("interviews:response_detail", args=[first.pk]))
+        self.assertContains(page, "Why us?")
+        self.assertNotContains(page, "Why this team?")
+
+    def test_same_structure_publishes_once_and_is_cached_forever(self):
+        snapshot = get_interview_snapshot(self.interview.pk)
+        version_id = publish_interview(snapshot)
+        with self.assertNumQueries(0):
+            self.assertEqual(publish_interview(snapshot), version_id)
+        get_published_version(version_id)
+        with self.assertNumQueries(0):
+            version = get_published_version(version_id)
+        self.assertEqual(version.question_text(self.question.id), "Why us?")
+        self.assertEqual(len(version.content_hash), 64)
+
+        row = InterviewVersion.objects.get(pk=version_id)
+        with self.assertRaises(ValueError):
+            row.save()
+
+    def test_publish_endpoint_is_owner_only_and_idempotent(self):
+        url = reverse("interviews:publish", args=[self.interview.pk])
+        self.client.force_login(self.owner)
+        first = self.client.post(url).json()
+        self.assertEqual(self.client.post(url).json()["version_id"], first["version_id"])
+        User.objects.create_user(username="other", password="pw")
+        self.client.login(username="other", password="pw")
+        self.assertEqual(self.client.post(url).status_code, 404)
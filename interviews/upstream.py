@@ -0,0 +1,191 @@
+"""
+Pooled upstream client for OpenAI Realtime session minting.
+
+A process-wide httpx client (plus one AsyncClient per event loop for the async views)
+keeps TLS connections alive between mints, with separate connect/read timeouts and a
+small number of jittered retries for failures that are safe to retry (connect errors,
+stale keep-alive connections, 429 rate limits). Minting is not idempotent, so 5xx
+responses are returned as-is: the upstream may have created the session before failing.
+The base URL comes from settings.OPENAI_API_BASE so load tests can target a local stub.
+"""
+
+import asyncio
+import random
+import threading
+import time
+import weakref
+from typing import Any, Dict, Optional
+
+import httpx
+from django.conf import settings
+
+DEFAULT_API_BASE = "https://api.openai.com/v1"
+SESSIONS_PATH = "/realtime/sessions"
+
+# Upstream statuses worth another attempt (rejected before any session was created);
+# anything else is returned to the caller as-is
+RETRY_STATUSES = frozenset({429})
+# Transport failures that happen before the request could have been processed upstream
+RETRY_EXCEPTIONS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.RemoteProtocolError)
+
+
+class UpstreamError(Exception):
+    """Minting failed; carries the HTTP status to return and the upstream error body."""
+
+    def __init__(self, status: int, details: str = ""):
+        super().__init__(f"Upstream error {status}: {details[:200]}")
+        self.status = status
+        self.details = details
+
+
+def api_base() -> str:
+    return (getattr(settings, "OPENAI_API_BASE", "") or DEFAULT_API_BASE).rstrip("/")
+
+
+def _timeout() -> httpx.Timeout:
+    return httpx.Timeout(
+        getattr(settings, "OPENAI_READ_TIMEOUT", 15.0),
+        connect=getattr(settings, "OPENAI_CONNECT_TIMEOUT", 3.05),
+    )
+
+
+def _limits(size: int) -> httpx.Limits:
+    return httpx.Limits(max_connections=size, max_keepalive_connections=size, keepalive_expiry=60)
+
+
+def backoff_delay(attempt: int, base: float = 0.1, cap: float = 2.0) -> float:
+    """Full-jitter exponential backoff for the given (0-based) retry attempt."""
+    return random.uniform(0, min(cap, base * (2**attempt)))
+
+
+def _headers(api_key: str) -> Dict[str, str]:
+    return {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
+
+
+def _parse(resp: httpx.Response) -> Dict[str, Any]:
+    if resp.status_code >= 400:
+        raise UpstreamError(resp.status_code, resp.text)
+    try:
+        return resp.json()
+    except ValueError:
+        raise UpstreamError(502, "Upstream returned a non-JSON body")
+
+
+class RealtimeClient:
+    """Thread-safe, keep-alive client for POST {base}/realtime/sessions."""
+
+    def __init__(self, base_url: Optional[str] = None, max_retries: Optional[int] = None):
+        self.base_url = (base_url or api_base()).rstrip("/")
+        self.max_retries = (
+            getattr(settings, "OPENAI_MAX_RETRIES", 2) if max_retries is None else max_retries
+        )
+        size = getattr(settings, "OPENAI_POOL_SIZE", 20)
+        self._client = httpx.Client(
+            base_url=self.base_url, timeout=_timeout(), limits=_limits(size)
+        )
+
+    def create_session(self, payload: Dict[str, Any], api_key: str) -> Dict[str, Any]:
+        attempt = 0
+        while True:
+            try:
+                resp = self._client.post(SESSIONS_PATH, json=payload, headers=_headers(api_key))
+            except RETRY_EXCEPTIONS as e:
+                if attempt >= self.max_retries:
+                    raise UpstreamError(502, str(e))
+            except httpx.HTTPError as e:
+                raise UpstreamError(504 if isinstance(e, httpx.TimeoutException) else 502, str(e))
+            else:
+                if resp.status_code not in RETRY_STATUSES or attempt >= self.max_retries:
+                    return _parse(resp)
+            time.sleep(backoff_delay(attempt))
+            attempt += 1
+
+    def close(self) -> None:
+        self._client.close()
+
+
+class AsyncRealtimeClient:
+    """Non-blocking counterpart of RealtimeClient; bound to the event loop that created it."""
+
+    def __init__(self, base_url: Optional[str] = None, max_retries: Optional[int] = None):
+        self.base_url = (base_url or api_base()).rstrip("/")
+        self.max_retries = (
+            getattr(settings, "OPENAI_MAX_RETRIES", 2) if max_retries is None else max_retries
+        )
+        # One loop serves every in-flight mint, so the pool caps concurrency per worker
+        size = getattr(settings, "OPENAI_ASYNC_POOL_SIZE", 500)
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url, timeout=_timeout(), limits=_limits(size)
+        )
+
+    async def create_session(self, payload: Dict[str, Any], api_key: str) -> Dict[str, Any]:
+        attempt = 0
+        while True:
+            try:
+                resp = await self._client.post(
+                    SESSIONS_PATH, json=payload, headers=_headers(api_key)
+                )
+            except RETRY_EXCEPTIONS as e:
+                if attempt >= self.max_retries:
+                    raise UpstreamError(502, str(e))
+            except httpx.HTTPError as e:
+                raise UpstreamError(504 if isinstance(e, httpx.TimeoutException) else 502, str(e))
+            else:
+                if resp.status_code not in RETRY_STATUSES or attempt >= self.max_retries:
+                    return _parse(resp)
+            await asyncio.sleep(backoff_delay(attempt))
+            attempt += 1
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+
+_client: Optional[RealtimeClient] = None
+_client_lock = threading.Lock()
+
+
+def get_realtime_client() -> RealtimeClient:
+    """
+    Return the process-wide client, recreating it if OPENAI_API_BASE changed.
+    """
+    global _client
+    base = api_base()
+    client = _client
+    if client is not None and client.base_url == base:
+        return client
+    with _client_lock:
+        if _client is None or _client.base_url != base:
+            if _client is not None:
+                _client.close()
+            _client = RealtimeClient(base)
+        return _client
+
+
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncRealtimeClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_async_realtime_client() -> AsyncRealtimeClient:
+    """
+    Return the async client for the running event loop (httpx async connections cannot
+    be shared across loops), recreating it if OPENAI_API_BASE changed.
+    """
+    loop = asyncio.get_running_loop()
+    base = api_base()
+    client = _async_clients.get(loop)
+    if client is None or client.base_url != base:
+        client = AsyncRealtimeClient(base)
+        _async_clients[loop] = client
+    return client
+
+
+__all__ = [
+    "AsyncRealtimeClient",
+    "RealtimeClient",
+    "UpstreamError",
+    "api_base",
+    "backoff_delay",
+    "get_async_realtime_client",
+    "get_realtime_client",
+]
@@ -0,0 +1,98 @@
+"""
+Local stand-in for the OpenAI Realtime sessions endpoint.
+
+Usable from tests (`with StubUpstream() as stub: ...`) and for load tests by pointing
+OPENAI_API_BASE at `stub.base_url`.
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class _Server(ThreadingHTTPServer):
+    # Large accept backlog so bursts of concurrent connects are not refused
+    request_queue_size = 1024
+    daemon_threads = True
+
+
+class StubUpstream:
+    """Keep-alive HTTP/1.1 server answering POST /v1/realtime/sessions with fake sessions."""
+
+    def __init__(self, latency: float = 0.0, ttl: int = 60, on_request=None):
+        self.latency = latency
+        self.ttl = ttl
+        # Optional callable(payload) run while the caller is blocked waiting on the response
+        self.on_request = on_request
+        # Statuses to answer with before succeeding (consumed in order)
+        self.fail_with = []
+        self.connections = 0
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._server = _Server(("127.0.0.1", 0), self._handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                super().setup()
+                with stub._lock:
+                    stub.connections += 1
+
+            def log_message(self, *args):
+                pass
+
+            def _send(self, status, body):
+                raw = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(raw)))
+                self.end_headers()
+                self.wfile.write(raw)
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                payload = json.loads(self.rfile.read(length) or b"{}")
+                with stub._lock:
+                    stub.requests += 1
+                    n = stub.requests
+                    status = stub.fail_with.pop(0) if stub.fail_with else 200
+                if stub.on_request is not None:
+                    stub.on_request(payload)
+                if stub.latency:
+                    time.sleep(stub.latency)
+                if self.path != "/v1/realtime/sessions":
+                    return self._send(404, {"error": "not found"})
+                if status != 200:
+                    return self._send(status, {"error": {"message": "stub failure"}})
+                self._send(
+                    200,
+                    {
+                        "id": f"sess_{n}",
+                        "model": payload.get("model"),
+                        "client_secret": {
+                            "value": f"ek_{n}",
+                            "expires_at": int(time.time()) + stub.ttl,
+                        },
+                    },
+                )
+
+        return Handler
@@ -9,11 +9,20 @@ urlpatterns = [
     path('create/', views.interview_create, name='create'),
     path('<int:pk>/', views.interview_detail, name='detail'),
     path('<int:pk>/edit/', views.interview_edit, name='edit'),
+    # Builder: ordered batch of edit operations applied in one transaction
+    path('<int:pk>/edit/batch/', views.interview_edit_batch, name='edit_batch'),
+    # Freeze the current structure into an immutable published version
+    path('<int:pk>/publish/', views.interview_publish, name='publish'),
     path('<int:pk>/preview/', views.interview_preview, name='preview'),
     path('<int:pk>/delete/', views.interview_delete, name='delete'),
     path('<int:pk>/take/', views.interview_take, name='take'),
     path('<int:pk>/submit/', views.interview_submit_json, name='submit_json'),
+    # Async (ASGI-native) submit; same payload/response as submit_json
+    path('<int:pk>/submit/async/', views.interview_submit_json_async, name='submit_json_async'),
     path('<int:pk>/responses/', views.interview_responses, name='responses'),
+    path('<int:pk>/responses/export/', views.interview_export, name='export'),
+    path('<int:pk>/responses/stats/', views.interview_stats, name='stats'),
+    path('<int:pk>/responses/search/', views.interview_search, name='search'),
     # AI Conversational Interview (info + live) consolidated into views.py
     path('<int:pk>/ai-interview/', views.ai_interview_info, name='ai_interview'),
     path('<int:pk>/ai-interview/live/', views.ai_interview_start, name='ai_interview_live'),
@@ -23,6 +32,19 @@ urlpatterns = [
         views.realtime_session,
         name='ai_interview_realtime_session',
     ),
+    path(
+        'ai-interview/realtime/session/async/',
+        views.realtime_session_async,
+        name='ai_interview_realtime_session_async',
+    ),
+    # Pre-minted session pool metrics (staff only)
+    path(
+        'ai-interview/realtime/pool/metrics/',
+        views.realtime_pool_metrics,
+        name='ai_interview_realtime_pool_metrics',
+    ),
+    # Recruiter candidate lookup (fuzzy or prefix autocomplete)
+    path('candidates/search/', views.candidate_search, name='candidate_search'),
     # Public receipt page for a single response
     path('responses/<int:rid>/', views.interview_response_view, name='response_detail'),
 ]
@@ -0,0 +1,154 @@
+"""
+Immutable published versions of an interview's structure.
+
+Publishing freezes the structure candidates see (title, sections, questions and options)
+into an InterviewVersion identified by the sha256 of its canonical JSON, so publishing the
+same structure twice returns the same row and reverting an edit reuses the old version.
+Submissions reference the version they were made against and store answers by question id
+only; question texts are read back from the version. A version never changes, so it is
+cached under its id with no expiry and nothing ever invalidates it.
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .cache import LRUCache, two_tier_get
+from .models import InterviewVersion
+from .snapshots import InterviewSnapshot
+
+_local = LRUCache(getattr(settings, "INTERVIEW_SNAPSHOT_LRU_SIZE", 256))
+
+
+@dataclass(frozen=True)
+class PublishedVersion:
+    id: int
+    interview_id: int
+    content_hash: str
+    structure: Dict[str, Any]
+    # Question id -> frozen question entry of `structure`
+    questions_by_id: Dict[int, Dict[str, Any]]
+
+    def question_text(self, question_id: int) -> str:
+        question = self.questions_by_id.get(question_id)
+        return question["text"] if question else ""
+
+    def option_labels(self, question_id: int) -> Dict[int, str]:
+        """Option id -> label as published (empty for versions frozen before option ids)."""
+        question = self.questions_by_id.get(question_id) or {}
+        return dict(zip(question.get("option_ids") or [], question.get("options") or []))
+
+
+def version_structure(snapshot: InterviewSnapshot) -> Dict[str, Any]:
+    """The candidate-visible structure of a snapshot, as plain JSON data."""
+    return {
+        "title": snapshot.title,
+        "description": snapshot.description,
+        "sections": [
+            {
+                "id": s.id,
+                "title": s.title,
+                "description": s.description,
+                "questions": [
+                    {
+                        "id": q.id,
+                        "text": q.question_text,
+                        "type": q.question_type,
+                        "required": q.is_required,
+                        "options": list(q.options),
+                        "option_ids": list(q.option_ids),
+                    }
+                    for q in s.questions
+                ],
+            }
+            for s in snapshot.sections
+        ],
+    }
+
+
+def content_hash(structure: Dict[str, Any]) -> str:
+    canonical = json.dumps(structure, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def publish_interview(snapshot: InterviewSnapshot) -> int:
+    """
+    Return the id of the InterviewVersion matching the snapshot's structure, creating it on
+    first publication. Memoized per interview version token, so repeat calls cost a cache
+    read.
+    """
+    key = f"interviews:published_id:{snapshot.id}:{snapshot.version}"
+    version_id = cache.get(key) if snapshot.version else None
+    if version_id is None:
+        structure = version_structure(snapshot)
+        version, _ = InterviewVersion.objects.get_or_create(
+            interview_id=snapshot.id,
+            content_hash=content_hash(structure),
+            defaults={"structure": structure},
+        )
+        version_id = version.pk
+        if snapshot.version:
+            cache.set(
+                key, version_id, timeout=getattr(settings, "INTERVIEW_SNAPSHOT_TIMEOUT", 86400)
+            )
+    return version_id
+
+
+def _build(version_id: int) -> Optional[PublishedVersion]:
+    row = (
+        InterviewVersion.objects.filter(pk=version_id)
+        .values("id", "interview_id", "content_hash", "structure")
+        .first()
+    )
+    if row is None:
+        return None
+    return PublishedVersion(
+        questions_by_id={
+            q["id"]: q for s in row["structure"].get("sections", []) for q in s["questions"]
+        },
+        **row,
+    )
+
+
+def get_published_version(version_id: Optional[int]) -> Optional[PublishedVersion]:
+    """The published version with this id (cached forever), or None."""
+    if version_id is None:
+        return None
+    return two_tier_get(
+        _local, f"interviews:published:{version_id}", lambda: _build(version_id), timeout=None
+    )
+
+
+def answer_items(
+    items: Iterable[Dict[str, Any]], version: Optional[PublishedVersion]
+) -> List[Dict[str, Any]]:
+    """
+    Snapshot answer items with `question_text` filled in from the published version
+    (older snapshots carry their own copy).
+    """
+    resolved = []
+    for item in items or []:
+        if not isinstance(item, dict):
+            continue
+        if "question_text" not in item and version is not None:
+            try:
+                qid = int(item.get("question"))
+            except (TypeError, ValueError):
+                qid = None
+            item = {**item, "question_text": version.question_text(qid)}
+        resolved.append(item)
+    return resolved
+
+
+__all__ = [
+    "PublishedVersion",
+    "answer_items",
+    "content_hash",
+    "get_published_version",
+    "publish_interview",
+    "version_structure",
+]
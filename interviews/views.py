@@ -1,12 +1,14 @@
 import json
 import os
-import urllib.error
-import urllib.request
 
+from asgiref.sync import sync_to_async
 from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
-from django.http import JsonResponse
+from django.core.paginator import Paginator
+from django.db import transaction
+from django.db.models import Count
+from django.http import Http404, JsonResponse, StreamingHttpResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import reverse
 
@@ -17,23 +19,86 @@ from rest_framework.decorators import api_view, authentication_classes, permissi
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 
-from .models import Answer, Candidate, Interview, InterviewResponse, Question, Section
-from .prompts import (
-    build_realtime_instructions,
-    first_utterance_template,
-    verbatim_question_template,
+from .answers import load_answers
+from .builder import OPERATIONS as BUILDER_OPERATIONS, BuilderError, apply_operations, builder_tree
+from .cache import get_interview_versions, get_response_count, get_response_counts
+from .candidate_search import SEARCH_MODES, search_candidates
+from .candidates import resolve_candidate
+from .conditional import (
+    conditional_active_interview_page,
+    conditional_interview_page,
+    conditional_receipt,
+    conditional_take_page,
+    immutable_receipt,
+    revalidate,
 )
+from .exports import CONTENT_TYPES, EXPORT_FORMATS, export_stream
+from .models import Interview, InterviewResponse, Section
+from .ordering import ORDER_GAP
+from .pagination import keyset_page
+from .prompts import first_utterance_template, get_realtime_instructions, verbatim_question_template
+from .rollups import get_interview_rollup
+from .search import search_responses
 from .serializers import SubmitResponseSerializer
+from .session_pool import get_session_pool
+from .snapshots import get_active_snapshot_or_404, get_interview_snapshot
+from .submissions import create_response, enrich_answers, form_answers
+from .upstream import UpstreamError, get_async_realtime_client, get_realtime_client
+from .versions import get_published_version, publish_interview
+
+
+def _interview_cards(queryset, request, param):
+    """
+    One page of interview cards (?<param>=N) with question counts annotated in the page
+    query, response counts read from the cached counters the responses page uses, and
+    each interview's version token attached for fragment caching.
+    """
+    queryset = queryset.select_related('created_by').annotate(
+        question_count=Count('sections__questions')
+    )
+    page = Paginator(queryset, getattr(settings, 'INTERVIEW_LIST_PAGE_SIZE', 24)).get_page(
+        request.GET.get(param)
+    )
+    ids = [i.pk for i in page.object_list]
+    versions = get_interview_versions(ids)
+    counts = get_response_counts(ids, _count_responses)
+    for interview in page.object_list:
+        interview.version = versions[interview.pk]
+        interview.response_count = counts[interview.pk]
+    return page
+
+
+def _count_responses(interview_ids):
+    """Exact response counts for several interviews in one grouped query."""
+    return dict(
+        InterviewResponse.objects.filter(interview_id__in=interview_ids)
+        .order_by()
+        .values('interview_id')
+        .annotate(count=Count('pk'))
+        .values_list('interview_id', 'count')
+    )
 
 
 @require_http_methods(["GET"])
 def interview_list(request):
-    """List all interviews"""
-    interviews = Interview.objects.filter(is_active=True)
+    """List all interviews (paginated; a constant number of queries per page)"""
+    interviews = _interview_cards(
+        Interview.objects.filter(is_active=True).order_by('-created_at', '-id'), request, 'page'
+    )
     user_interviews = (
-        Interview.objects.filter(created_by=request.user) if request.user.is_authenticated else None
+        _interview_cards(
+            Interview.objects.filter(created_by=request.user).order_by('-created_at', '-id'),
+            request,
+            'mine',
+        )
+        if request.user.is_authenticated
+        else None
     )
-    context = {'interviews': interviews, 'user_interviews': user_interviews}
+    context = {
+        'interviews': interviews,
+        'user_interviews': user_interviews,
+        'card_cache_timeout': getattr(settings, 'INTERVIEW_CARD_CACHE_TIMEOUT', 3600),
+    }
     return render(request, 'interviews/list.html', context)
 
 
@@ -57,194 +122,106 @@ def interview_create(request):
     return render(request, 'interviews/create.html')
 
 
+@transaction.atomic
+def _interview_edit_post(request, interview, pk):
+    """
+    Apply an interview_edit POST (details form or AJAX builder action) in one transaction.
+    """
+    # Handle a single builder action via AJAX JSON (the batch endpoint takes lists of them)
+    if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+        try:
+            data = json.loads(request.body or '{}')
+        except Exception:
+            return JsonResponse({'success': False, 'error': 'Invalid JSON payload'}, status=400)
+
+        if isinstance(data, dict) and data.get('action') in BUILDER_OPERATIONS:
+            try:
+                (result,) = apply_operations(interview, [data])
+            except BuilderError as exc:
+                return JsonResponse({'success': False, 'error': str(exc)}, status=exc.status)
+            return JsonResponse({'success': True, **result})
+
+    # Update interview details (standard form submit); only write when something changed
+    title = request.POST.get('title', interview.title).strip()
+    description = request.POST.get('description', interview.description).strip()
+    if (title, description) != (interview.title, interview.description):
+        interview.title = title
+        interview.description = description
+        interview.save(update_fields=['title', 'description', 'updated_at'])
+
+    messages.success(request, 'Interview updated successfully!')
+    return redirect('interviews:edit', pk=pk)
+
+
 @login_required
 @require_http_methods(["GET", "POST"])
 def interview_edit(request, pk):
-    """Edit interview form with Google Forms-like interface"""
+    """
+    Edit interview form with Google Forms-like interface. The page ships the whole
+    section -> questions tree as one JSON payload for the client to render
+    (?format=json returns just that payload).
+    """
     interview = get_object_or_404(Interview, pk=pk, created_by=request.user)
 
     if request.method == 'POST':
-        # Update interview details (standard form submit)
-        interview.title = request.POST.get('title', interview.title).strip()
-        interview.description = request.POST.get('description', interview.description).strip()
-        interview.save()
-
-        # Handle questions via AJAX JSON
-        if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
-            try:
-                data = json.loads(request.body or '{}')
-            except Exception:
-                return JsonResponse({'success': False, 'error': 'Invalid JSON payload'}, status=400)
-
-            action = data.get('action')
-
-            if action == 'add_question':
-                # Optional section assignment on create
-                sec = None
-                sid = data.get('section_id')
-                if sid not in (None, '', 'null'):
-                    try:
-                        sec = Section.objects.get(pk=sid, interview=interview)
-                    except Section.DoesNotExist:
-                        sec = None
-                # Always default to first section when none resolved (enforce all questions belong to a section)
-                if sec is None:
-                    try:
-                        sec = interview.sections.order_by("order", "id").first()
-                    except Exception:
-                        sec = None
-
-                question = Question.objects.create(
-                    section=sec,
-                    question_text=data.get('question_text', 'Untitled Question'),
-                    question_type=data.get('question_type', 'text'),
-                    is_required=bool(data.get('is_required', True)),
-                    order=interview.questions.count(),
-                )
-                return JsonResponse({'success': True, 'question_id': question.id})
-
-            elif action == 'update_question':
-                question = get_object_or_404(
-                    Question, pk=data.get('question_id'), section__interview=interview
-                )
-                question.question_text = data.get('question_text', question.question_text)
-                question.question_type = data.get('question_type', question.question_type)
-                question.is_required = bool(data.get('is_required', question.is_required))
-                question.save()
-                return JsonResponse({'success': True})
-
-            elif action == 'delete_question':
-                question = get_object_or_404(
-                    Question, pk=data.get('question_id'), section__interview=interview
-                )
-                question.delete()
-                return JsonResponse({'success': True})
-
-            elif action == 'add_option':
-                question = get_object_or_404(
-                    Question, pk=data.get('question_id'), section__interview=interview
-                )
-                opts = list(question.options or [])
-                text = data.get('option_text', 'Option')
-                opts.append(text)
-                question.options = opts
-                question.save(update_fields=['options'])
-                return JsonResponse({'success': True, 'option_index': len(opts) - 1})
-
-            elif action == 'update_option':
-                # Update option text by index on the Question.options list
-                question = get_object_or_404(
-                    Question, pk=data.get('question_id'), section__interview=interview
-                )
-                try:
-                    idx = int(data.get('option_index'))
-                except Exception:
-                    return JsonResponse(
-                        {'success': False, 'error': 'Invalid option index'}, status=400
-                    )
-                opts = list(question.options or [])
-                if 0 <= idx < len(opts):
-                    opts[idx] = data.get('option_text', opts[idx])
-                    question.options = opts
-                    question.save(update_fields=['options'])
-                    return JsonResponse({'success': True})
-                return JsonResponse({'success': False, 'error': 'Index out of range'}, status=400)
-
-            elif action == 'delete_option':
-                # Remove option by index from question.options list
-                question = get_object_or_404(
-                    Question, pk=data.get('question_id'), section__interview=interview
-                )
-                try:
-                    idx = int(data.get('option_index'))
-                except Exception:
-                    return JsonResponse(
-                        {'success': False, 'error': 'Invalid option index'}, status=400
-                    )
-                opts = list(question.options or [])
-                if 0 <= idx < len(opts):
-                    del opts[idx]
-                    question.options = opts
-                    question.save(update_fields=['options'])
-                    return JsonResponse({'success': True})
-                return JsonResponse({'success': False, 'error': 'Index out of range'}, status=400)
-
-            elif action == 'add_section':
-                title = (data.get('title') or 'Untitled Section').strip()
-                description = (data.get('description') or '').strip()
-                section = Section.objects.create(
-                    interview=interview,
-                    title=title or 'Untitled Section',
-                    description=description,
-                    order=interview.sections.count(),
-                )
-                return JsonResponse({'success': True, 'section_id': section.id})
-
-            elif action == 'update_section':
-                section = get_object_or_404(Section, pk=data.get('section_id'), interview=interview)
-                if 'title' in data:
-                    section.title = (data.get('title') or '').strip() or section.title
-                if 'description' in data:
-                    section.description = (data.get('description') or '').strip()
-                if 'order' in data and isinstance(data.get('order'), int):
-                    section.order = data.get('order')
-                section.save()
-                return JsonResponse({'success': True})
-
-            elif action == 'delete_section':
-                section = get_object_or_404(Section, pk=data.get('section_id'), interview=interview)
-                # Reassign questions from this section to a fallback section (no 'General' bucket)
-                others = interview.sections.exclude(pk=section.pk).order_by("order", "id")
-                if others.exists():
-                    fallback = others.first()
-                else:
-                    # Create a new section if none remain
-                    fallback = Section.objects.create(
-                        interview=interview, title="Section 1", order=0
-                    )
-                Question.objects.filter(section=section).update(section=fallback)
-                section.delete()
-                return JsonResponse({'success': True, 'fallback_section_id': fallback.id})
-
-            elif action == 'move_question':
-                question = get_object_or_404(
-                    Question, pk=data.get('question_id'), section__interview=interview
-                )
-                section_id = data.get('section_id')
-                if section_id in (None, '', 'null'):
-                    # Keep current section or fallback to the first available section (no unsectioned state)
-                    fallback = (
-                        question.section or interview.sections.order_by("order", "id").first()
-                    )
-                    if fallback is None:
-                        fallback = Section.objects.create(
-                            interview=interview, title="Section 1", order=0
-                        )
-                    question.section = fallback
-                else:
-                    section = get_object_or_404(Section, pk=section_id, interview=interview)
-                    question.section = section
-                if 'order' in data and isinstance(data.get('order'), int):
-                    question.order = data.get('order')
-                question.save()
-                return JsonResponse({'success': True})
-
-        messages.success(request, 'Interview updated successfully!')
-        return redirect('interviews:edit', pk=pk)
+        return _interview_edit_post(request, interview, pk)
 
+    tree = builder_tree(interview)
     # Ensure at least one section exists; if none, create a default
-    if interview.sections.count() == 0:
-        Section.objects.create(interview=interview, title="Section 1", order=0)
+    if not tree['sections']:
+        Section.objects.create(interview=interview, title="Section 1", order=ORDER_GAP)
+        tree = builder_tree(interview)
 
-    context = {
-        'interview': interview,
-        'sections': interview.sections.all(),
-        'questions': interview.questions.select_related('section').all(),
-    }
-    return render(request, 'interviews/edit.html', context)
+    if request.GET.get('format') == 'json':
+        return JsonResponse(tree)
+    return render(request, 'interviews/edit.html', {'interview': interview, 'builder_tree': tree})
+
+
+@login_required
+@require_http_methods(["POST"])
+def interview_edit_batch(request, pk):
+    """
+    Apply an ordered list of builder operations in one transaction:
+    {"operations": [{"action": "update_question", "question_id": 3, ...}, ...]}.
+    Operations may reference rows added earlier in the batch by their "ref".
+    """
+    interview = get_object_or_404(Interview, pk=pk, created_by=request.user)
+    try:
+        data = json.loads(request.body or '{}')
+    except ValueError:
+        return JsonResponse({'success': False, 'error': 'Invalid JSON payload'}, status=400)
+    operations = data.get('operations') if isinstance(data, dict) else None
+    if not isinstance(operations, list):
+        return JsonResponse({'success': False, 'error': 'operations must be a list'}, status=400)
+    try:
+        results = apply_operations(interview, operations)
+    except BuilderError as exc:
+        return JsonResponse(
+            {'success': False, 'error': str(exc), 'index': exc.index}, status=exc.status
+        )
+    return JsonResponse({'success': True, 'results': results})
+
+
+@login_required
+@require_http_methods(["POST"])
+def interview_publish(request, pk):
+    """
+    Freeze the interview's current structure into an immutable, content-hashed version.
+    Idempotent: an unchanged structure returns the version already published.
+    (Submissions publish automatically; this lets the owner do it up front.)
+    """
+    interview = get_interview_snapshot(pk)
+    if interview is None or interview.created_by_id != request.user.pk:
+        raise Http404("No Interview matches the given query.")
+    version = get_published_version(publish_interview(interview))
+    return JsonResponse(
+        {'success': True, 'version_id': version.id, 'content_hash': version.content_hash}
+    )
 
 
 @require_http_methods(["GET"])
+@revalidate
+@conditional_interview_page
 def interview_detail(request, pk):
     """View interview details"""
     interview = get_object_or_404(Interview, pk=pk)
@@ -276,9 +253,11 @@ def interview_delete(request, pk):
 
 
 @require_http_methods(["GET", "POST"])
+@revalidate
+@conditional_take_page
 def interview_take(request, pk):
     """Take the interview (for candidates)"""
-    interview = get_object_or_404(Interview, pk=pk, is_active=True)
+    interview = get_active_snapshot_or_404(pk)
 
     if request.method == 'POST':
         candidate_name = (request.POST.get('candidate_name') or '').strip()
@@ -289,63 +268,24 @@ def interview_take(request, pk):
             # Redirect back to take page instead of showing an error page
             return redirect('interviews:take', pk=pk)
 
-        # Normalize candidate entity
-        candidate, _ = Candidate.objects.get_or_create(
-            email=candidate_email, defaults={'full_name': candidate_name}
-        )
-        # If we discovered name now and profile lacks it, update
-        if not candidate.full_name and candidate_name:
-            candidate.full_name = candidate_name
-            candidate.save(update_fields=['full_name'])
-
-        # Create response (keep legacy fields for search/back-compat)
-        response = InterviewResponse.objects.create(
-            interview=interview,
-            candidate=candidate,
-        )
-
-        # Save answers (relational) and build compact JSON snapshot
-        answers_snapshot = []
-        for question in interview.questions.all():
-            answer = Answer.objects.create(response=response, question=question)
+        # Build answers + JSON snapshot in memory before opening the write transaction
+        questions = interview.questions_by_id
+        answers = form_answers(request.POST, interview.questions)
+        version_id = publish_interview(interview)
 
-            if question.question_type in ['text', 'textarea']:
-                text_val = request.POST.get(f'question_{question.id}', '') or ''
-                answer.answer_text = text_val
-                answer.save()
-                answers_snapshot.append(
-                    {
-                        'question': question.id,
-                        'question_text': question.question_text,
-                        'text': text_val,
-                        'option_values': [],
-                    }
-                )
-
-            elif question.question_type == 'multiple_choice':
-                option_value = request.POST.get(f'question_{question.id}')
-                opt_values = []
-                if option_value and option_value in (question.options or []):
-                    answer.selected_options = [option_value]
-                    answer.save(update_fields=['selected_options'])
-                    opt_values = [option_value]
-                answers_snapshot.append(
-                    {
-                        'question': question.id,
-                        'question_text': question.question_text,
-                        'text': '',
-                        'option_values': opt_values,
-                    }
-                )
+        with transaction.atomic():
+            # Create the candidate, or fill in a blank name, in one upsert
+            candidate = resolve_candidate(candidate_email, candidate_name)
 
-        # Attach JSON snapshot for easy export/reporting
-        response.answers_transcript = {'answers': answers_snapshot, 'source': 'form'}
-        response.save(update_fields=['answers_transcript'])
+            # Insert the response with its final snapshot and bulk-insert the relational answers
+            response = create_response(
+                interview.id, candidate, answers, questions, source='form', version_id=version_id
+            )
 
         messages.success(request, 'Interview submitted successfully!')
         # Redirect owner (and staff/admin) to responses; others to public receipt page
         if request.user.is_authenticated and (
-            request.user == interview.created_by
+            request.user.pk == interview.created_by_id
             or request.user.is_staff
             or request.user.is_superuser
         ):
@@ -356,64 +296,261 @@ def interview_take(request, pk):
     return render(request, 'interviews/take.html', {'interview': interview})
 
 
+def _can_view_responses(user, interview):
+    """Responses are visible to the interview owner and to staff/superusers."""
+    return user.is_authenticated and (
+        user.pk == interview.created_by_id or user.is_staff or user.is_superuser
+    )
+
+
 @login_required
 @require_http_methods(["GET"])
 def interview_responses(request, pk):
-    """View responses for an interview (owner-only; staff/admin allowed). Non-owners are redirected to detail."""
-    interview = get_object_or_404(Interview, pk=pk)
-    if not request.user.is_authenticated or (
-        request.user != interview.created_by
-        and not request.user.is_staff
-        and not request.user.is_superuser
-    ):
+    """
+    View responses for an interview (owner-only; staff/admin allowed). Non-owners are redirected to detail.
+    Keyset-paginated newest first (?after= / ?before= cursors) with a fixed number of queries
+    per page; the total comes from a cached counter.
+    """
+    interview = get_interview_snapshot(pk)
+    if interview is None:
+        raise Http404("No Interview matches the given query.")
+    if not _can_view_responses(request.user, interview):
         messages.error(request, "You do not have permission to view responses for this interview.")
         return redirect('interviews:detail', pk=pk)
-    responses = interview.responses.all()
+
+    # load_answers() fetches the JSON snapshot only where the page needs it
+    responses = (
+        InterviewResponse.objects.filter(interview_id=interview.id)
+        .select_related('candidate')
+        .defer('answers_transcript')
+    )
+    page = keyset_page(
+        responses,
+        'submitted_at',
+        size=getattr(settings, 'RESPONSES_PAGE_SIZE', 25),
+        after=request.GET.get('after'),
+        before=request.GET.get('before'),
+    )
+    load_answers(page.items)
+
+    total = get_response_count(
+        interview.id, lambda: InterviewResponse.objects.filter(interview_id=interview.id).count()
+    )
     return render(
-        request, 'interviews/responses.html', {'interview': interview, 'responses': responses}
+        request,
+        'interviews/responses.html',
+        {
+            'interview': interview,
+            'page': page,
+            'responses': page.items,
+            'total_responses': total,
+            'distributions': _option_distributions(interview),
+        },
+    )
+
+
+def _option_distributions(interview):
+    """Per multiple-choice question option counts and shares, read from the rollups."""
+    rollup = get_interview_rollup(interview.id)
+    distributions = []
+    for q in interview.questions:
+        if q.question_type != 'multiple_choice':
+            continue
+        counts = rollup['options'].get(q.id, {})
+        answered = sum(counts.values())
+        distributions.append(
+            {
+                'question': q,
+                'options': [
+                    {
+                        'value': label,
+                        'count': counts.get(option_id, 0),
+                        'percent': (
+                            round(100 * counts.get(option_id, 0) / answered) if answered else 0
+                        ),
+                    }
+                    for option_id, label in q.choices
+                ],
+            }
+        )
+    return distributions
+
+
+@login_required
+@require_http_methods(["GET"])
+def interview_stats(request, pk):
+    """
+    Rollup counters for an interview as JSON: total responses, per-day submissions and
+    option selection counts (owner/staff only).
+    """
+    interview = get_interview_snapshot(pk)
+    if interview is None:
+        raise Http404("No Interview matches the given query.")
+    if not _can_view_responses(request.user, interview):
+        return JsonResponse({'error': 'Forbidden'}, status=403)
+    rollup = get_interview_rollup(interview.id)
+    options = {}
+    for qid, counts in sorted(rollup['options'].items()):
+        q = interview.questions_by_id.get(qid)
+        labels = q.option_labels if q else {}
+        options[str(qid)] = {labels.get(oid, str(oid)): count for oid, count in counts.items()}
+    return JsonResponse(
+        {
+            'interview': interview.id,
+            'total_responses': rollup['total'],
+            'daily': [{'day': day.isoformat(), 'count': count} for day, count in rollup['daily']],
+            # Counted by option id, reported by label
+            'options': options,
+        }
+    )
+
+
+@login_required
+@require_http_methods(["GET"])
+def interview_search(request, pk):
+    """
+    Full-text search over an interview's answers and transcripts (owner/staff only).
+    ?q= accepts websearch syntax; results are ranked, highlighted and paged via ?after=.
+    """
+    interview = get_interview_snapshot(pk)
+    if interview is None:
+        raise Http404("No Interview matches the given query.")
+    if not _can_view_responses(request.user, interview):
+        return JsonResponse({'error': 'Forbidden'}, status=403)
+
+    query = request.GET.get('q', '')
+    page = search_responses(
+        interview.id,
+        query,
+        size=getattr(settings, 'SEARCH_PAGE_SIZE', 20),
+        after=request.GET.get('after'),
+    )
+    return JsonResponse(
+        {
+            'query': query,
+            'results': [
+                {
+                    'kind': hit.kind,
+                    'response_id': hit.response_id,
+                    'response_url': reverse('interviews:response_detail', args=[hit.response_id]),
+                    'question_id': hit.question_id,
+                    'question_text': hit.question_text,
+                    'candidate_name': hit.candidate_name,
+                    'candidate_email': hit.candidate_email,
+                    'submitted_at': hit.submitted_at.isoformat(),
+                    'rank': hit.rank,
+                    'headline': hit.headline,
+                }
+                for hit in page.hits
+            ],
+            'next_cursor': page.next_cursor,
+        }
+    )
+
+
+@login_required
+@require_http_methods(["GET"])
+def interview_export(request, pk):
+    """
+    Stream all responses of an interview as a wide CSV (?format=csv, default) or JSONL
+    (?format=jsonl); ?gzip=1 compresses the download on the fly.
+    """
+    interview = get_interview_snapshot(pk)
+    if interview is None:
+        raise Http404("No Interview matches the given query.")
+    if not _can_view_responses(request.user, interview):
+        messages.error(request, "You do not have permission to view responses for this interview.")
+        return redirect('interviews:detail', pk=pk)
+
+    fmt = request.GET.get('format', 'csv')
+    if fmt not in EXPORT_FORMATS:
+        return JsonResponse({'error': f"Unsupported format: {fmt}"}, status=400)
+    compress = request.GET.get('gzip') in ('1', 'true', 'yes')
+
+    filename = f"interview-{interview.id}-responses.{fmt}"
+    if compress:
+        filename += '.gz'
+    response = StreamingHttpResponse(
+        export_stream(interview, fmt, compress=compress),
+        content_type='application/gzip' if compress else CONTENT_TYPES[fmt],
+    )
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
+
+
+@login_required
+@require_http_methods(["GET"])
+def candidate_search(request):
+    """
+    Candidate lookup for recruiters (HR/Admin roles and staff).
+    ?q= term, ?mode=fuzzy (typo-tolerant, default) or prefix (autocomplete), ?limit= (max 50).
+    """
+    profile = getattr(request.user, 'profile', None)
+    if not (request.user.is_staff or (profile and profile.role in ('HR', 'ADMIN'))):
+        return JsonResponse({'error': 'Forbidden'}, status=403)
+
+    term = request.GET.get('q', '')
+    mode = request.GET.get('mode', 'fuzzy')
+    if mode not in SEARCH_MODES:
+        return JsonResponse({'error': f"Unsupported mode: {mode}"}, status=400)
+    try:
+        limit = int(request.GET.get('limit', 10))
+    except ValueError:
+        return JsonResponse({'error': 'limit must be an integer'}, status=400)
+
+    matches = search_candidates(term, mode=mode, limit=limit)
+    return JsonResponse(
+        {
+            'query': term,
+            'mode': mode,
+            'results': [
+                {
+                    'id': m.id,
+                    'full_name': m.full_name,
+                    'email': m.email,
+                    'similarity': round(m.similarity, 4) if m.similarity is not None else None,
+                }
+                for m in matches
+            ],
+        }
     )
 
 
 @require_http_methods(["GET"])
+@immutable_receipt
+@conditional_receipt
 def interview_response_view(request, rid):
     """
     Public receipt page showing a single candidate's submission.
     """
     resp = get_object_or_404(
-        InterviewResponse.objects.select_related("interview", "candidate").prefetch_related(
-            "answers__question"
-        ),
+        InterviewResponse.objects.select_related("interview", "candidate"),
         pk=rid,
     )
+    load_answers([resp])
     return render(request, 'interviews/response_detail.html', {'response': resp})
 
 
 # === Realtime AI Interview: Mint ephemeral OpenAI Realtime session token ===
-@csrf_exempt
-@require_http_methods(["POST"])
-def realtime_session(request):
+def _realtime_api_key():
+    return getattr(settings, "OPENAI_API_KEY", os.getenv("OPENAI_API_KEY"))
+
+
+def _realtime_session_payload(body):
     """
-    Returns an ephemeral OpenAI Realtime session token configured with server-side VAD.
-    If an interview_id is provided in the POST body, the session is constrained to ONLY ask
-    that interview's questions in order and never invent new questions.
+    Build the upstream session payload from the raw request body.
+    Returns (payload, None) or (None, error JsonResponse). Shared by the sync and async views.
     """
-    api_key = getattr(settings, "OPENAI_API_KEY", os.getenv("OPENAI_API_KEY"))
-    if not api_key:
-        return JsonResponse(
-            {"error": "OPENAI_API_KEY is not configured on the server."}, status=500
-        )
-
     # Try to read interview_id from request to build strict instructions
     interview = None
     try:
-        raw = request.body.decode("utf-8") if request.body else "{}"
+        raw = body.decode("utf-8") if body else "{}"
         body_json = json.loads(raw or "{}")
         interview_id = body_json.get("interview_id") or body_json.get("pk")
         if interview_id:
-            try:
-                interview = Interview.objects.get(pk=interview_id, is_active=True)
-            except Interview.DoesNotExist:
-                return JsonResponse({"error": "Interview not found or inactive."}, status=404)
+            interview = get_interview_snapshot(interview_id)
+            if interview is None or not interview.is_active:
+                return None, JsonResponse({"error": "Interview not found or inactive."}, status=404)
     except Exception:
         # If body can't be parsed, continue with generic behavior
         interview = None
@@ -424,7 +561,7 @@ def realtime_session(request):
         os.getenv("OPENAI_REALTIME_MODEL", "gpt-4o-realtime-preview-2024-12-17"),
     )
 
-    instructions = build_realtime_instructions(interview)
+    instructions = get_realtime_instructions(interview).text
 
     voice = getattr(
         settings,
@@ -452,59 +589,125 @@ def realtime_session(request):
         },
         "instructions": instructions,
     }
+    return payload, None
 
-    try:
-        req = urllib.request.Request(
-            "https://api.openai.com/v1/realtime/sessions",
-            data=json.dumps(payload).encode("utf-8"),
-            headers={
-                "Authorization": f"Bearer {api_key}",
-                "Content-Type": "application/json",
-            },
-            method="POST",
+
+def _realtime_session_response(data):
+    # Return only what's needed by the browser
+    return JsonResponse(
+        {
+            "client_secret": data.get("client_secret"),
+            "id": data.get("id"),
+            "model": data.get("model"),
+        }
+    )
+
+
+def _upstream_error_response(exc):
+    if isinstance(exc, UpstreamError):
+        return JsonResponse(
+            {"error": "Failed to create session", "details": exc.details}, status=exc.status
         )
-        with urllib.request.urlopen(req, timeout=15) as resp:
-            body = resp.read().decode("utf-8")
-            data = json.loads(body)
-            # Return only what's needed by the browser
-            return JsonResponse(
-                {
-                    "client_secret": data.get("client_secret"),
-                    "id": data.get("id"),
-                    "model": data.get("model"),
-                }
-            )
-    except urllib.error.HTTPError as e:
+    return JsonResponse({"error": "Internal server error", "details": str(exc)}, status=500)
+
+
+@csrf_exempt
+@require_http_methods(["POST"])
+def realtime_session(request):
+    """
+    Returns an ephemeral OpenAI Realtime session token configured with server-side VAD.
+    If an interview_id is provided in the POST body, the session is constrained to ONLY ask
+    that interview's questions in order and never invent new questions.
+    """
+    api_key = _realtime_api_key()
+    if not api_key:
+        return JsonResponse(
+            {"error": "OPENAI_API_KEY is not configured on the server."}, status=500
+        )
+
+    payload, error = _realtime_session_payload(request.body)
+    if error is not None:
+        return error
+
+    # Hand out a pre-minted session when the pool has one; otherwise mint synchronously
+    pool = get_session_pool()
+    data = pool.take(payload) if pool else None
+    if data is None:
         try:
-            err_body = e.read().decode("utf-8")
-        except Exception:
-            err_body = ""
+            data = get_realtime_client().create_session(payload, api_key=api_key)
+        except Exception as e:
+            return _upstream_error_response(e)
+        if pool:
+            pool.register(payload, api_key)
+    return _realtime_session_response(data)
+
+
+@csrf_exempt
+@transaction.non_atomic_requests
+@require_http_methods(["POST"])
+async def realtime_session_async(request):
+    """
+    Async (ASGI-native) counterpart of realtime_session.
+    The upstream call runs on a non-blocking HTTP client, so a single ASGI worker can
+    hold hundreds of concurrent mints instead of pinning one thread per mint.
+    """
+    api_key = _realtime_api_key()
+    if not api_key:
         return JsonResponse(
-            {"error": "Failed to create session", "details": err_body}, status=e.code
+            {"error": "OPENAI_API_KEY is not configured on the server."}, status=500
         )
-    except Exception as e:
-        return JsonResponse({"error": "Internal server error", "details": str(e)}, status=500)
 
+    # Snapshot/instruction lookups may touch the cache or the database on a cold start
+    payload, error = await sync_to_async(_realtime_session_payload)(request.body)
+    if error is not None:
+        return error
 
+    pool = get_session_pool()
+    data = pool.take(payload) if pool else None
+    if data is None:
+        try:
+            data = await get_async_realtime_client().create_session(payload, api_key=api_key)
+        except Exception as e:
+            return _upstream_error_response(e)
+        if pool:
+            pool.register(payload, api_key)
+    return _realtime_session_response(data)
+
+
+@login_required
 @require_http_methods(["GET"])
+def realtime_pool_metrics(request):
+    """Staff-only JSON metrics for the pre-minted realtime session pool."""
+    if not request.user.is_staff:
+        return JsonResponse({'success': False, 'error': 'Permission denied'}, status=403)
+    pool = get_session_pool()
+    return JsonResponse({'enabled': pool is not None, **(pool.stats() if pool else {})})
+
+
+@require_http_methods(["GET"])
+@revalidate
+@conditional_active_interview_page
 def ai_interview_info(request, pk):
     """
     Information page to collect candidate name and email before live interview.
     Consolidated here to avoid duplicate modules (ai_views.py removed).
     """
-    interview = get_object_or_404(Interview, pk=pk, is_active=True)
+    interview = get_active_snapshot_or_404(pk)
     return render(request, 'interviews/ai_voice_info.html', {'interview': interview})
 
 
 @require_http_methods(["GET"])
+@revalidate
+@conditional_active_interview_page
 def ai_interview_start(request, pk):
     """
     Start the AI conversational interview (live realtime WebRTC page).
     Consolidated here to avoid duplicate modules (ai_views.py removed).
     """
-    interview = get_object_or_404(Interview, pk=pk, is_active=True)
+    interview = get_active_snapshot_or_404(pk)
     # Provide ordered sections with their questions for the live UI (tabs + collected info)
-    sections = interview.sections.all().order_by("order", "id").prefetch_related("questions")
+    sections = interview.sections
+    use_async = getattr(settings, "USE_ASYNC_VIEWS", False)
     return render(
         request,
         'interviews/ai_voice_interview.html',
@@ -513,7 +716,15 @@ def ai_interview_start(request, pk):
             'sections': sections,
             'candidate_name': (request.GET.get('name') or '').strip(),
             'candidate_email': (request.GET.get('email') or '').strip(),
-            'submit_url': reverse('interviews:submit_json', args=[pk]),
+            'session_url': reverse(
+                'interviews:ai_interview_realtime_session_async'
+                if use_async
+                else 'interviews:ai_interview_realtime_session'
+            ),
+            'submit_url': reverse(
+                'interviews:submit_json_async' if use_async else 'interviews:submit_json',
+                args=[pk],
+            ),
             'first_utterance_tpl': first_utterance_template(),
             'verbatim_tpl': verbatim_question_template(),
         },
@@ -540,12 +751,15 @@ def interview_submit_json(request, pk):
     Notes:
     - For multiple_choice questions, each entry in option_values must match one of the question's configured options (by value, not id).
     - Text answers are always accepted; option_values is optional.
-    Persists a Candidate, InterviewResponse (with answers_transcript snapshot), and
-    materializes Answer rows for manageability and reporting.
+    Persists a Candidate and an InterviewResponse; the answers go to the answers_transcript
+    snapshot and/or Answer rows depending on ANSWER_STORAGE.
     """
-    interview = get_object_or_404(Interview, pk=pk, is_active=True)
+    interview = get_active_snapshot_or_404(pk)
+    questions = interview.questions_by_id
 
-    ser = SubmitResponseSerializer(data=request.data, context={"interview": interview})
+    ser = SubmitResponseSerializer(
+        data=request.data, context={"interview": interview, "questions": questions}
+    )
     if not ser.is_valid():
         return Response({"success": False, "errors": ser.errors}, status=400)
     data = ser.validated_data
@@ -553,60 +767,72 @@ def interview_submit_json(request, pk):
     candidate_name = (data.get("candidate_name") or "").strip()
     candidate_email = (data.get("candidate_email") or "").strip().lower()
 
-    candidate, _ = Candidate.objects.get_or_create(
-        email=candidate_email, defaults={"full_name": candidate_name}
-    )
-    if not candidate.full_name and candidate_name:
-        candidate.full_name = candidate_name
-        candidate.save(update_fields=["full_name"])
+    # Normalize/validate answers against the preloaded question map
+    answers_enriched = enrich_answers(data.get("answers"), questions)
+    version_id = publish_interview(interview)
+
+    # Persist the candidate, response snapshot and relational answers in one short transaction
+    with transaction.atomic():
+        candidate = resolve_candidate(candidate_email, candidate_name)
+        response = create_response(
+            interview.id,
+            candidate,
+            answers_enriched,
+            questions,
+            transcript=data.get("transcript") or "",
+            source=data.get("source") or "api",
+            version_id=version_id,
+        )
 
-    # Normalize/validate answers and enrich with labels
-    answers_enriched = []
-    for item in data.get("answers") or []:
-        try:
-            qid = int(item.get("question"))
-        except Exception:
-            continue
-        try:
-            q = Question.objects.get(pk=qid, section__interview=interview)
-        except Question.DoesNotExist:
-            continue
+    receipt_url = reverse('interviews:response_detail', args=[response.id])
+    return Response({"success": True, "response_id": response.id, "receipt_url": receipt_url})
 
-        vals = list(map(str, item.get("option_values") or []))
-        allowed = set(q.options or [])
-        vals = [v for v in vals if v in allowed]
-        answers_enriched.append(
-            {
-                "question": q.id,
-                "question_text": q.question_text,
-                "text": item.get("text") or "",
-                "option_values": vals,
-            }
-        )
 
-    response = InterviewResponse.objects.create(
-        interview=interview,
-        candidate=candidate,
-        answers_transcript={
-            "answers": answers_enriched,
-            "transcript": data.get("transcript") or "",
-            "source": data.get("source") or "api",
-        },
+@csrf_exempt
+@transaction.non_atomic_requests
+@require_http_methods(["POST"])
+async def interview_submit_json_async(request, pk):
+    """
+    Async (ASGI-native) counterpart of interview_submit_json; same payload and response.
+    Candidate resolution (one upsert) and the response + answers insert run in a worker
+    thread, the latter as one short transaction, since the async ORM cannot hold transactions.
+    """
+    interview = await sync_to_async(get_interview_snapshot)(pk)
+    if interview is None or not interview.is_active:
+        raise Http404("No Interview matches the given query.")
+    questions = interview.questions_by_id
+
+    try:
+        body = json.loads(request.body or b"{}")
+    except ValueError:
+        return JsonResponse({"success": False, "errors": "Invalid JSON payload"}, status=400)
+
+    ser = SubmitResponseSerializer(
+        data=body, context={"interview": interview, "questions": questions}
     )
+    if not ser.is_valid():
+        return JsonResponse({"success": False, "errors": ser.errors}, status=400)
+    data = ser.validated_data
 
-    # Materialize relational answers for admin/reporting
-    for item in answers_enriched:
-        try:
-            q = Question.objects.get(pk=item["question"], section__interview=interview)
-        except Question.DoesNotExist:
-            continue
-        ans = Answer.objects.create(response=response, question=q, answer_text=item.get("text", ""))
-        if item.get("option_values"):
-            ans.selected_options = list(item["option_values"])
-            ans.save(update_fields=["selected_options"])
+    candidate_name = (data.get("candidate_name") or "").strip()
+    candidate_email = (data.get("candidate_email") or "").strip().lower()
+
+    candidate = await sync_to_async(resolve_candidate)(candidate_email, candidate_name)
+
+    answers_enriched = enrich_answers(data.get("answers"), questions)
+    version_id = await sync_to_async(publish_interview)(interview)
+    response = await sync_to_async(transaction.atomic(create_response))(
+        interview.id,
+        candidate,
+        answers_enriched,
+        questions,
+        transcript=data.get("transcript") or "",
+        source=data.get("source") or "api",
+        version_id=version_id,
+    )
 
     receipt_url = reverse('interviews:response_detail', args=[response.id])
-    return Response({"success": True, "response_id": response.id, "receipt_url": receipt_url})
+    return JsonResponse({"success": True, "response_id": response.id, "receipt_url": receipt_url})
 
 
 # ---- Friendly error handlers (avoid raw error pages; sensible renders/JSON) ----